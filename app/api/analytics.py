@@ -1,34 +1,112 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from datetime import date
 from typing import List
 from sqlalchemy.orm import Session
+from app.api.conditional import conditional_on
+from app.api.schedule import get_export_service
 from app.db.base import get_db
+from app.repositories.employees import EmployeeRepository
+from app.repositories.rollup import DailyRollupRepository
 from app.repositories.schedule import ShiftRepository
-from app.schemas.analytics import AnalyticsBase
-from app.services.analytics import AnalyticsService
+from app.schemas.analytics import AnalyticsBase, AnalyticsCacheStats, AnalyticsTimeSeriesResponse
+from app.services.analytics import AnalyticsService, analytics_cache
+from app.services.export import EXPORT_MEDIA_TYPES, ExportService
 
 router = APIRouter()
 
 def get_analytics_service(db_session: Session = Depends(get_db)) -> AnalyticsService:
     shift_repo = ShiftRepository(db=db_session)
-    return AnalyticsService(shift_repo=shift_repo)
+    rollup_repo = DailyRollupRepository(db=db_session)
+    employee_repo = EmployeeRepository(db=db_session)
+    return AnalyticsService(shift_repo=shift_repo, rollup_repo=rollup_repo, employee_repo=employee_repo)
 
 #get all employee analytics and analytics by date
-@router.get("", response_model=List[AnalyticsBase])
+@router.get("", response_model=List[AnalyticsBase], dependencies=[Depends(conditional_on("employees", "shifts"))])
 def get_analytics(
     period: str | None = None,
     ref_date: date | None = None,
+    employee_ids: List[int] | None = Query(
+        default=None,
+        description="Only aggregate these employees (repeat the parameter for a team view)",
+    ),
     service: AnalyticsService = Depends(get_analytics_service),
 ):
-    return service.get_employee_analytics(period=period, ref_date=ref_date)
+    return service.get_employee_analytics(
+        period=period,
+        ref_date=ref_date,
+        employee_ids=employee_ids,
+    )
+
+#get a per-employee time series of shifts and hours, bucketed by day, week or month
+@router.get("/timeseries", response_model=AnalyticsTimeSeriesResponse, dependencies=[Depends(conditional_on("employees", "shifts"))])
+def get_analytics_timeseries(
+    start_date: date = Query(..., alias="from", description="Range start (inclusive)"),
+    end_date: date = Query(..., alias="to", description="Range end (inclusive)"),
+    bucket: str = Query(default="week", pattern="^(day|week|month)$"),
+    employee_ids: List[int] | None = Query(
+        default=None,
+        description="Only include these employees",
+    ),
+    service: AnalyticsService = Depends(get_analytics_service),
+):
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="from must not be after to",
+        )
+    return service.get_employee_timeseries(
+        start_date=start_date,
+        end_date=end_date,
+        bucket=bucket,
+        employee_ids=employee_ids,
+    )
+
+#stream per-employee, per-day shifts and hours as NDJSON or CSV
+@router.get("/export", response_class=StreamingResponse)
+def export_analytics(
+    start_date: date = Query(..., alias="from", description="Range start (inclusive)"),
+    end_date: date = Query(..., alias="to", description="Range end (inclusive)"),
+    file_format: str = Query(default="ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    employee_ids: List[int] | None = Query(
+        default=None,
+        description="Only export these employees (repeat the parameter)",
+    ),
+    export_service: ExportService = Depends(get_export_service),
+):
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="from must not be after to",
+        )
+    # Rows are read and sent batch by batch while the response streams
+    chunks = export_service.export_daily_totals(
+        file_format,
+        start_date=start_date,
+        end_date=end_date,
+        employee_ids=employee_ids,
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="analytics.{file_format}"'},
+    )
+
+#get hit/miss counters of the analytics result cache
+@router.get("/cache", response_model=AnalyticsCacheStats)
+def get_analytics_cache_stats():
+    return analytics_cache.stats()
 
 #get employee analytics by employee id
-@router.get("/{employee_id}", response_model=List[AnalyticsBase])
+@router.get("/{employee_id}", response_model=List[AnalyticsBase], dependencies=[Depends(conditional_on("employees", "shifts"))])
 def get_employee_analytics(
     employee_id: int,
     period: str | None = None,
     ref_date: date | None = None,
     service: AnalyticsService = Depends(get_analytics_service),
 ):
-    all_rows = service.get_employee_analytics(period=period, ref_date=ref_date)
-    return [row for row in all_rows if row.employee_id == employee_id]
+    return service.get_employee_analytics(
+        period=period,
+        ref_date=ref_date,
+        employee_ids=[employee_id],
+    )
@@ -0,0 +1,132 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.conditional import CacheValidator, async_conditional_on
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.responses import ORJSONResponse
+from app.db.async_base import get_async_db
+from app.schemas.employees import (
+    EmployeeCreate,
+    EmployeeUpdate,
+    EmployeeResponse,
+    EmployeePage,
+    EmployeePageData,
+)
+from app.services.async_employees import AsyncEmployeeService
+
+
+# async def replacements for the matching routes in app/api/employees.py,
+# swapped in by main.py when DB_MODE=async
+router = APIRouter()
+
+
+def get_async_employee_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncEmployeeService:
+    employee_service: AsyncEmployeeService = AsyncEmployeeService(db_session=db)
+    return employee_service
+
+
+@router.get(
+    "",
+    response_model=EmployeePage,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def list_employees(
+    limit: int = Query(
+        default=DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of employees to return",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="next_cursor value from the previous page",
+    ),
+    validator: CacheValidator = Depends(async_conditional_on("employees")),
+    employee_service: AsyncEmployeeService = Depends(get_async_employee_service),
+) -> ORJSONResponse:
+    # The service returns validated plain dicts; returning the response
+    # directly skips FastAPI's second validation and encoding pass
+    employees: EmployeePageData = await employee_service.list_employees(
+        limit=limit,
+        cursor=cursor,
+    )
+    return ORJSONResponse(employees, headers=validator.headers)
+
+
+@router.get(
+    "/{employee_id}",
+    response_model=EmployeeResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(async_conditional_on("employees"))],
+)
+async def get_employee(
+    employee_id: int,
+    employee_service: AsyncEmployeeService = Depends(get_async_employee_service),
+) -> EmployeeResponse:
+    employee = await employee_service.get_employee(employee_id=employee_id)
+    if employee is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Employee not found",
+        )
+    return employee
+
+
+@router.post(
+    "",
+    response_model=EmployeeResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_employee(
+    employee_in: EmployeeCreate,
+    employee_service: AsyncEmployeeService = Depends(get_async_employee_service),
+) -> EmployeeResponse:
+    created_employee: EmployeeResponse = await employee_service.create_employee(
+        employee_in=employee_in
+    )
+    return created_employee
+
+
+@router.put(
+    "/{employee_id}",
+    response_model=EmployeeResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def update_employee(
+    employee_id: int,
+    employee_in: EmployeeUpdate,
+    employee_service: AsyncEmployeeService = Depends(get_async_employee_service),
+) -> EmployeeResponse:
+    updated_employee = await employee_service.update_employee(
+        employee_id=employee_id,
+        employee_in=employee_in,
+    )
+    if updated_employee is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Employee not found",
+        )
+    return updated_employee
+
+
+@router.delete(
+    "/{employee_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def delete_employee(
+    employee_id: int,
+    employee_service: AsyncEmployeeService = Depends(get_async_employee_service),
+) -> None:
+    deleted: bool = await employee_service.delete_employee(employee_id=employee_id)
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Employee not found",
+        )
+    return JSONResponse({"message": "success"})
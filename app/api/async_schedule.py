@@ -0,0 +1,167 @@
+from datetime import date, datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.conditional import CacheValidator, async_conditional_on
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.responses import ORJSONResponse
+from app.db.async_base import get_async_db
+from app.schemas.schedule import (
+    ShiftCreate,
+    ShiftUpdate,
+    ShiftResponse,
+    ShiftPage,
+    ShiftPageData,
+)
+from app.services.async_schedule import AsyncShiftService
+
+
+# async def replacements for the matching routes in app/api/schedule.py,
+# swapped in by main.py when DB_MODE=async
+router = APIRouter()
+
+
+def get_async_shift_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncShiftService:
+    shift_service: AsyncShiftService = AsyncShiftService(db_session=db)
+    return shift_service
+
+
+@router.get(
+    "",
+    response_model=ShiftPage,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def list_shifts(
+    limit: int = Query(
+        default=DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of shifts to return",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="next_cursor value from the previous page",
+    ),
+    start_date: Optional[date] = Query(
+        default=None,
+        description="Filter by start date (inclusive)",
+    ),
+    end_date: Optional[date] = Query(
+        default=None,
+        description="Filter by end date (inclusive)",
+    ),
+    employee_id: Optional[int] = Query(
+        default=None,
+        description="Filter by employee id",
+    ),
+    start_datetime_from: Optional[datetime] = Query(
+        default=None,
+        description="Filter shifts with start_time >= this value",
+    ),
+    start_datetime_to: Optional[datetime] = Query(
+        default=None,
+        description="Filter shifts with start_time <= this value",
+    ),
+    end_datetime_from: Optional[datetime] = Query(
+        default=None,
+        description="Filter shifts with end_time >= this value",
+    ),
+    end_datetime_to: Optional[datetime] = Query(
+        default=None,
+        description="Filter shifts with end_time <= this value",
+    ),
+    validator: CacheValidator = Depends(async_conditional_on("shifts")),
+    shift_service: AsyncShiftService = Depends(get_async_shift_service),
+) -> ORJSONResponse:
+    # The service returns validated plain dicts; returning the response
+    # directly skips FastAPI's second validation and encoding pass
+    shifts: ShiftPageData = await shift_service.list_shifts(
+        limit=limit,
+        cursor=cursor,
+        start_date=start_date,
+        end_date=end_date,
+        employee_id=employee_id,
+        start_datetime_from=start_datetime_from,
+        start_datetime_to=start_datetime_to,
+        end_datetime_from=end_datetime_from,
+        end_datetime_to=end_datetime_to,
+    )
+    return ORJSONResponse(shifts, headers=validator.headers)
+
+
+@router.get(
+    "/{shift_id}",
+    response_model=ShiftResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(async_conditional_on("shifts"))],
+)
+async def get_shift(
+    shift_id: int,
+    shift_service: AsyncShiftService = Depends(get_async_shift_service),
+) -> ShiftResponse:
+    shift = await shift_service.get_shift(shift_id=shift_id)
+    if shift is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Shift not found",
+        )
+    return shift
+
+
+@router.post(
+    "",
+    response_model=ShiftResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_shift(
+    shift_in: ShiftCreate,
+    shift_service: AsyncShiftService = Depends(get_async_shift_service),
+) -> ShiftResponse:
+    created_shift: ShiftResponse = await shift_service.create_shift(
+        shift_in=shift_in
+    )
+    return created_shift
+
+
+@router.put(
+    "/{shift_id}",
+    response_model=ShiftResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def update_shift(
+    shift_id: int,
+    shift_in: ShiftUpdate,
+    shift_service: AsyncShiftService = Depends(get_async_shift_service),
+) -> ShiftResponse:
+    updated_shift = await shift_service.update_shift(
+        shift_id=shift_id,
+        shift_in=shift_in,
+    )
+    if updated_shift is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Shift not found",
+        )
+    return updated_shift
+
+
+@router.delete(
+    "/{shift_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def delete_shift(
+    shift_id: int,
+    shift_service: AsyncShiftService = Depends(get_async_shift_service),
+) -> None:
+    deleted: bool = await shift_service.delete_shift(shift_id=shift_id)
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Shift not found",
+        )
+    return None
@@ -1,14 +1,23 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
+from app.core.config import EMPLOYEE_IMPORT_BATCH_SIZE
+from app.api.conditional import CacheValidator, conditional_on
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.responses import ORJSONResponse
 from app.db.base import get_db
 from app.schemas.employees import (
     EmployeeCreate,
     EmployeeUpdate,
     EmployeeResponse,
+    EmployeePage,
+    EmployeePageData,
+    EmployeeRow,
+    EmployeeImportResult,
 )
 from app.services.employees import EmployeeService
 
@@ -23,20 +32,119 @@ def get_employee_service(db: Session = Depends(get_db)) -> EmployeeService:
 
 @router.get(
     "",
-    response_model=List[EmployeeResponse],
+    response_model=EmployeePage,
+    response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK,
 )
 def list_employees(
+    limit: int = Query(
+        default=DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of employees to return",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="next_cursor value from the previous page",
+    ),
+    validator: CacheValidator = Depends(conditional_on("employees")),
+    employee_service: EmployeeService = Depends(get_employee_service),
+) -> ORJSONResponse:
+    # The service returns validated plain dicts; returning the response
+    # directly skips FastAPI's second validation and encoding pass
+    employees: EmployeePageData = employee_service.list_employees(
+        limit=limit,
+        cursor=cursor,
+    )
+    return ORJSONResponse(employees, headers=validator.headers)
+
+
+@router.post(
+    "/import",
+    response_model=EmployeeImportResult,
+    status_code=status.HTTP_200_OK,
+)
+def import_employees(
+    file: UploadFile = File(
+        ...,
+        description="CSV with a header row, or NDJSON with one employee per line",
+    ),
+    file_format: Optional[str] = Query(
+        default=None,
+        alias="format",
+        pattern="^(csv|ndjson)$",
+        description="csv or ndjson; inferred from the file name when omitted",
+    ),
+    batch_size: int = Query(
+        default=EMPLOYEE_IMPORT_BATCH_SIZE,
+        ge=1,
+        le=10000,
+        description="Rows inserted per transaction",
+    ),
     employee_service: EmployeeService = Depends(get_employee_service),
-) -> List[EmployeeResponse]:
-    employees: List[EmployeeResponse] = employee_service.list_employees()
-    return employees
+) -> EmployeeImportResult:
+    if file_format is None:
+        file_name: str = (file.filename or "").lower()
+        if file_name.endswith(".csv"):
+            file_format = "csv"
+        elif file_name.endswith((".ndjson", ".jsonl")):
+            file_format = "ndjson"
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot infer file format; pass format=csv or format=ndjson",
+            )
+
+    import_result: EmployeeImportResult = employee_service.import_employees(
+        upload=file.file,
+        file_format=file_format,
+        batch_size=batch_size,
+    )
+    return import_result
+
+
+@router.get(
+    "/available",
+    response_model=List[EmployeeResponse],
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+def list_available_employees(
+    start: datetime = Query(
+        ...,
+        description="Start of the window to cover",
+    ),
+    end: datetime = Query(
+        ...,
+        description="End of the window to cover (exclusive)",
+    ),
+    include_unknown: bool = Query(
+        default=False,
+        description="Also return employees whose availability is empty or could not be parsed",
+    ),
+    validator: CacheValidator = Depends(conditional_on("employees", "shifts")),
+    employee_service: EmployeeService = Depends(get_employee_service),
+) -> ORJSONResponse:
+    # Employees free for the whole window: availability covers it and no
+    # existing shift overlaps it
+    if end <= start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end must be after start",
+        )
+    employees: List[EmployeeRow] = employee_service.find_available_employees(
+        start_time=start,
+        end_time=end,
+        include_unknown=include_unknown,
+    )
+    return ORJSONResponse(employees, headers=validator.headers)
 
 
 @router.get(
     "/{employee_id}",
     response_model=EmployeeResponse,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conditional_on("employees"))],
 )
 def get_employee(
     employee_id: int,
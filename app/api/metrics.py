@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import metrics_registry
+from app.services.shift_events import shift_event_broker
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+#expose request and database metrics for Prometheus to scrape
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics():
+    body = metrics_registry.render_prometheus() + (
+        "# HELP schedule_stream_subscribers Open GET /schedule/stream connections.\n"
+        "# TYPE schedule_stream_subscribers gauge\n"
+        f"schedule_stream_subscribers {shift_event_broker.subscriber_count()}\n"
+    )
+    return PlainTextResponse(body, media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+
+
+def override_routes(router: APIRouter, overrides: APIRouter) -> None:
+    """
+    Replace routes on router with the routes on overrides that have the
+    same path and methods. Replacement happens in place, so route order,
+    and therefore matching precedence, is unchanged.
+    """
+    replacements = {
+        (route.path, frozenset(route.methods)): route
+        for route in overrides.routes
+    }
+    router.routes[:] = [
+        replacements.get((route.path, frozenset(getattr(route, "methods", None) or ())), route)
+        for route in router.routes
+    ]
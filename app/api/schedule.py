@@ -1,16 +1,41 @@
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.api.conditional import CacheValidator, conditional_on
+from app.core.config import (
+    SCHEDULE_COPY_MAX_DAYS,
+    SCHEDULE_GENERATE_MAX_DAYS,
+    SCHEDULE_MAX_WEEKLY_HOURS,
+    SCHEDULE_MIN_REST_HOURS,
+)
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.responses import ORJSONResponse
 from app.db.base import get_db
 from app.schemas.schedule import (
     ShiftCreate,
     ShiftUpdate,
     ShiftResponse,
+    ShiftPage,
+    ShiftPageData,
+    ShiftBulkCreate,
+    ShiftBulkResponse,
+    ShiftCandidates,
+    ShiftCopyRequest,
+    ShiftCopyResult,
+    ScheduleChangeFeed,
+    RosterGenerateRequest,
+    RosterGenerateResponse,
 )
+from app.services.changes import ChangeFeedService
+from app.services.export import EXPORT_MEDIA_TYPES, ExportService
+from app.services.roster import RosterService
 from app.services.schedule import ShiftService
+from app.services.shift_events import ShiftSubscription, stream_shift_events
+from app.services.validation import VALIDATION_MEDIA_TYPE, ScheduleValidationService
 
 
 router = APIRouter()
@@ -23,10 +48,21 @@ def get_shift_service(db: Session = Depends(get_db)) -> ShiftService:
 
 @router.get(
     "",
-    response_model=List[ShiftResponse],
+    response_model=ShiftPage,
+    response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK,
 )
 def list_shifts(
+    limit: int = Query(
+        default=DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of shifts to return",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="next_cursor value from the previous page",
+    ),
     start_date: Optional[date] = Query(
         default=None,
         description="Filter by start date (inclusive)",
@@ -55,9 +91,75 @@ def list_shifts(
         default=None,
         description="Filter shifts with end_time <= this value",
     ),
+    validator: CacheValidator = Depends(conditional_on("shifts")),
     shift_service: ShiftService = Depends(get_shift_service),
-) -> List[ShiftResponse]:
-    shifts: List[ShiftResponse] = shift_service.list_shifts(
+) -> ORJSONResponse:
+    # The service returns validated plain dicts; returning the response
+    # directly skips FastAPI's second validation and encoding pass
+    shifts: ShiftPageData = shift_service.list_shifts(
+        limit=limit,
+        cursor=cursor,
+        start_date=start_date,
+        end_date=end_date,
+        employee_id=employee_id,
+        start_datetime_from=start_datetime_from,
+        start_datetime_to=start_datetime_to,
+        end_datetime_from=end_datetime_from,
+        end_datetime_to=end_datetime_to,
+    )
+    return ORJSONResponse(shifts, headers=validator.headers)
+
+
+def get_export_service() -> ExportService:
+    # opens its own session while the response streams
+    return ExportService()
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+def export_shifts(
+    file_format: str = Query(
+        default="ndjson",
+        alias="format",
+        pattern="^(ndjson|csv)$",
+        description="ndjson (one shift per line) or csv",
+    ),
+    start_date: Optional[date] = Query(
+        default=None,
+        description="Filter by start date (inclusive)",
+    ),
+    end_date: Optional[date] = Query(
+        default=None,
+        description="Filter by end date (inclusive)",
+    ),
+    employee_id: Optional[int] = Query(
+        default=None,
+        description="Filter by employee id",
+    ),
+    start_datetime_from: Optional[datetime] = Query(
+        default=None,
+        description="Filter shifts with start_time >= this value",
+    ),
+    start_datetime_to: Optional[datetime] = Query(
+        default=None,
+        description="Filter shifts with start_time <= this value",
+    ),
+    end_datetime_from: Optional[datetime] = Query(
+        default=None,
+        description="Filter shifts with end_time >= this value",
+    ),
+    end_datetime_to: Optional[datetime] = Query(
+        default=None,
+        description="Filter shifts with end_time <= this value",
+    ),
+    export_service: ExportService = Depends(get_export_service),
+) -> StreamingResponse:
+    # Rows are read and sent batch by batch while the response streams
+    chunks = export_service.export_shifts(
+        file_format,
         start_date=start_date,
         end_date=end_date,
         employee_id=employee_id,
@@ -66,13 +168,179 @@ def list_shifts(
         end_datetime_from=end_datetime_from,
         end_datetime_to=end_datetime_to,
     )
-    return shifts
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="shifts.{file_format}"'},
+    )
+
+
+def get_validation_service() -> ScheduleValidationService:
+    # opens its own session while the response streams
+    return ScheduleValidationService()
+
+
+@router.get(
+    "/validate",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+def validate_schedule(
+    start_date: date = Query(
+        ...,
+        alias="from",
+        description="First shift_date to check",
+    ),
+    end_date: date = Query(
+        ...,
+        alias="to",
+        description="Last shift_date to check (inclusive)",
+    ),
+    employee_id: Optional[int] = Query(
+        default=None,
+        description="Only check this employee",
+    ),
+    min_rest_hours: float = Query(
+        default=SCHEDULE_MIN_REST_HOURS,
+        ge=0,
+        description="Shortest allowed rest between two shifts of an employee",
+    ),
+    max_weekly_hours: float = Query(
+        default=SCHEDULE_MAX_WEEKLY_HOURS,
+        gt=0,
+        description="Most hours an employee may be scheduled Monday to Sunday",
+    ),
+    validation_service: ScheduleValidationService = Depends(get_validation_service),
+) -> StreamingResponse:
+    # One NDJSON line per overlap, short rest or overfull week, then a
+    # summary line; shifts are swept in (employee_id, start_time) order
+    # as they are read, so memory stays flat however many there are
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="to must not be before from",
+        )
+    chunks = validation_service.validate(
+        start_date=start_date,
+        end_date=end_date,
+        employee_id=employee_id,
+        min_rest_hours=min_rest_hours,
+        max_weekly_hours=max_weekly_hours,
+    )
+    return StreamingResponse(chunks, media_type=VALIDATION_MEDIA_TYPE)
+
+
+@router.get(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def stream_shift_changes(
+    start_date: Optional[date] = Query(
+        default=None,
+        description="Only shifts on or after this date",
+    ),
+    end_date: Optional[date] = Query(
+        default=None,
+        description="Only shifts on or before this date",
+    ),
+    employee_id: Optional[int] = Query(
+        default=None,
+        description="Only this employee's shifts",
+    ),
+) -> StreamingResponse:
+    # Server-sent events for committed shift changes in the given range;
+    # async so an idle subscriber holds no threadpool worker
+    subscription = ShiftSubscription(
+        start_date=start_date,
+        end_date=end_date,
+        employee_id=employee_id,
+    )
+    return StreamingResponse(
+        stream_shift_events(subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def get_change_feed_service(db: Session = Depends(get_db)) -> ChangeFeedService:
+    change_feed_service: ChangeFeedService = ChangeFeedService(db_session=db)
+    return change_feed_service
+
+
+@router.get(
+    "/changes",
+    response_model=ScheduleChangeFeed,
+    status_code=status.HTTP_200_OK,
+)
+def list_schedule_changes(
+    since: Optional[str] = Query(
+        default=None,
+        description="next_token from the previous call; omit on first sync",
+    ),
+    limit: int = Query(
+        default=DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of change log entries to read",
+    ),
+    change_feed_service: ChangeFeedService = Depends(get_change_feed_service),
+) -> ScheduleChangeFeed:
+    # Shift and employee upserts and tombstones since the client's token
+    change_feed: ScheduleChangeFeed = change_feed_service.list_changes(
+        since=since,
+        limit=limit,
+    )
+    return change_feed
+
+
+@router.get(
+    "/{shift_id}/candidates",
+    response_model=ShiftCandidates,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conditional_on("employees", "shifts"))],
+)
+def list_shift_candidates(
+    shift_id: int,
+    limit: int = Query(
+        default=10,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Number of candidates to return",
+    ),
+    same_role: bool = Query(
+        default=True,
+        description=(
+            "Only employees with the assigned employee's role; when false, "
+            "other roles are ranked after them"
+        ),
+    ),
+    include_unknown: bool = Query(
+        default=False,
+        description="Also rank employees whose availability is empty or unreadable, after the rest",
+    ),
+    shift_service: ShiftService = Depends(get_shift_service),
+) -> ShiftCandidates:
+    # Who can cover this shift, best first
+    shift_candidates = shift_service.find_replacement_candidates(
+        shift_id=shift_id,
+        limit=limit,
+        same_role=same_role,
+        include_unknown=include_unknown,
+    )
+    if shift_candidates is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Shift not found",
+        )
+    return shift_candidates
 
 
 @router.get(
     "/{shift_id}",
     response_model=ShiftResponse,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conditional_on("shifts"))],
 )
 def get_shift(
     shift_id: int,
@@ -102,6 +370,91 @@ def create_shift(
     return created_shift
 
 
+@router.post(
+    "/bulk",
+    response_model=ShiftBulkResponse,
+    status_code=status.HTTP_200_OK,
+)
+def create_shifts_bulk(
+    bulk_in: ShiftBulkCreate,
+    shift_service: ShiftService = Depends(get_shift_service),
+) -> ShiftBulkResponse:
+    bulk_result: ShiftBulkResponse = shift_service.create_shifts_bulk(
+        shifts_in=bulk_in.items
+    )
+    return bulk_result
+
+
+@router.post(
+    "/copy",
+    response_model=ShiftCopyResult,
+    status_code=status.HTTP_201_CREATED,
+)
+def copy_shifts(
+    copy_in: ShiftCopyRequest,
+    shift_service: ShiftService = Depends(get_shift_service),
+) -> ShiftCopyResult:
+    # Clone the shifts of a date range onto the same days offset_days later
+    if copy_in.end_date < copy_in.start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must not be before start_date",
+        )
+    if (copy_in.end_date - copy_in.start_date).days >= SCHEDULE_COPY_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {SCHEDULE_COPY_MAX_DAYS} days can be copied at once",
+        )
+    if copy_in.offset_days == 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="offset_days must not be 0",
+        )
+    copy_result: ShiftCopyResult = shift_service.copy_shifts(
+        start_date=copy_in.start_date,
+        end_date=copy_in.end_date,
+        offset_days=copy_in.offset_days,
+        employee_ids=copy_in.employee_ids,
+        skip_conflicts=copy_in.skip_conflicts,
+    )
+    return copy_result
+
+
+def get_roster_service(db: Session = Depends(get_db)) -> RosterService:
+    roster_service: RosterService = RosterService(db_session=db)
+    return roster_service
+
+
+@router.post(
+    "/generate",
+    response_model=RosterGenerateResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def generate_roster(
+    roster_in: RosterGenerateRequest,
+    roster_service: RosterService = Depends(get_roster_service),
+) -> RosterGenerateResponse:
+    # Staff the demanded shifts of a date range within the scheduling rules
+    if roster_in.end_date < roster_in.start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must not be before start_date",
+        )
+    if (roster_in.end_date - roster_in.start_date).days >= SCHEDULE_GENERATE_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {SCHEDULE_GENERATE_MAX_DAYS} days can be generated at once",
+        )
+    roster: RosterGenerateResponse = roster_service.generate(
+        start_date=roster_in.start_date,
+        end_date=roster_in.end_date,
+        demand=roster_in.demand,
+        employee_ids=roster_in.employee_ids,
+        include_unknown=roster_in.include_unknown,
+    )
+    return roster
+
+
 @router.put(
     "/{shift_id}",
     response_model=ShiftResponse,
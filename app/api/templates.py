@@ -0,0 +1,146 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.api.conditional import conditional_on
+from app.core.config import TEMPLATE_EXPAND_MAX_DAYS
+from app.db.base import get_db
+from app.schemas.templates import (
+    ShiftTemplateCreate,
+    ShiftTemplateUpdate,
+    ShiftTemplateResponse,
+    TemplateExpandRequest,
+    TemplateExpansionResult,
+)
+from app.services.templates import ShiftTemplateService
+
+
+router = APIRouter()
+
+
+def get_template_service(db: Session = Depends(get_db)) -> ShiftTemplateService:
+    template_service: ShiftTemplateService = ShiftTemplateService(db_session=db)
+    return template_service
+
+
+@router.get(
+    "",
+    response_model=List[ShiftTemplateResponse],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conditional_on("shift_templates"))],
+)
+def list_templates(
+    employee_id: Optional[int] = Query(
+        default=None,
+        description="Only templates of this employee",
+    ),
+    template_service: ShiftTemplateService = Depends(get_template_service),
+) -> List[ShiftTemplateResponse]:
+    templates: List[ShiftTemplateResponse] = template_service.list_templates(
+        employee_id=employee_id
+    )
+    return templates
+
+
+@router.post(
+    "/expand",
+    response_model=TemplateExpansionResult,
+    status_code=status.HTTP_200_OK,
+)
+def expand_templates(
+    expand_in: TemplateExpandRequest,
+    template_service: ShiftTemplateService = Depends(get_template_service),
+) -> TemplateExpansionResult:
+    # Materialise the templates' shifts for a date range; safe to repeat
+    if expand_in.end_date < expand_in.start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must not be before start_date",
+        )
+    if (expand_in.end_date - expand_in.start_date).days >= TEMPLATE_EXPAND_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {TEMPLATE_EXPAND_MAX_DAYS} days can be expanded at once",
+        )
+    expansion: TemplateExpansionResult = template_service.expand_templates(
+        start_date=expand_in.start_date,
+        end_date=expand_in.end_date,
+        template_ids=expand_in.template_ids,
+        employee_ids=expand_in.employee_ids,
+    )
+    return expansion
+
+
+@router.get(
+    "/{template_id}",
+    response_model=ShiftTemplateResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conditional_on("shift_templates"))],
+)
+def get_template(
+    template_id: int,
+    template_service: ShiftTemplateService = Depends(get_template_service),
+) -> ShiftTemplateResponse:
+    template = template_service.get_template(template_id=template_id)
+    if template is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Template not found",
+        )
+    return template
+
+
+@router.post(
+    "",
+    response_model=ShiftTemplateResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_template(
+    template_in: ShiftTemplateCreate,
+    template_service: ShiftTemplateService = Depends(get_template_service),
+) -> ShiftTemplateResponse:
+    created_template: ShiftTemplateResponse = template_service.create_template(
+        template_in=template_in
+    )
+    return created_template
+
+
+@router.put(
+    "/{template_id}",
+    response_model=ShiftTemplateResponse,
+    status_code=status.HTTP_200_OK,
+)
+def update_template(
+    template_id: int,
+    template_in: ShiftTemplateUpdate,
+    template_service: ShiftTemplateService = Depends(get_template_service),
+) -> ShiftTemplateResponse:
+    updated_template = template_service.update_template(
+        template_id=template_id,
+        template_in=template_in,
+    )
+    if updated_template is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Template not found",
+        )
+    return updated_template
+
+
+@router.delete(
+    "/{template_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+def delete_template(
+    template_id: int,
+    template_service: ShiftTemplateService = Depends(get_template_service),
+) -> None:
+    deleted: bool = template_service.delete_template(template_id=template_id)
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Template not found",
+        )
+    return JSONResponse({"message": "success"})
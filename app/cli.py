@@ -0,0 +1,76 @@
+# app/cli.py
+"""
+One-shot maintenance commands.
+
+    python -m app.cli rebuild-rollup
+    python -m app.cli backfill-durations
+    python -m app.cli backfill-availability
+    python -m app.cli compact-changes [--retention-days N]
+"""
+import argparse
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.core.config import CHANGE_LOG_RETENTION_DAYS
+from app.db.base import engine
+from app.db.schema import (
+    backfill_availability_masks,
+    backfill_shift_durations,
+    init_db,
+    rebuild_rollup,
+)
+from app.services.changes import ChangeFeedService
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser(
+        "rebuild-rollup",
+        help="Recompute employee_daily_rollup from the shifts table",
+    )
+    subparsers.add_parser(
+        "backfill-durations",
+        help="Fill shifts.duration_seconds where it is missing",
+    )
+
+    subparsers.add_parser(
+        "backfill-availability",
+        help="Re-parse employees.availability into availability_mask",
+    )
+    compact_parser = subparsers.add_parser(
+        "compact-changes",
+        help="Drop old change_log entries behind GET /schedule/changes",
+    )
+    compact_parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=CHANGE_LOG_RETENTION_DAYS,
+        help="keep entries newer than this many days",
+    )
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    init_db(engine)
+
+    if args.command == "rebuild-rollup":
+        rebuild_rollup(engine)
+    elif args.command == "backfill-durations":
+        backfill_shift_durations(engine)
+    elif args.command == "backfill-availability":
+        backfill_availability_masks(engine)
+    elif args.command == "compact-changes":
+        with Session(bind=engine) as database_session:
+            removed = ChangeFeedService(database_session).compact(
+                retention_days=args.retention_days
+            )
+        logger.info("Removed %d change log entries", removed)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,3 +11,126 @@ load_dotenv(env_path)
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./wasty.db")
 ENV = os.getenv("ENV", "dev")
+
+# "sync" serves every route from the threadpool with blocking sessions;
+# "async" swaps the employee and schedule CRUD routes for async def
+# versions running on an AsyncEngine
+DB_MODE = os.getenv("DB_MODE", "sync")
+
+
+def _to_async_url(url: str) -> str:
+    # pick the async driver for a plain sync URL; explicit drivers are kept
+    scheme, separator, rest = url.partition("://")
+    if "+" in scheme:
+        return url
+    if scheme == "sqlite":
+        return f"sqlite+aiosqlite{separator}{rest}"
+    if scheme in ("postgresql", "postgres"):
+        return f"postgresql+asyncpg{separator}{rest}"
+    return url
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", _to_async_url(DATABASE_URL))
+
+# Keep an in-process, per-employee interval index for shift overlap checks.
+# Only safe when a single process writes shifts.
+SHIFT_INTERVAL_INDEX_ENABLED = (
+    os.getenv("SHIFT_INTERVAL_INDEX_ENABLED", "false").lower() == "true"
+)
+
+# Rows inserted per transaction by POST /employees/import
+EMPLOYEE_IMPORT_BATCH_SIZE = int(os.getenv("EMPLOYEE_IMPORT_BATCH_SIZE", "500"))
+
+# Serve /analytics from the employee_daily_rollup table instead of
+# aggregating the shifts table on every request
+ANALYTICS_USE_ROLLUP = os.getenv("ANALYTICS_USE_ROLLUP", "true").lower() == "true"
+
+# In-process cache in front of /analytics; 0 entries disables it
+ANALYTICS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYTICS_CACHE_MAX_ENTRIES", "1024"))
+ANALYTICS_CACHE_TTL_SECONDS = float(os.getenv("ANALYTICS_CACHE_TTL_SECONDS", "300"))
+
+# Engine tuning profile. "production" runs SQLite in WAL mode so readers
+# don't block behind commits, and sizes the pool for concurrent requests;
+# "baseline" keeps the driver and SQLAlchemy defaults. Every setting can be
+# overridden on its own through the variable named next to it.
+DB_PROFILES = {
+    "baseline": {
+        "journal_mode": None,      # SQLITE_JOURNAL_MODE
+        "synchronous": None,       # SQLITE_SYNCHRONOUS
+        "busy_timeout_ms": None,   # SQLITE_BUSY_TIMEOUT_MS
+        "mmap_size": None,         # SQLITE_MMAP_SIZE (bytes)
+        "cache_size": None,        # SQLITE_CACHE_SIZE (pages, or KiB if negative)
+        "pool_size": 5,            # DB_POOL_SIZE
+        "max_overflow": 10,        # DB_MAX_OVERFLOW
+        "pool_pre_ping": False,    # DB_POOL_PRE_PING
+    },
+    "production": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout_ms": 5000,
+        "mmap_size": 268435456,
+        "cache_size": -65536,
+        "pool_size": 20,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+    },
+}
+
+DB_PROFILE = os.getenv("DB_PROFILE", "production")
+if DB_PROFILE not in DB_PROFILES:
+    raise ValueError(
+        f"Unknown DB_PROFILE {DB_PROFILE!r}; expected one of {', '.join(DB_PROFILES)}"
+    )
+_db_profile = DB_PROFILES[DB_PROFILE]
+
+
+def _optional_int(name: str, default):
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE") or _db_profile["journal_mode"]
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS") or _db_profile["synchronous"]
+SQLITE_BUSY_TIMEOUT_MS = _optional_int("SQLITE_BUSY_TIMEOUT_MS", _db_profile["busy_timeout_ms"])
+SQLITE_MMAP_SIZE = _optional_int("SQLITE_MMAP_SIZE", _db_profile["mmap_size"])
+SQLITE_CACHE_SIZE = _optional_int("SQLITE_CACHE_SIZE", _db_profile["cache_size"])
+DB_POOL_SIZE = _optional_int("DB_POOL_SIZE", _db_profile["pool_size"])
+DB_MAX_OVERFLOW = _optional_int("DB_MAX_OVERFLOW", _db_profile["max_overflow"])
+DB_POOL_PRE_PING = (
+    os.getenv("DB_POOL_PRE_PING", str(_db_profile["pool_pre_ping"])).lower() == "true"
+)
+
+# Logging. Records are handed to a background thread through a queue, so
+# request threads never wait on file or console I/O.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# Emit one JSON object per line instead of the plain text format
+LOG_JSON = os.getenv("LOG_JSON", "false").lower() == "true"
+# Which SQL statements to log: "off", "slow" (at least LOG_SQL_SLOW_MS),
+# "sample" (a LOG_SQL_SAMPLE_RATE fraction, plus every slow one) or "all"
+LOG_SQL_MODE = os.getenv("LOG_SQL_MODE", "slow").lower()
+LOG_SQL_SAMPLE_RATE = float(os.getenv("LOG_SQL_SAMPLE_RATE", "0.01"))
+LOG_SQL_SLOW_MS = float(os.getenv("LOG_SQL_SLOW_MS", "100"))
+
+# Rows fetched per round trip (and written per chunk) by the export endpoints
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+# Change log entries older than this are removed by `python -m app.cli
+# compact-changes`; clients whose sync token is older must reload
+CHANGE_LOG_RETENTION_DAYS = int(os.getenv("CHANGE_LOG_RETENTION_DAYS", "7"))
+
+# GET /schedule/stream: events buffered per subscriber before the oldest
+# are dropped, and seconds between heartbeat comments on an idle stream
+SSE_QUEUE_SIZE = int(os.getenv("SSE_QUEUE_SIZE", "256"))
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+
+# Scheduling rules: weekly hours above which an employee is ranked last as
+# replacement cover and never rostered by POST /schedule/generate, and the
+# shortest rest the generator leaves between two shifts of one employee
+SCHEDULE_MAX_WEEKLY_HOURS = float(os.getenv("SCHEDULE_MAX_WEEKLY_HOURS", "40"))
+SCHEDULE_MIN_REST_HOURS = float(os.getenv("SCHEDULE_MIN_REST_HOURS", "11"))
+# Longest date range POST /schedule/generate accepts in one request
+SCHEDULE_GENERATE_MAX_DAYS = int(os.getenv("SCHEDULE_GENERATE_MAX_DAYS", "62"))
+# Longest source range POST /schedule/copy accepts in one request
+SCHEDULE_COPY_MAX_DAYS = int(os.getenv("SCHEDULE_COPY_MAX_DAYS", "92"))
+# Longest date range POST /templates/expand accepts in one request
+TEMPLATE_EXPAND_MAX_DAYS = int(os.getenv("TEMPLATE_EXPAND_MAX_DAYS", "366"))
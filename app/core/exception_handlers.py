@@ -1,8 +1,8 @@
 import logging
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
-from app.core.exceptions import EmployeeNotFoundError, ShiftConflictError
+from app.core.exceptions import EmployeeNotFoundError, InvalidCursorError, InvalidRecurrenceError, NotModifiedError, ShiftConflictError
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +39,46 @@ async def shift_conflict_handler(
     )
 
 
+async def invalid_cursor_handler(
+    request: Request,
+    exc: InvalidCursorError,
+) -> JSONResponse:
+    logger.info(
+        "InvalidCursorError on %s %s: %s",
+        request.method,
+        request.url,
+        exc.cursor,
+    )
+    return JSONResponse(
+        status_code=400,
+        content={"message": exc.message},
+    )
+
+
+async def invalid_recurrence_handler(
+    request: Request,
+    exc: InvalidRecurrenceError,
+) -> JSONResponse:
+    logger.info(
+        "InvalidRecurrenceError on %s %s: %s",
+        request.method,
+        request.url,
+        exc.message,
+    )
+    return JSONResponse(
+        status_code=400,
+        content={"message": exc.message},
+    )
+
+
+async def not_modified_handler(
+    request: Request,
+    exc: NotModifiedError,
+) -> Response:
+    # 304 carries the validators again but never a body
+    return Response(status_code=304, headers=exc.headers)
+
+
 async def http_exception_handler(
     request: Request,
     exc: HTTPException,
@@ -9,3 +9,24 @@ class ShiftConflictError(Exception):
     def __init__(self, message: str) -> None:
         self.message = message
         super().__init__(self.message)
+
+
+class InvalidCursorError(Exception):
+    def __init__(self, cursor: str) -> None:
+        self.cursor = cursor
+        self.message = "Invalid pagination cursor"
+        super().__init__(self.message)
+
+
+class InvalidRecurrenceError(Exception):
+    def __init__(self, message: str) -> None:
+        self.message = message
+        super().__init__(self.message)
+
+
+class NotModifiedError(Exception):
+    # Raised by conditional GET checks; answered with 304 and no body
+    def __init__(self, headers: dict) -> None:
+        self.headers = headers
+        self.message = "Not Modified"
+        super().__init__(self.message)
@@ -0,0 +1,144 @@
+# app/core/logging_config.py
+import atexit
+import json
+import logging
+import queue
+import random
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import (
+    LOG_JSON,
+    LOG_LEVEL,
+    LOG_SQL_MODE,
+    LOG_SQL_SAMPLE_RATE,
+    LOG_SQL_SLOW_MS,
+)
+
+LOG_DIR = Path("logs")
+LOG_FILE_PATH = LOG_DIR / "wasty_backend.log"
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+SQL_LOG_MODES = ("off", "slow", "sample", "all")
+
+# executemany parameter lists can be huge; keep the log line bounded
+MAX_LOGGED_PARAMETERS_LENGTH = 500
+
+sql_logger = logging.getLogger("wasty_app.sql")
+
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record: timestamp, level, logger, message, plus
+    exception text and any extra fields passed through `extra=`.
+    """
+
+    _standard_attributes = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in self._standard_attributes and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+def configure_logging() -> None:
+    """
+    Route every record through a QueueHandler on the root logger. The file
+    and console handlers run on a QueueListener thread, so the calling
+    thread only pays for putting the record on the queue.
+    Calling it again is a no-op.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    LOG_DIR.mkdir(exist_ok=True)
+    formatter: logging.Formatter = (
+        JsonFormatter() if LOG_JSON else logging.Formatter(LOG_FORMAT)
+    )
+
+    file_handler = RotatingFileHandler(
+        filename=LOG_FILE_PATH,
+        maxBytes=5 * 1024 * 1024,   # 5 MB per file
+        backupCount=3,              # keep 3 old files
+    )
+    file_handler.setFormatter(formatter)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    root_logger = logging.getLogger()
+    root_logger.handlers = [QueueHandler(log_queue)]
+    root_logger.setLevel(LOG_LEVEL)
+
+    # Statements are logged by install_sql_logging, not by SQLAlchemy's echo
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+    logging.getLogger("wasty_app").info("Logging configured: file=%s", LOG_FILE_PATH)
+
+
+def install_sql_logging(target_engine: Engine) -> None:
+    """
+    Time every statement on target_engine and log the ones LOG_SQL_MODE
+    selects, with their duration in ms.
+    """
+    if LOG_SQL_MODE not in SQL_LOG_MODES:
+        raise ValueError(
+            f"Unknown LOG_SQL_MODE {LOG_SQL_MODE!r}; expected one of {', '.join(SQL_LOG_MODES)}"
+        )
+    if LOG_SQL_MODE == "off":
+        return
+
+    @event.listens_for(target_engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(target_engine, "after_cursor_execute")
+    def _log_statement(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+        slow = elapsed_ms >= LOG_SQL_SLOW_MS
+        if LOG_SQL_MODE == "slow" and not slow:
+            return
+        if LOG_SQL_MODE == "sample" and not slow and random.random() >= LOG_SQL_SAMPLE_RATE:
+            return
+
+        logged_parameters = repr(parameters)
+        if len(logged_parameters) > MAX_LOGGED_PARAMETERS_LENGTH:
+            logged_parameters = logged_parameters[:MAX_LOGGED_PARAMETERS_LENGTH] + "..."
+        sql_logger.log(
+            logging.WARNING if slow else logging.INFO,
+            "%.1f ms %s %s",
+            elapsed_ms,
+            statement,
+            logged_parameters,
+            extra={"duration_ms": round(elapsed_ms, 3)},
+        )
+
+    @event.listens_for(target_engine, "handle_error")
+    def _drop_timer(exception_context):
+        # a failed statement never reaches after_cursor_execute
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_start_time"):
+            connection.info["query_start_time"].pop()
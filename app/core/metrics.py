@@ -0,0 +1,238 @@
+# app/core/metrics.py
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Upper bounds in seconds of the request latency histogram buckets
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# Label used for requests that did not match any route (404s, probes),
+# so random paths cannot blow up the number of series
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestDbStats:
+    """Queries run and time spent in the database by one request."""
+
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.seconds = 0.0
+
+
+# Set by MetricsMiddleware for the lifetime of a request. Threadpool workers
+# run with a copy of the request's context, so they update the same object.
+_request_db_stats: ContextVar[Optional[RequestDbStats]] = ContextVar(
+    "request_db_stats", default=None
+)
+
+
+class _RouteSeries:
+    __slots__ = ("bucket_counts", "latency_sum", "count", "db_queries", "db_seconds")
+
+    def __init__(self) -> None:
+        self.bucket_counts: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.count = 0
+        self.db_queries = 0
+        self.db_seconds = 0.0
+
+
+class MetricsRegistry:
+    """
+    Process-wide request metrics keyed by (method, route template).
+    Recording is a dict lookup and a few additions under one lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._routes: Dict[Tuple[str, str], _RouteSeries] = {}
+        self._statuses: Dict[Tuple[str, str, int], int] = {}
+
+    def record(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        seconds: float,
+        db_stats: RequestDbStats,
+    ) -> None:
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            series = self._routes.get((method, route))
+            if series is None:
+                series = self._routes[(method, route)] = _RouteSeries()
+            series.bucket_counts[bucket] += 1
+            series.latency_sum += seconds
+            series.count += 1
+            series.db_queries += db_stats.queries
+            series.db_seconds += db_stats.seconds
+            status_key = (method, route, status_code)
+            self._statuses[status_key] = self._statuses.get(status_key, 0) + 1
+
+    def render_prometheus(self) -> str:
+        """Current values in the Prometheus text exposition format."""
+        with self._lock:
+            routes = {
+                key: (
+                    list(series.bucket_counts),
+                    series.latency_sum,
+                    series.count,
+                    series.db_queries,
+                    series.db_seconds,
+                )
+                for key, series in self._routes.items()
+            }
+            statuses = dict(self._statuses)
+
+        lines = [
+            "# HELP http_requests_total Requests handled, by route and status code.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, status_code), count in sorted(statuses.items()):
+            lines.append(
+                f'http_requests_total{{method="{method}",route="{_escape(route)}",'
+                f'status="{status_code}"}} {count}'
+            )
+
+        lines += [
+            "# HELP http_request_duration_seconds Request latency, by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), (bucket_counts, latency_sum, count, _, _) in sorted(routes.items()):
+            labels = f'method="{method}",route="{_escape(route)}"'
+            cumulative = 0
+            for upper_bound, bucket_count in zip(LATENCY_BUCKETS, bucket_counts):
+                cumulative += bucket_count
+                lines.append(
+                    f'http_request_duration_seconds_bucket{{{labels},le="{upper_bound}"}} {cumulative}'
+                )
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {latency_sum}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {count}")
+
+        lines += [
+            "# HELP db_queries_total SQL statements executed while handling requests, by route.",
+            "# TYPE db_queries_total counter",
+        ]
+        for (method, route), (_, _, _, db_queries, _) in sorted(routes.items()):
+            lines.append(
+                f'db_queries_total{{method="{method}",route="{_escape(route)}"}} {db_queries}'
+            )
+
+        lines += [
+            "# HELP db_query_duration_seconds_total Time spent executing SQL while handling requests, by route.",
+            "# TYPE db_query_duration_seconds_total counter",
+        ]
+        for (method, route), (_, _, _, _, db_seconds) in sorted(routes.items()):
+            lines.append(
+                f'db_query_duration_seconds_total{{method="{method}",route="{_escape(route)}"}} {db_seconds}'
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics_registry = MetricsRegistry()
+
+
+def route_template(scope) -> str:
+    """
+    "/employees/42" -> "/employees/{employee_id}" for a matched request.
+    The router leaves the matched route and its path params in the shared
+    scope; the template is rebuilt from those because an included route's
+    own path does not carry the router prefix.
+    """
+    if scope.get("route") is None:
+        return UNMATCHED_ROUTE
+    param_names = {str(value): name for name, value in scope.get("path_params", {}).items()}
+    return "/".join(
+        f"{{{param_names[segment]}}}" if segment in param_names else segment
+        for segment in scope["path"].split("/")
+    )
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware: times each HTTP request, records it in
+    metrics_registry under its route template, and adds a Server-Timing
+    header with the database and total time spent before the response
+    started.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry = metrics_registry) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        db_stats = RequestDbStats()
+        token = _request_db_stats.set(db_stats)
+        status_code = 500
+
+        async def send_with_timing(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                server_timing = (
+                    f'db;dur={db_stats.seconds * 1000:.1f};desc="{db_stats.queries} queries", '
+                    f"app;dur={elapsed_ms:.1f}"
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_db_stats.reset(token)
+            self.registry.record(
+                method=scope["method"],
+                route=route_template(scope),
+                status_code=status_code,
+                seconds=time.perf_counter() - started,
+                db_stats=db_stats,
+            )
+
+
+def install_query_metrics(target_engine: Engine) -> None:
+    """
+    Count statements and database time against the request that runs them.
+    Statements outside a request (startup, CLI) are not counted.
+    """
+
+    @event.listens_for(target_engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        if _request_db_stats.get() is not None:
+            conn.info.setdefault("metrics_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(target_engine, "after_cursor_execute")
+    def _record_query(conn, cursor, statement, parameters, context, executemany):
+        db_stats = _request_db_stats.get()
+        if db_stats is None or not conn.info.get("metrics_start_time"):
+            return
+        db_stats.queries += 1
+        db_stats.seconds += time.perf_counter() - conn.info["metrics_start_time"].pop()
+
+    @event.listens_for(target_engine, "handle_error")
+    def _drop_timer(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("metrics_start_time"):
+            connection.info["metrics_start_time"].pop()
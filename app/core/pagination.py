@@ -0,0 +1,34 @@
+# app/core/pagination.py
+import base64
+import json
+from typing import Any, List
+
+from app.core.exceptions import InvalidCursorError
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    Encode the sort key of the last row of a page into an opaque token.
+    Values must be JSON serialisable (dates are passed as ISO strings).
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Decode a token produced by encode_cursor.
+    Raise InvalidCursorError if it is malformed or has the wrong shape.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as exc:
+        raise InvalidCursorError(cursor=cursor) from exc
+
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError(cursor=cursor)
+    return values
@@ -1,14 +1,81 @@
 # app/db/base.py
-from typing import Generator
-from sqlalchemy import create_engine
+from typing import Any, Dict, Generator
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import Session, sessionmaker, declarative_base
 
-from app.core.config import DATABASE_URL
+from app.core.config import (
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_SIZE,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_CACHE_SIZE,
+    SQLITE_JOURNAL_MODE,
+    SQLITE_MMAP_SIZE,
+    SQLITE_SYNCHRONOUS,
+)
+
+
+def engine_options(url: str) -> Dict[str, Any]:
+    """
+    Keyword arguments for create_engine / create_async_engine from the
+    configured DB_PROFILE. In-memory SQLite gets a single-connection pool
+    that does not accept sizing, so it only gets pre-ping.
+    """
+    options: Dict[str, Any] = {"pool_pre_ping": DB_POOL_PRE_PING}
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return options
+    options["pool_size"] = DB_POOL_SIZE
+    options["max_overflow"] = DB_MAX_OVERFLOW
+    return options
+
+
+def _sqlite_pragmas():
+    pragmas = []
+    if SQLITE_BUSY_TIMEOUT_MS is not None:
+        # first, so the journal_mode switch itself waits on a locked file
+        pragmas.append(f"PRAGMA busy_timeout={int(SQLITE_BUSY_TIMEOUT_MS)}")
+    if SQLITE_JOURNAL_MODE:
+        pragmas.append(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+    if SQLITE_SYNCHRONOUS:
+        pragmas.append(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+    if SQLITE_MMAP_SIZE is not None:
+        pragmas.append(f"PRAGMA mmap_size={int(SQLITE_MMAP_SIZE)}")
+    if SQLITE_CACHE_SIZE is not None:
+        pragmas.append(f"PRAGMA cache_size={int(SQLITE_CACHE_SIZE)}")
+    return pragmas
+
+
+def install_sqlite_pragmas(target_engine: Engine) -> None:
+    """
+    Run the profile's PRAGMAs on every new DBAPI connection. journal_mode is
+    persisted in the database file; the others are per connection, which is
+    why this hooks "connect" rather than running once at startup.
+    """
+    if target_engine.dialect.name != "sqlite":
+        return
+    pragmas = _sqlite_pragmas()
+    if not pragmas:
+        return
+
+    @event.listens_for(target_engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
 
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {},
+    **engine_options(DATABASE_URL),
 )
+install_sqlite_pragmas(engine)
 
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
@@ -1,10 +1,14 @@
 # app/db/models.py
-from sqlalchemy import Column, DateTime, Integer, String, Text, Date, ForeignKey
+from datetime import timedelta
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String, Text, Date, ForeignKey, Index, Time
 from sqlalchemy.orm import relationship
 from sqlalchemy import Enum as SAEnum
 from app.db.base import Base
 from app.db.enums import ShiftType
 
+# Longest shift accepted; lets overlap checks bound their shift_date range
+MAX_SHIFT_DURATION = timedelta(hours=24)
+
 class EmployeeDB(Base):
     __tablename__ = "employees"
 
@@ -12,16 +16,37 @@ class EmployeeDB(Base):
     name = Column(String, nullable=False)
     role = Column(String, nullable=False)
     availability = Column(Text, nullable=True) #optional so nullable=true
+    # availability parsed into a weekly 15-minute slot bitmask (see
+    # app/services/availability.py); null when the text is empty or unreadable
+    availability_mask = Column(LargeBinary, nullable=True)
 
     shifts = relationship(
         "ShiftDB",
         back_populates="employee",
         cascade="all, delete-orphan",
     )
+    templates = relationship(
+        "ShiftTemplateDB",
+        back_populates="employee",
+        cascade="all, delete-orphan",
+    )
 
 
 class ShiftDB(Base):
     __tablename__ = "shifts"
+    __table_args__ = (
+        # covers the per-employee overlap check done on every shift write
+        Index(
+            "ix_shifts_employee_date_time",
+            "employee_id",
+            "shift_date",
+            "start_time",
+            "end_time",
+        ),
+        # one materialised shift per template occurrence, which is what makes
+        # template expansion idempotent; rows without a template are exempt
+        Index("uq_shifts_template_occurrence", "template_id", "occurrence_date", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False, index=True)
@@ -33,5 +58,99 @@ class ShiftDB(Base):
     note = Column(Text, nullable=True)
     start_time = Column(DateTime, nullable=False)
     end_time = Column(DateTime, nullable=False)
+    # end_time - start_time, stored so aggregations sum a plain integer;
+    # nullable only for rows written before the column existed
+    duration_seconds = Column(Integer, nullable=True)
+    # template the shift was expanded from; null for shifts entered directly
+    # and after the template is deleted
+    template_id = Column(Integer, ForeignKey("shift_templates.id"), nullable=True)
+    # day of the template occurrence the shift was expanded for; written
+    # once by the expansion and never by edits, so moving the shift to
+    # another date keeps it tied to the occurrence it came from
+    occurrence_date = Column(Date, nullable=True)
     employee = relationship("EmployeeDB", back_populates="shifts")
 
+
+class ShiftTemplateDB(Base):
+    __tablename__ = "shift_templates"
+
+    # a shift an employee works on a weekly pattern; POST /templates/expand
+    # turns it into shifts rows
+    id = Column(Integer, primary_key=True, index=True)
+    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False, index=True)
+    shift = Column(
+        SAEnum(ShiftType, name="shift_type_enum"),
+        nullable=False,
+    )
+    note = Column(Text, nullable=True)
+    # local wall-clock times; an end at or before the start is the next day
+    start_time = Column(Time, nullable=False)
+    end_time = Column(Time, nullable=False)
+    duration_seconds = Column(Integer, nullable=False)
+    # bit 0 = Monday ... bit 6 = Sunday
+    weekdays = Column(Integer, nullable=False)
+    # every interval_weeks weeks, counted from the week of valid_from
+    # (anchor_week, in weeks since Monday 1970-01-05)
+    interval_weeks = Column(Integer, nullable=False, default=1)
+    anchor_week = Column(Integer, nullable=False)
+    valid_from = Column(Date, nullable=False)
+    valid_until = Column(Date, nullable=True)
+    employee = relationship("EmployeeDB", back_populates="templates")
+    skips = relationship(
+        "ShiftTemplateSkipDB",
+        cascade="all, delete-orphan",
+    )
+
+
+class ShiftTemplateSkipDB(Base):
+    __tablename__ = "shift_template_skips"
+
+    # an occurrence whose expanded shift was deleted; expansion leaves it
+    # out so a shift removed on purpose does not come back
+    template_id = Column(Integer, ForeignKey("shift_templates.id"), primary_key=True)
+    occurrence_date = Column(Date, primary_key=True)
+
+
+class EmployeeDailyRollupDB(Base):
+    __tablename__ = "employee_daily_rollup"
+
+    # per-employee, per-day totals kept in step with shifts on every write
+    employee_id = Column(Integer, ForeignKey("employees.id"), primary_key=True)
+    day = Column(Date, primary_key=True, index=True)
+    shift_count = Column(Integer, nullable=False, default=0)
+    total_seconds = Column(Integer, nullable=False, default=0)
+
+
+class TableVersionDB(Base):
+    __tablename__ = "table_versions"
+
+    # one row per table; version is bumped in the same transaction as every
+    # write to that table, so (version, updated_at) is a cheap validator for
+    # anything read from it
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
+
+
+class ChangeLogDB(Base):
+    __tablename__ = "change_log"
+    # AUTOINCREMENT so SQLite never hands out a seq again, even after
+    # compaction has emptied the table
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    # one row per write to a synced entity, with an increasing seq; read
+    # by GET /schedule/changes
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    entity = Column(String, nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    op = Column(String, nullable=False)
+    changed_at = Column(DateTime, nullable=False, index=True)
+
+
+class SyncStateDB(Base):
+    __tablename__ = "sync_state"
+
+    # small named counters, e.g. the highest change_log seq removed by
+    # compaction
+    name = Column(String, primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,140 @@
+# app/db/schema.py
+import logging
+
+from typing import List, Tuple
+
+from sqlalchemy import inspect, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.db.models import EmployeeDailyRollupDB, EmployeeDB, ShiftDB
+from app.repositories.employees import EmployeeRepository
+from app.repositories.rollup import DailyRollupRepository
+from app.repositories.schedule import ShiftRepository
+from app.repositories.versions import TableVersionRepository
+from app.services.availability import availability_mask_for
+
+logger = logging.getLogger(__name__)
+
+# indexes an earlier version of a model declared, dropped where they exist
+OBSOLETE_INDEXES: List[Tuple[str, str]] = [
+    # keyed template expansion on shift_date, which edits change
+    ("shifts", "uq_shifts_template_date"),
+]
+
+
+def init_db(engine: Engine) -> None:
+    """
+    Create missing tables, then any column or index declared on a model
+    that an existing table does not have yet. create_all() skips tables
+    that already exist, so later additions would otherwise never be built.
+    Derived columns and tables created for the first time are filled from
+    shifts.
+    """
+    rollup_existed: bool = inspect(engine).has_table(
+        EmployeeDailyRollupDB.__tablename__
+    )
+
+    Base.metadata.create_all(bind=engine)
+
+    added_columns: List[Tuple[str, str]] = add_missing_columns(engine)
+
+    inspector = inspect(engine)
+    for table_name, index_name in OBSOLETE_INDEXES:
+        if not inspector.has_table(table_name):
+            continue
+        if index_name in {index["name"] for index in inspector.get_indexes(table_name)}:
+            logger.info("Dropping obsolete index %s on %s", index_name, table_name)
+            with engine.begin() as connection:
+                connection.execute(text(f"DROP INDEX {index_name}"))
+
+    for table in Base.metadata.sorted_tables:
+        existing_indexes = {
+            index["name"] for index in inspector.get_indexes(table.name)
+        }
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                logger.info("Creating missing index %s on %s", index.name, table.name)
+                index.create(bind=engine)
+
+    if (ShiftDB.__tablename__, "duration_seconds") in added_columns:
+        backfill_shift_durations(engine)
+
+    if (ShiftDB.__tablename__, "occurrence_date") in added_columns:
+        backfill_occurrence_dates(engine)
+
+    if (EmployeeDB.__tablename__, "availability_mask") in added_columns:
+        backfill_availability_masks(engine)
+
+    if not rollup_existed:
+        rebuild_rollup(engine)
+
+    with Session(bind=engine) as database_session:
+        TableVersionRepository(database_session).ensure_rows()
+
+
+def add_missing_columns(engine: Engine) -> List[Tuple[str, str]]:
+    """
+    ALTER TABLE ... ADD COLUMN for nullable model columns missing from an
+    existing table. Returns the (table, column) pairs that were added.
+    """
+    inspector = inspect(engine)
+    added_columns: List[Tuple[str, str]] = []
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            existing_columns = {
+                column["name"] for column in inspector.get_columns(table.name)
+            }
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                if not column.nullable:
+                    raise RuntimeError(
+                        f"Cannot add NOT NULL column {table.name}.{column.name} "
+                        "to an existing table"
+                    )
+                column_type = column.type.compile(dialect=engine.dialect)
+                logger.info("Adding missing column %s.%s", table.name, column.name)
+                connection.execute(
+                    text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}')
+                )
+                added_columns.append((table.name, column.name))
+    return added_columns
+
+
+def backfill_shift_durations(engine: Engine) -> int:
+    logger.info("Backfilling shifts.duration_seconds")
+    with Session(bind=engine) as database_session:
+        updated_count = ShiftRepository(db=database_session).backfill_durations()
+    logger.info("Backfilled duration_seconds on %d shifts", updated_count)
+    return updated_count
+
+
+def backfill_occurrence_dates(engine: Engine) -> int:
+    # shifts expanded before occurrence_date existed were keyed on shift_date
+    logger.info("Backfilling shifts.occurrence_date")
+    with engine.begin() as connection:
+        result = connection.execute(
+            update(ShiftDB)
+            .where(ShiftDB.template_id.is_not(None), ShiftDB.occurrence_date.is_(None))
+            .values(occurrence_date=ShiftDB.shift_date)
+        )
+    logger.info("Backfilled occurrence_date on %d shifts", result.rowcount)
+    return result.rowcount
+
+
+def backfill_availability_masks(engine: Engine) -> int:
+    logger.info("Parsing employees.availability into availability_mask")
+    with Session(bind=engine) as database_session:
+        updated_count = EmployeeRepository(db=database_session).backfill_availability_masks(
+            mask_for=availability_mask_for
+        )
+    logger.info("Updated availability_mask on %d employees", updated_count)
+    return updated_count
+
+
+def rebuild_rollup(engine: Engine) -> None:
+    logger.info("Rebuilding employee_daily_rollup from shifts")
+    with Session(bind=engine) as database_session:
+        DailyRollupRepository(db=database_session).rebuild()
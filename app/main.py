@@ -1,48 +1,24 @@
-import logging
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
 from fastapi import FastAPI, Depends, HTTPException
-from app.core.exception_handlers import employee_not_found_handler, general_exception_handler, http_exception_handler, shift_conflict_handler
-from app.core.exceptions import EmployeeNotFoundError, ShiftConflictError
-from app.db.base import Base, engine
-from app.api import analytics, employees, schedule
+from app.core.exception_handlers import employee_not_found_handler, general_exception_handler, http_exception_handler, invalid_cursor_handler, invalid_recurrence_handler, not_modified_handler, shift_conflict_handler
+from app.core.exceptions import EmployeeNotFoundError, InvalidCursorError, InvalidRecurrenceError, NotModifiedError, ShiftConflictError
+from app.db.base import engine
+from app.db.schema import init_db
+from app.api import analytics, employees, metrics, schedule, templates
+from app.api.routing import override_routes
+from app.core.config import DB_MODE
+from app.core.logging_config import configure_logging, install_sql_logging
+from app.core.metrics import MetricsMiddleware, install_query_metrics
 from fastapi.middleware.cors import CORSMiddleware
 
 
 
-LOG_DIR = Path("logs")
-LOG_DIR.mkdir(exist_ok=True)
-LOG_FILE_PATH = LOG_DIR / "wasty_backend.log"
+configure_logging()
+install_sql_logging(engine)
+install_query_metrics(engine)
 
-log_format = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
 
-file_handler = RotatingFileHandler(
-    filename=LOG_FILE_PATH,
-    maxBytes=5 * 1024 * 1024,   # 5 MB per file
-    backupCount=3,              # keep 3 old files
-)
-
-file_handler.setLevel(logging.INFO)
-file_handler.setFormatter(logging.Formatter(log_format))
-
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
-console_handler.setFormatter(logging.Formatter(log_format))
-
-logging.basicConfig(
-    level=logging.INFO,
-    handlers=[file_handler, console_handler],
-)
-
-logger = logging.getLogger("wasty_app")
-logger.info("Logging configured: file=%s", LOG_FILE_PATH)
-
-sql_logger = logging.getLogger("sqlalchemy.engine")
-sql_logger.setLevel(logging.INFO)
-
-
-# Create DB tables for all models registered on Base
-Base.metadata.create_all(bind=engine)
+# Create DB tables and indexes for all models registered on Base
+init_db(engine)
 
 # Main FastAPI application object
 app = FastAPI(title="Wasty Employee Scheduling API")
@@ -53,14 +29,35 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # let the browser read request timings in devtools
+    expose_headers=["Server-Timing"],
 )
 
+# Per-route request counts, latency histograms and DB time, served at /metrics
+app.add_middleware(MetricsMiddleware)
+
+# In async mode, swap the CRUD routes for their async def versions
+if DB_MODE == "async":
+    from app.api import async_employees, async_schedule
+    from app.db.async_base import async_engine
+
+    install_sql_logging(async_engine.sync_engine)
+    install_query_metrics(async_engine.sync_engine)
+
+    override_routes(employees.router, async_employees.router)
+    override_routes(schedule.router, async_schedule.router)
+
 # Register routers (controllers) with the app
 app.include_router(employees.router, prefix="/employees", tags=["employees"])
 app.include_router(schedule.router, prefix="/schedule", tags=["schedule"])
+app.include_router(templates.router, prefix="/templates", tags=["templates"])
 app.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
+app.include_router(metrics.router, tags=["metrics"])
 # Register exception handlers
 app.add_exception_handler(EmployeeNotFoundError, employee_not_found_handler)
 app.add_exception_handler(ShiftConflictError, shift_conflict_handler)
+app.add_exception_handler(InvalidCursorError, invalid_cursor_handler)
+app.add_exception_handler(InvalidRecurrenceError, invalid_recurrence_handler)
+app.add_exception_handler(NotModifiedError, not_modified_handler)
 app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
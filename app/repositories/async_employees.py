@@ -0,0 +1,42 @@
+# app/repositories/async_employees.py
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import EmployeeDB
+from app.repositories.employees import select_employee_rows
+
+
+class AsyncEmployeeRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # find employees ordered by id, optionally one keyset page at a time
+    async def find_all(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[EmployeeDB]:
+        statement = select(EmployeeDB)
+        if after_id is not None:
+            statement = statement.where(EmployeeDB.id > after_id)
+        statement = statement.order_by(EmployeeDB.id.asc())
+        if limit is not None:
+            statement = statement.limit(limit)
+        result = await self.db.scalars(statement)
+        return list(result.all())
+
+    # same page as find_all, as plain (name, role, availability, id) tuples
+    async def find_all_rows(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Row]:
+        connection = await self.db.connection()
+        result = await connection.execute(select_employee_rows(after_id=after_id, limit=limit))
+        return list(result.all())
+
+    # find employee by id
+    async def find_by_id(self, employee_id: int) -> Optional[EmployeeDB]:
+        return await self.db.get(EmployeeDB, employee_id)
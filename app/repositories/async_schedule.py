@@ -0,0 +1,79 @@
+# app/repositories/async_schedule.py
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import ShiftDB
+from app.repositories.schedule import apply_shift_filters, select_shift_rows
+
+
+class AsyncShiftRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db: AsyncSession = db
+
+    async def find_all(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        employee_id: Optional[int] = None,
+        start_datetime_from: Optional[datetime] = None,
+        start_datetime_to: Optional[datetime] = None,
+        end_datetime_from: Optional[datetime] = None,
+        end_datetime_to: Optional[datetime] = None,
+        after: Optional[Tuple[date, int]] = None,
+        limit: Optional[int] = None,
+    ) -> List[ShiftDB]:
+        statement = apply_shift_filters(
+            select(ShiftDB),
+            start_date=start_date,
+            end_date=end_date,
+            employee_id=employee_id,
+            start_datetime_from=start_datetime_from,
+            start_datetime_to=start_datetime_to,
+            end_datetime_from=end_datetime_from,
+            end_datetime_to=end_datetime_to,
+            after=after,
+        )
+
+        # Same ordering as ShiftRepository.find_all so cursors are shared
+        statement = statement.order_by(
+            ShiftDB.shift_date.asc(),
+            ShiftDB.id.asc(),
+        )
+        if limit is not None:
+            statement = statement.limit(limit)
+
+        result = await self.db.scalars(statement)
+        return list(result.all())
+
+    async def find_all_rows(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        employee_id: Optional[int] = None,
+        start_datetime_from: Optional[datetime] = None,
+        start_datetime_to: Optional[datetime] = None,
+        end_datetime_from: Optional[datetime] = None,
+        end_datetime_to: Optional[datetime] = None,
+        after: Optional[Tuple[date, int]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Row]:
+        statement = select_shift_rows(
+            start_date=start_date,
+            end_date=end_date,
+            employee_id=employee_id,
+            start_datetime_from=start_datetime_from,
+            start_datetime_to=start_datetime_to,
+            end_datetime_from=end_datetime_from,
+            end_datetime_to=end_datetime_to,
+            after=after,
+            limit=limit,
+        )
+        connection = await self.db.connection()
+        result = await connection.execute(statement)
+        return list(result.all())
+
+    async def find_by_id(self, shift_id: int) -> Optional[ShiftDB]:
+        return await self.db.get(ShiftDB, shift_id)
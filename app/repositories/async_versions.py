@@ -0,0 +1,20 @@
+# app/repositories/async_versions.py
+from typing import Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.versions import TableVersions, select_table_versions
+
+
+class AsyncTableVersionRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db: AsyncSession = db
+
+    # current (version, updated_at) of each table; unknown tables read as 0
+    async def get_versions(self, table_names: Iterable[str]) -> TableVersions:
+        table_names = list(table_names)
+        versions: TableVersions = {name: (0, None) for name in table_names}
+        result = await self.db.execute(select_table_versions(table_names))
+        for row in result:
+            versions[row.name] = (row.version, row.updated_at)
+        return versions
@@ -0,0 +1,99 @@
+# app/repositories/changes.py
+from datetime import datetime
+from typing import Iterable, List
+
+from sqlalchemy import DateTime, Select, delete, func, insert, literal, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.db.models import ChangeLogDB, SyncStateDB
+from app.repositories.versions import utcnow
+
+# entity and op values written to change_log
+SHIFT_ENTITY = "shift"
+EMPLOYEE_ENTITY = "employee"
+UPSERT = "upsert"
+DELETE = "delete"
+
+# sync_state row holding the highest seq removed by compaction
+CHANGE_LOG_HORIZON = "change_log_horizon"
+
+CHANGE_LOG_COLUMNS = ["entity", "entity_id", "op", "changed_at"]
+
+
+def record_changes(db: Session, entity: str, entity_ids: Iterable[int], op: str) -> None:
+    """Append one change_log row per id inside the caller's transaction."""
+    changed_at: datetime = utcnow()
+    change_rows = [
+        {"entity": entity, "entity_id": entity_id, "op": op, "changed_at": changed_at}
+        for entity_id in entity_ids
+    ]
+    if change_rows:
+        db.execute(insert(ChangeLogDB), change_rows)
+
+
+def record_changes_for_query(db: Session, entity: str, id_query: Select, op: str) -> None:
+    """
+    Append one change_log row per id selected by id_query (a one-column
+    SELECT) with a single INSERT ... SELECT, inside the caller's
+    transaction; the ids never travel to Python.
+    """
+    id_subquery = id_query.subquery()
+    db.execute(
+        insert(ChangeLogDB).from_select(
+            CHANGE_LOG_COLUMNS,
+            select(
+                literal(entity),
+                id_subquery.c[0],
+                literal(op),
+                literal(utcnow(), DateTime()),
+            ).order_by(id_subquery.c[0]),
+        )
+    )
+
+
+class ChangeLogRepository:
+    def __init__(self, db: Session) -> None:
+        self.db: Session = db
+
+    # entries with seq > after_seq, oldest first
+    def find_since(self, after_seq: int, limit: int) -> List[Row]:
+        return list(
+            self.db.execute(
+                select(
+                    ChangeLogDB.seq,
+                    ChangeLogDB.entity,
+                    ChangeLogDB.entity_id,
+                    ChangeLogDB.op,
+                )
+                .where(ChangeLogDB.seq > after_seq)
+                .order_by(ChangeLogDB.seq)
+                .limit(limit)
+            )
+        )
+
+    # highest seq removed by compaction; tokens below it have missed entries
+    def get_horizon(self) -> int:
+        horizon = self.db.scalar(
+            select(SyncStateDB.value).where(SyncStateDB.name == CHANGE_LOG_HORIZON)
+        )
+        return horizon or 0
+
+    # highest seq written so far, including compacted ones
+    def get_head(self) -> int:
+        head = self.db.scalar(select(func.max(ChangeLogDB.seq)))
+        return max(head or 0, self.get_horizon())
+
+    # delete entries written before cutoff and move the horizon past them;
+    # returns the number of entries removed
+    def compact(self, cutoff: datetime) -> int:
+        new_horizon = self.db.scalar(
+            select(func.max(ChangeLogDB.seq)).where(ChangeLogDB.changed_at < cutoff)
+        )
+        if new_horizon is None or new_horizon <= self.get_horizon():
+            return 0
+
+        result = self.db.execute(delete(ChangeLogDB).where(ChangeLogDB.seq <= new_horizon))
+        self.db.merge(SyncStateDB(name=CHANGE_LOG_HORIZON, value=new_horizon))
+        self.db.commit()
+        return result.rowcount
@@ -1,17 +1,260 @@
 # app/repositories/employees.py
-from typing import List, Optional
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from sqlalchemy import (
+    ColumnElement,
+    Exists,
+    ScalarSelect,
+    Select,
+    bindparam,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
-from app.db.models import EmployeeDB
+from app.db.models import MAX_SHIFT_DURATION, EmployeeDB, ShiftDB
+from app.repositories.changes import (
+    DELETE,
+    EMPLOYEE_ENTITY,
+    SHIFT_ENTITY,
+    UPSERT,
+    record_changes,
+    record_changes_for_query,
+)
+from app.repositories.versions import bump_table_versions
+
+# keep IN (...) lists well below SQLite's bound-parameter limit
+IN_CLAUSE_CHUNK_SIZE = 500
 
 
 class EmployeeRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    # find all employees
-    def find_all(self) -> List[EmployeeDB]:
-        return self.db.query(EmployeeDB).all()
+    # find employees ordered by id, optionally one keyset page at a time
+    def find_all(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[EmployeeDB]:
+        query = self.db.query(EmployeeDB)
+        if after_id is not None:
+            query = query.filter(EmployeeDB.id > after_id)
+        query = query.order_by(EmployeeDB.id.asc())
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    # same page as find_all, as plain (name, role, availability, id) tuples
+    def find_all_rows(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Row]:
+        statement = select_employee_rows(after_id=after_id, limit=limit)
+        return list(self.db.connection().execute(statement).all())
+
+    # (name, role, availability, id) tuples of the employees that still
+    # exist, in one query per chunk of ids
+    def find_rows_by_ids(self, employee_ids: Iterable[int]) -> List[Row]:
+        id_list: List[int] = list(set(employee_ids))
+        rows: List[Row] = []
+        for offset in range(0, len(id_list), IN_CLAUSE_CHUNK_SIZE):
+            chunk = id_list[offset:offset + IN_CLAUSE_CHUNK_SIZE]
+            rows.extend(
+                self.db.connection().execute(
+                    select(*EMPLOYEE_ROW_COLUMNS).where(EmployeeDB.id.in_(chunk))
+                )
+            )
+        return rows
+
+    # (id, role, availability_mask) of the employees with one of roles,
+    # optionally only among employee_ids, ordered by id
+    def find_roster_rows(
+        self,
+        roles: Iterable[str],
+        employee_ids: Optional[Iterable[int]] = None,
+    ) -> List[Row]:
+        query = select(EmployeeDB.id, EmployeeDB.role, EmployeeDB.availability_mask).where(
+            EmployeeDB.role.in_(set(roles))
+        )
+        if employee_ids is None:
+            return list(self.db.connection().execute(query.order_by(EmployeeDB.id)))
+
+        id_list: List[int] = list(set(employee_ids))
+        rows: List[Row] = []
+        for offset in range(0, len(id_list), IN_CLAUSE_CHUNK_SIZE):
+            chunk = id_list[offset:offset + IN_CLAUSE_CHUNK_SIZE]
+            rows.extend(self.db.connection().execute(query.where(EmployeeDB.id.in_(chunk))))
+        rows.sort(key=lambda row: row.id)
+        return rows
+
+    # (id, name) of every employee, or of those of employee_ids that
+    # exist, ordered by id
+    def find_names(self, employee_ids: Optional[Iterable[int]] = None) -> List[Row]:
+        query = select(EmployeeDB.id, EmployeeDB.name)
+        if employee_ids is None:
+            return list(self.db.connection().execute(query.order_by(EmployeeDB.id)))
+
+        id_list: List[int] = list(set(employee_ids))
+        rows: List[Row] = []
+        for offset in range(0, len(id_list), IN_CLAUSE_CHUNK_SIZE):
+            chunk = id_list[offset:offset + IN_CLAUSE_CHUNK_SIZE]
+            rows.extend(self.db.connection().execute(query.where(EmployeeDB.id.in_(chunk))))
+        rows.sort(key=lambda row: row.id)
+        return rows
+
+    # the distinct availability_mask values in use, without null
+    def find_distinct_availability_masks(self) -> List[bytes]:
+        return list(
+            self.db.scalars(
+                select(EmployeeDB.availability_mask)
+                .where(EmployeeDB.availability_mask.is_not(None))
+                .distinct()
+            )
+        )
+
+    # (name, role, availability, id) of employees whose availability_mask
+    # is one of masks (or null, with include_unknown) and who have no
+    # shift overlapping [start_time, end_time), ordered by id
+    def find_available_rows(
+        self,
+        masks: List[bytes],
+        start_time: datetime,
+        end_time: datetime,
+        include_unknown: bool = False,
+    ) -> List[Row]:
+        overlapping_shift = select_overlapping_shift_exists(start_time, end_time)
+
+        mask_chunks = [
+            masks[offset:offset + IN_CLAUSE_CHUNK_SIZE]
+            for offset in range(0, len(masks), IN_CLAUSE_CHUNK_SIZE)
+        ] or [[]]
+        rows: List[Row] = []
+        for position, chunk in enumerate(mask_chunks):
+            mask_condition = _mask_condition(chunk, include_unknown and position == 0)
+            rows.extend(
+                self.db.connection().execute(
+                    select(*EMPLOYEE_ROW_COLUMNS)
+                    .where(mask_condition, ~overlapping_shift)
+                    .order_by(EmployeeDB.id)
+                )
+            )
+        if len(mask_chunks) > 1:
+            rows.sort(key=lambda row: row.id)
+        return rows
+
+    # best cover for [start_time, end_time): free employees whose mask is
+    # in masks (or null, with include_unknown), ranked by role match, then
+    # staying within max_week_seconds, then known availability, then the
+    # fewest seconds already worked (week_seconds, a correlated subquery
+    # on EmployeeDB.id); one query per IN chunk of masks, limit rows each
+    def find_replacement_candidates(
+        self,
+        masks: List[bytes],
+        start_time: datetime,
+        end_time: datetime,
+        week_seconds: ScalarSelect,
+        max_week_seconds: int,
+        limit: int,
+        role: Optional[str] = None,
+        same_role: bool = True,
+        exclude_employee_id: Optional[int] = None,
+        include_unknown: bool = False,
+    ) -> List[Row]:
+        overlapping_shift = select_overlapping_shift_exists(start_time, end_time)
+        week_seconds_column = week_seconds.label("week_seconds")
+        role_match = (
+            (EmployeeDB.role == role) if role is not None else literal(False)
+        ).label("role_match")
+        ranking = (
+            role_match.desc(),
+            (week_seconds_column > max_week_seconds).asc(),
+            EmployeeDB.availability_mask.is_(None).asc(),
+            week_seconds_column.asc(),
+            EmployeeDB.id.asc(),
+        )
+
+        conditions = [~overlapping_shift]
+        if exclude_employee_id is not None:
+            conditions.append(EmployeeDB.id != exclude_employee_id)
+        if same_role and role is not None:
+            conditions.append(EmployeeDB.role == role)
+
+        mask_chunks = [
+            masks[offset:offset + IN_CLAUSE_CHUNK_SIZE]
+            for offset in range(0, len(masks), IN_CLAUSE_CHUNK_SIZE)
+        ] or [[]]
+        rows: List[Row] = []
+        for position, chunk in enumerate(mask_chunks):
+            mask_condition = _mask_condition(chunk, include_unknown and position == 0)
+            rows.extend(
+                self.db.connection().execute(
+                    select(
+                        *EMPLOYEE_ROW_COLUMNS,
+                        role_match,
+                        EmployeeDB.availability_mask.is_not(None).label("availability_known"),
+                        week_seconds_column,
+                    )
+                    .where(mask_condition, *conditions)
+                    .order_by(*ranking)
+                    .limit(limit)
+                )
+            )
+        if len(mask_chunks) > 1:
+            rows.sort(
+                key=lambda row: (
+                    not row.role_match,
+                    row.week_seconds > max_week_seconds,
+                    not row.availability_known,
+                    row.week_seconds,
+                    row.id,
+                )
+            )
+            rows = rows[:limit]
+        return rows
+
+    # recompute availability_mask from availability for every employee,
+    # one committed batch at a time; returns the number of rows changed
+    def backfill_availability_masks(
+        self,
+        mask_for: Callable[[Optional[str]], Optional[bytes]],
+        batch_size: int = 5000,
+    ) -> int:
+        update_statement = (
+            update(EmployeeDB.__table__)
+            .where(EmployeeDB.__table__.c.id == bindparam("employee_id"))
+            .values(availability_mask=bindparam("new_availability_mask"))
+        )
+
+        updated_count: int = 0
+        after_id: int = 0
+        while True:
+            rows = (
+                self.db.query(EmployeeDB.id, EmployeeDB.availability, EmployeeDB.availability_mask)
+                .filter(EmployeeDB.id > after_id)
+                .order_by(EmployeeDB.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                return updated_count
+            after_id = rows[-1].id
+
+            changed_rows = []
+            for row in rows:
+                new_mask = mask_for(row.availability)
+                if new_mask != row.availability_mask:
+                    changed_rows.append({"employee_id": row.id, "new_availability_mask": new_mask})
+            if changed_rows:
+                self.db.execute(update_statement, changed_rows)
+                bump_table_versions(self.db, "employees")
+                self.db.commit()
+                updated_count += len(changed_rows)
 
     # find employee by id
     def find_by_id(self, employee_id: int) -> Optional[EmployeeDB]:
@@ -21,14 +264,102 @@ class EmployeeRepository:
             .first()
         )
 
+    # find which of the given ids exist, in one query per chunk
+    def find_existing_ids(self, employee_ids: Iterable[int]) -> Set[int]:
+        id_list: List[int] = list(set(employee_ids))
+        existing_ids: Set[int] = set()
+        for offset in range(0, len(id_list), IN_CLAUSE_CHUNK_SIZE):
+            chunk = id_list[offset:offset + IN_CLAUSE_CHUNK_SIZE]
+            rows = (
+                self.db.query(EmployeeDB.id)
+                .filter(EmployeeDB.id.in_(chunk))
+                .all()
+            )
+            existing_ids.update(row.id for row in rows)
+        return existing_ids
+
     # save a newly created employee
     def save(self, employee: EmployeeDB) -> EmployeeDB:
         self.db.add(employee)
+        self.db.flush()
+        record_changes(self.db, EMPLOYEE_ENTITY, [employee.id], UPSERT)
+        bump_table_versions(self.db, "employees")
         self.db.commit()
         self.db.refresh(employee)
         return employee
 
-    # delete an employee record from the table
+    # insert a batch of new employees with one executemany and one commit
+    def save_all(self, employee_rows: List[Dict[str, Any]]) -> None:
+        if not employee_rows:
+            return
+        result = self.db.execute(
+            insert(EmployeeDB).returning(EmployeeDB.id, sort_by_parameter_order=True),
+            employee_rows,
+        )
+        record_changes(self.db, EMPLOYEE_ENTITY, result.scalars().all(), UPSERT)
+        bump_table_versions(self.db, "employees")
+        self.db.commit()
+
+    # delete an employee record (and, by cascade, their shifts)
     def delete(self, employee: EmployeeDB) -> None:
+        # tombstones for the cascaded shifts, then for the employee
+        record_changes_for_query(
+            self.db,
+            SHIFT_ENTITY,
+            select(ShiftDB.id).where(ShiftDB.employee_id == employee.id),
+            DELETE,
+        )
+        record_changes(self.db, EMPLOYEE_ENTITY, [employee.id], DELETE)
         self.db.delete(employee)
+        bump_table_versions(self.db, "employees", "shifts", "shift_templates")
         self.db.commit()
+
+
+# Columns of EmployeeRow / EmployeeResponse, in that order
+EMPLOYEE_ROW_COLUMNS = (
+    EmployeeDB.name,
+    EmployeeDB.role,
+    EmployeeDB.availability,
+    EmployeeDB.id,
+)
+EMPLOYEE_ROW_FIELDS = tuple(column.key for column in EMPLOYEE_ROW_COLUMNS)
+
+
+def select_employee_rows(after_id: Optional[int] = None, limit: Optional[int] = None) -> Select:
+    statement = select(*EMPLOYEE_ROW_COLUMNS)
+    if after_id is not None:
+        statement = statement.where(EmployeeDB.id > after_id)
+    statement = statement.order_by(EmployeeDB.id.asc())
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+def select_overlapping_shift_exists(start_time: datetime, end_time: datetime) -> Exists:
+    """
+    EXISTS a shift of EmployeeDB.id's employee overlapping
+    [start_time, end_time): the predicate of
+    ShiftRepository.find_overlapping_shifts_for_employee, correlated so it
+    runs for every employee in one query. Same shift_date bounds, so each
+    probe is a seek into ix_shifts_employee_date_time.
+    """
+    earliest_date: date = (start_time - MAX_SHIFT_DURATION).date() - timedelta(days=1)
+    latest_date: date = end_time.date() + timedelta(days=1)
+    return (
+        select(ShiftDB.id)
+        .where(
+            ShiftDB.employee_id == EmployeeDB.id,
+            ShiftDB.shift_date >= earliest_date,
+            ShiftDB.shift_date <= latest_date,
+            ShiftDB.start_time < end_time,
+            ShiftDB.end_time > start_time,
+        )
+        .exists()
+    )
+
+
+def _mask_condition(masks: List[bytes], include_unknown: bool) -> ColumnElement[bool]:
+    condition = EmployeeDB.availability_mask.in_(masks)
+    if include_unknown:
+        condition = or_(condition, EmployeeDB.availability_mask.is_(None))
+    return condition
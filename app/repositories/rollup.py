@@ -0,0 +1,208 @@
+# app/repositories/rollup.py
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import ColumnElement, ScalarSelect, delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.db.models import EmployeeDailyRollupDB, EmployeeDB, ShiftDB
+
+
+def add_shifts_to_rollup(db: Session, *shift_conditions: ColumnElement[bool]) -> None:
+    """
+    Add the shifts matching shift_conditions to their (employee, day)
+    rows with one INSERT ... SELECT ... ON CONFLICT, inside the caller's
+    transaction; for set-based shift inserts, whose rows never reach
+    Python to be turned into apply_deltas rows.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        upsert = postgresql.insert(EmployeeDailyRollupDB)
+    else:
+        upsert = sqlite.insert(EmployeeDailyRollupDB)
+
+    # the WHERE is also what lets SQLite parse ON CONFLICT after a SELECT
+    aggregate = (
+        select(
+            ShiftDB.employee_id,
+            ShiftDB.shift_date,
+            func.count(ShiftDB.id),
+            func.coalesce(func.sum(ShiftDB.duration_seconds), 0),
+        )
+        .where(*shift_conditions)
+        .group_by(ShiftDB.employee_id, ShiftDB.shift_date)
+    )
+    upsert = upsert.from_select(
+        ["employee_id", "day", "shift_count", "total_seconds"],
+        aggregate,
+    )
+    table = EmployeeDailyRollupDB.__table__
+    db.execute(
+        upsert.on_conflict_do_update(
+            index_elements=[table.c.employee_id, table.c.day],
+            set_={
+                "shift_count": table.c.shift_count + upsert.excluded.shift_count,
+                "total_seconds": table.c.total_seconds + upsert.excluded.total_seconds,
+            },
+        )
+    )
+
+
+class DailyRollupRepository:
+    def __init__(self, db: Session) -> None:
+        self.db: Session = db
+
+    # add shift_count/total_seconds deltas to (employee_id, day) rows,
+    # creating missing rows; runs inside the caller's transaction
+    def apply_deltas(self, delta_rows: List[Dict[str, Any]]) -> None:
+        if not delta_rows:
+            return
+
+        dialect_name: str = self.db.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            upsert = postgresql.insert(EmployeeDailyRollupDB)
+        else:
+            upsert = sqlite.insert(EmployeeDailyRollupDB)
+
+        table = EmployeeDailyRollupDB.__table__
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[table.c.employee_id, table.c.day],
+            set_={
+                "shift_count": table.c.shift_count + upsert.excluded.shift_count,
+                "total_seconds": table.c.total_seconds + upsert.excluded.total_seconds,
+            },
+        )
+        self.db.execute(upsert, delta_rows)
+
+    # drop an employee's rows; runs inside the caller's transaction
+    def delete_for_employee(self, employee_id: int) -> None:
+        self.db.execute(
+            delete(EmployeeDailyRollupDB).where(
+                EmployeeDailyRollupDB.employee_id == employee_id
+            )
+        )
+
+    # recompute rows from the shifts table, for all days or a date range
+    def rebuild(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> None:
+        delete_statement = delete(EmployeeDailyRollupDB)
+        if start_date is not None:
+            delete_statement = delete_statement.where(EmployeeDailyRollupDB.day >= start_date)
+        if end_date is not None:
+            delete_statement = delete_statement.where(EmployeeDailyRollupDB.day <= end_date)
+        self.db.execute(delete_statement)
+
+        aggregate = select(
+            ShiftDB.employee_id,
+            ShiftDB.shift_date,
+            func.count(ShiftDB.id),
+            func.sum(ShiftDB.duration_seconds),
+        )
+        if start_date is not None:
+            aggregate = aggregate.where(ShiftDB.shift_date >= start_date)
+        if end_date is not None:
+            aggregate = aggregate.where(ShiftDB.shift_date <= end_date)
+        aggregate = aggregate.group_by(ShiftDB.employee_id, ShiftDB.shift_date)
+
+        self.db.execute(
+            insert(EmployeeDailyRollupDB).from_select(
+                ["employee_id", "day", "shift_count", "total_seconds"],
+                aggregate,
+            )
+        )
+        self.db.commit()
+
+    # correlated scalar subquery: seconds worked by employee_id_column's
+    # employee over an inclusive date range (0 if none), one seek per row
+    def select_seconds_for_employee(
+        self,
+        employee_id_column,
+        start_date: date,
+        end_date: date,
+    ) -> ScalarSelect:
+        return (
+            select(func.coalesce(func.sum(EmployeeDailyRollupDB.total_seconds), 0))
+            .where(
+                EmployeeDailyRollupDB.employee_id == employee_id_column,
+                EmployeeDailyRollupDB.day >= start_date,
+                EmployeeDailyRollupDB.day <= end_date,
+            )
+            .scalar_subquery()
+        )
+
+    # per-employee totals over an inclusive date range, or all time
+    def get_totals_by_employee(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        employee_ids: Optional[List[int]] = None,
+    ):
+        query = (
+            self.db.query(
+                EmployeeDailyRollupDB.employee_id.label("employee_id"),
+                EmployeeDB.name.label("employee_name"),
+                func.sum(EmployeeDailyRollupDB.shift_count).label("total_shifts"),
+                (func.sum(EmployeeDailyRollupDB.total_seconds) / 3600.0).label("total_hours"),
+            )
+            .join(EmployeeDB, EmployeeDB.id == EmployeeDailyRollupDB.employee_id)
+        )
+        if start_date is not None:
+            query = query.filter(EmployeeDailyRollupDB.day >= start_date)
+        if end_date is not None:
+            query = query.filter(EmployeeDailyRollupDB.day <= end_date)
+        if employee_ids is not None:
+            query = query.filter(EmployeeDailyRollupDB.employee_id.in_(employee_ids))
+
+        return (
+            query.group_by(EmployeeDailyRollupDB.employee_id, EmployeeDB.name)
+            .having(func.sum(EmployeeDailyRollupDB.shift_count) > 0)
+            .all()
+        )
+
+    # per-employee, per-day totals over an inclusive date range
+    def get_daily_totals(
+        self,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[List[int]] = None,
+    ):
+        return self._daily_totals_query(start_date, end_date, employee_ids).all()
+
+    # same rows as get_daily_totals, fetched batch_size at a time
+    def stream_daily_totals(
+        self,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[List[int]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Row]:
+        return iter(self._daily_totals_query(start_date, end_date, employee_ids).yield_per(batch_size))
+
+    def _daily_totals_query(
+        self,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[List[int]] = None,
+    ):
+        query = (
+            self.db.query(
+                EmployeeDailyRollupDB.employee_id.label("employee_id"),
+                EmployeeDB.name.label("employee_name"),
+                EmployeeDailyRollupDB.day.label("day"),
+                EmployeeDailyRollupDB.shift_count.label("total_shifts"),
+                EmployeeDailyRollupDB.total_seconds.label("total_seconds"),
+            )
+            .join(EmployeeDB, EmployeeDB.id == EmployeeDailyRollupDB.employee_id)
+            .filter(
+                EmployeeDailyRollupDB.day >= start_date,
+                EmployeeDailyRollupDB.day <= end_date,
+                EmployeeDailyRollupDB.shift_count > 0,
+            )
+        )
+        if employee_ids is not None:
+            query = query.filter(EmployeeDailyRollupDB.employee_id.in_(employee_ids))
+        return query.order_by(EmployeeDailyRollupDB.employee_id, EmployeeDailyRollupDB.day)
@@ -1,9 +1,32 @@
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 import logging
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from app.db.models import EmployeeDB, ShiftDB
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    Date,
+    DateTime,
+    ScalarSelect,
+    Select,
+    String,
+    and_,
+    bindparam,
+    cast,
+    exists,
+    func,
+    insert,
+    or_,
+    select,
+    type_coerce,
+    update,
+)
+from app.db.models import MAX_SHIFT_DURATION, EmployeeDB, ShiftDB, ShiftTemplateSkipDB
+from app.repositories.employees import IN_CLAUSE_CHUNK_SIZE
+from app.repositories.changes import DELETE, SHIFT_ENTITY, UPSERT, record_changes, record_changes_for_query
+from app.repositories.rollup import add_shifts_to_rollup
+from app.repositories.versions import bump_table_versions
 
 logger = logging.getLogger(__name__)
 class ShiftRepository:
@@ -20,62 +43,163 @@ class ShiftRepository:
         start_datetime_to: Optional[datetime] = None,
         end_datetime_from: Optional[datetime] = None,
         end_datetime_to: Optional[datetime] = None,
+        after: Optional[Tuple[date, int]] = None,
+        limit: Optional[int] = None,
     ) -> List[ShiftDB]:
         # Start with a base query selecting from ShiftDB
         database_session: Session = self.db
         query_for_shifts = database_session.query(ShiftDB)
 
-        # If a start_date filter was provided, apply it
-        if start_date is not None:
-            query_for_shifts = query_for_shifts.filter(
-                ShiftDB.shift_date >= start_date
-            )
+        query_for_shifts = apply_shift_filters(
+            query_for_shifts,
+            start_date=start_date,
+            end_date=end_date,
+            employee_id=employee_id,
+            start_datetime_from=start_datetime_from,
+            start_datetime_to=start_datetime_to,
+            end_datetime_from=end_datetime_from,
+            end_datetime_to=end_datetime_to,
+            after=after,
+        )
 
-        # If an end_date filter was provided, apply it
-        if end_date is not None:
-            query_for_shifts = query_for_shifts.filter(
-                ShiftDB.shift_date <= end_date
-            )
+        # Order the results by date, then id, so the order is stable for paging
+        ordered_query_for_shifts = query_for_shifts.order_by(
+            ShiftDB.shift_date.asc(),
+            ShiftDB.id.asc(),
+        )
 
-        # If an employee_id filter was provided, apply it
-        if employee_id is not None:
-            query_for_shifts = query_for_shifts.filter(
-                ShiftDB.employee_id == employee_id
-            )
+        if limit is not None:
+            ordered_query_for_shifts = ordered_query_for_shifts.limit(limit)
 
-        # Filter shifts whose start_time is >= a given datetime
-        if start_datetime_from is not None:
-            query_for_shifts = query_for_shifts.filter(
-                ShiftDB.start_time >= start_datetime_from
-            )
+        # Execute the query and get the results as a list
+        list_of_shifts: List[ShiftDB] = ordered_query_for_shifts.all()
 
-        # Filter shifts whose start_time is <= a given datetime
-        if start_datetime_to is not None:
-            query_for_shifts = query_for_shifts.filter(
-                ShiftDB.start_time <= start_datetime_to
-            )
+        return list_of_shifts
 
-        # Filter shifts whose end_time is >= a given datetime
-        if end_datetime_from is not None:
-            query_for_shifts = query_for_shifts.filter(
-                ShiftDB.end_time >= end_datetime_from
+    def find_all_rows(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        employee_id: Optional[int] = None,
+        start_datetime_from: Optional[datetime] = None,
+        start_datetime_to: Optional[datetime] = None,
+        end_datetime_from: Optional[datetime] = None,
+        end_datetime_to: Optional[datetime] = None,
+        after: Optional[Tuple[date, int]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Row]:
+        # Same page as find_all, as plain column tuples. Executed on the
+        # session's connection so rows skip the ORM loading layer entirely.
+        statement = select_shift_rows(
+            start_date=start_date,
+            end_date=end_date,
+            employee_id=employee_id,
+            start_datetime_from=start_datetime_from,
+            start_datetime_to=start_datetime_to,
+            end_datetime_from=end_datetime_from,
+            end_datetime_to=end_datetime_to,
+            after=after,
+            limit=limit,
+        )
+        return list(self.db.connection().execute(statement).all())
+
+    def find_rows_by_ids(self, shift_ids: Iterable[int]) -> List[Row]:
+        # SHIFT_ROW_COLUMNS tuples of the shifts that still exist, in one
+        # query per chunk of ids
+        id_list: List[int] = list(set(shift_ids))
+        rows: List[Row] = []
+        for offset in range(0, len(id_list), IN_CLAUSE_CHUNK_SIZE):
+            chunk = id_list[offset:offset + IN_CLAUSE_CHUNK_SIZE]
+            rows.extend(
+                self.db.connection().execute(
+                    select(*SHIFT_ROW_COLUMNS).where(ShiftDB.id.in_(chunk))
+                )
             )
+        return rows
+
+    def find_spans(
+        self,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[Iterable[int]] = None,
+    ) -> List[Row]:
+        # (employee_id, shift_date, shift, start_time, end_time,
+        # duration_seconds) of every shift dated in [start_date, end_date],
+        # optionally only for employee_ids; what the roster generator
+        # plans around
+        query = select(
+            ShiftDB.employee_id,
+            ShiftDB.shift_date,
+            ShiftDB.shift,
+            ShiftDB.start_time,
+            ShiftDB.end_time,
+            ShiftDB.duration_seconds,
+        ).where(ShiftDB.shift_date >= start_date, ShiftDB.shift_date <= end_date)
+        if employee_ids is None:
+            return list(self.db.connection().execute(query))
 
-        # Filter shifts whose end_time is <= a given datetime
-        if end_datetime_to is not None:
-            query_for_shifts = query_for_shifts.filter(
-                ShiftDB.end_time <= end_datetime_to
+        id_list: List[int] = list(set(employee_ids))
+        rows: List[Row] = []
+        for offset in range(0, len(id_list), IN_CLAUSE_CHUNK_SIZE):
+            chunk = id_list[offset:offset + IN_CLAUSE_CHUNK_SIZE]
+            rows.extend(
+                self.db.connection().execute(query.where(ShiftDB.employee_id.in_(chunk)))
             )
+        return rows
 
-        # Order the results by date in ascending order
-        ordered_query_for_shifts = query_for_shifts.order_by(
-            ShiftDB.shift_date.asc()
+    def stream_rows(self, batch_size: int = 1000, **filters: Any) -> Iterator[Row]:
+        """
+        Every row find_all_rows would return for the apply_shift_filters
+        filters, without a limit, fetched batch_size rows at a time through
+        a streaming (server-side where the driver supports it) cursor.
+        """
+        result = (
+            self.db.connection()
+            .execution_options(yield_per=batch_size)
+            .execute(select_shift_rows(**filters))
         )
+        for partition in result.partitions():
+            yield from partition
 
-        # Execute the query and get all results as a list
-        list_of_shifts: List[ShiftDB] = ordered_query_for_shifts.all()
-
-        return list_of_shifts
+    def stream_spans_by_employee(
+        self,
+        start_date: date,
+        end_date: date,
+        employee_id: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Row]:
+        """
+        (id, employee_id, shift_date, start_time, end_time, duration_seconds)
+        of every shift dated in [start_date, end_date], ordered by
+        (employee_id, start_time, id) and fetched batch_size rows at a time.
+        Walking ix_shifts_employee_date_time keeps the employees in order,
+        so the database only sorts one employee's shifts at a time and
+        memory does not grow with the range.
+        """
+        query = (
+            select(
+                ShiftDB.id,
+                ShiftDB.employee_id,
+                ShiftDB.shift_date,
+                ShiftDB.start_time,
+                ShiftDB.end_time,
+                ShiftDB.duration_seconds,
+            )
+            .where(ShiftDB.shift_date >= start_date, ShiftDB.shift_date <= end_date)
+            .order_by(ShiftDB.employee_id, ShiftDB.start_time, ShiftDB.id)
+            # left to itself SQLite reads ix_shifts_shift_date and sorts the
+            # whole range at once
+            .with_hint(ShiftDB, "INDEXED BY ix_shifts_employee_date_time", "sqlite")
+        )
+        if employee_id is not None:
+            query = query.where(ShiftDB.employee_id == employee_id)
+        result = (
+            self.db.connection()
+            .execution_options(yield_per=batch_size)
+            .execute(query)
+        )
+        for partition in result.partitions():
+            yield from partition
 
     def find_by_id(self, shift_id: int) -> Optional[ShiftDB]:
         # Get the current session
@@ -99,6 +223,12 @@ class ShiftRepository:
         shift_instance: ShiftDB = shift
         database_session.add(shift_instance)
 
+        # Flush so a new shift has its id, then log the change and bump
+        # the shifts version in the same transaction as the write
+        database_session.flush()
+        record_changes(database_session, SHIFT_ENTITY, [shift_instance.id], UPSERT)
+        bump_table_versions(database_session, "shifts")
+
         # Commit the transaction so changes are written to the database
         database_session.commit()
 
@@ -108,6 +238,147 @@ class ShiftRepository:
         # Return the managed instance
         return shift_instance
 
+    def save_all(self, shift_rows: List[Dict[str, Any]]) -> List[int]:
+        # Insert every row with one executemany in a single transaction,
+        # without loading ORM instances back
+        if not shift_rows:
+            return []
+
+        database_session: Session = self.db
+        result = database_session.execute(
+            insert(ShiftDB).returning(ShiftDB.id, sort_by_parameter_order=True),
+            shift_rows,
+        )
+        inserted_ids: List[int] = list(result.scalars().all())
+
+        record_changes(database_session, SHIFT_ENTITY, inserted_ids, UPSERT)
+        bump_table_versions(database_session, "shifts")
+        database_session.commit()
+        return inserted_ids
+
+    def find_copy_conflicts(
+        self,
+        start_date: date,
+        end_date: date,
+        offset_days: int,
+        employee_ids: Optional[Iterable[int]] = None,
+    ) -> List[Row]:
+        # (source_id, employee_id, shift_date, start_time, end_time) of every
+        # copy copy_range would make that overlaps a shift already scheduled,
+        # with the copy's dates and times
+        copies = self._shift_copies(start_date, end_date, offset_days, employee_ids)
+        return list(
+            self.db.execute(
+                select(
+                    copies.c.source_id,
+                    copies.c.employee_id,
+                    copies.c.shift_date,
+                    copies.c.start_time,
+                    copies.c.end_time,
+                )
+                .where(overlaps_existing_shift(copies))
+                .order_by(copies.c.shift_date, copies.c.source_id)
+            )
+        )
+
+    def copy_range(
+        self,
+        start_date: date,
+        end_date: date,
+        offset_days: int,
+        employee_ids: Optional[Iterable[int]] = None,
+    ) -> Dict[int, int]:
+        """
+        Copy every shift dated in [start_date, end_date] offset_days later
+        (earlier if negative) with one INSERT ... SELECT, skipping copies
+        that would overlap a shift already scheduled; then, in the same
+        transaction, the change log, the rollup and the table version.
+        The dates are shifted by the database; only the new ids come back
+        to Python. Returns the number of shifts created per employee.
+        """
+        copies = self._shift_copies(start_date, end_date, offset_days, employee_ids)
+        inserted_rows: List[Row] = list(
+            self.db.execute(
+                insert(ShiftDB)
+                .from_select(
+                    list(SHIFT_COPY_COLUMNS),
+                    select(*(copies.c[name] for name in SHIFT_COPY_COLUMNS))
+                    .where(~overlaps_existing_shift(copies))
+                    # per employee, so each index of shifts is walked in
+                    # order rather than hit at random
+                    .order_by(copies.c.employee_id, copies.c.shift_date, copies.c.start_time),
+                )
+                .returning(*INSERTED_SHIFT_COLUMNS)
+            )
+        )
+        created_by_employee: Dict[int, int] = record_inserted_shifts(self.db, inserted_rows)
+        self.db.commit()
+        return created_by_employee
+
+    def _shift_copies(
+        self,
+        start_date: date,
+        end_date: date,
+        offset_days: int,
+        employee_ids: Optional[Iterable[int]],
+    ) -> CTE:
+        # the shifts dated in [start_date, end_date] as they will be after
+        # the copy; copies are entered shifts, not tied to a template
+        dialect_name: str = self.db.get_bind().dialect.name
+        query = select(
+            ShiftDB.id.label("source_id"),
+            ShiftDB.employee_id.label("employee_id"),
+            _add_days(dialect_name, ShiftDB.shift_date, offset_days, Date).label("shift_date"),
+            ShiftDB.shift.label("shift"),
+            ShiftDB.note.label("note"),
+            _add_days(dialect_name, ShiftDB.start_time, offset_days, DateTime).label("start_time"),
+            _add_days(dialect_name, ShiftDB.end_time, offset_days, DateTime).label("end_time"),
+            ShiftDB.duration_seconds.label("duration_seconds"),
+            # shift_date bounds for overlaps_existing_shift, as
+            # find_overlapping_shifts_for_employee derives them
+            _add_days(dialect_name, ShiftDB.start_time, offset_days - 2, Date).label("earliest_date"),
+            _add_days(dialect_name, ShiftDB.end_time, offset_days + 1, Date).label("latest_date"),
+        ).where(ShiftDB.shift_date >= start_date, ShiftDB.shift_date <= end_date)
+        if employee_ids is not None:
+            query = query.where(ShiftDB.employee_id.in_(list(employee_ids)))
+        return query.cte("shift_copies")
+
+    def backfill_durations(self, batch_size: int = 5000) -> int:
+        # Fill duration_seconds for rows written before the column existed,
+        # one committed batch at a time; returns the number of rows updated
+        database_session: Session = self.db
+        update_statement = (
+            update(ShiftDB.__table__)
+            .where(ShiftDB.__table__.c.id == bindparam("shift_id"))
+            .values(duration_seconds=bindparam("new_duration_seconds"))
+        )
+
+        updated_count: int = 0
+        while True:
+            rows = (
+                database_session.query(ShiftDB.id, ShiftDB.start_time, ShiftDB.end_time)
+                .filter(ShiftDB.duration_seconds.is_(None))
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                return updated_count
+
+            database_session.execute(
+                update_statement,
+                [
+                    {
+                        "shift_id": row.id,
+                        "new_duration_seconds": int(
+                            (row.end_time - row.start_time).total_seconds()
+                        ),
+                    }
+                    for row in rows
+                ],
+            )
+            database_session.commit()
+            updated_count += len(rows)
+
     def delete(self, shift: ShiftDB) -> None:
         # Get the current session
         database_session: Session = self.db
@@ -116,21 +387,45 @@ class ShiftRepository:
         shift_instance: ShiftDB = shift
         database_session.delete(shift_instance)
 
+        # A shift expanded from a template leaves a skip record, so
+        # expanding the template again does not bring it back
+        if shift_instance.template_id is not None:
+            database_session.add(
+                ShiftTemplateSkipDB(
+                    template_id=shift_instance.template_id,
+                    occurrence_date=shift_instance.occurrence_date,
+                )
+            )
+
+        # Log a tombstone and bump the shifts version in the same
+        # transaction as the delete
+        record_changes(database_session, SHIFT_ENTITY, [shift_instance.id], DELETE)
+        bump_table_versions(database_session, "shifts")
+
         # Commit the transaction so the row is removed from the database
         database_session.commit()
 
     def find_overlapping_shifts_for_employee(
         self,
         employee_id: int,
-        date_value: date, 
         start_time: datetime,
         end_time: datetime,
         exclude_shift_id: int | None = None,
     ) -> List[ShiftDB]:
         database_session: Session = self.db
+
+        # Bound shift_date so the lookup stays a range scan on
+        # ix_shifts_employee_date_time. The window reaches back one maximum
+        # shift length (plus a day of slack for how shift_date was recorded)
+        # so that shifts starting the day before and running past midnight
+        # are still found.
+        earliest_date: date = (start_time - MAX_SHIFT_DURATION).date() - timedelta(days=1)
+        latest_date: date = end_time.date() + timedelta(days=1)
+
         query_for_shifts = database_session.query(ShiftDB).filter(
             ShiftDB.employee_id == employee_id,
-            ShiftDB.shift_date == date_value,
+            ShiftDB.shift_date >= earliest_date,
+            ShiftDB.shift_date <= latest_date,
             ShiftDB.start_time < end_time,
             ShiftDB.end_time > start_time,
         )
@@ -140,14 +435,73 @@ class ShiftRepository:
 
         overlapping_shifts: List[ShiftDB] = query_for_shifts.all()
         return overlapping_shifts
-    
-    def get_analytics_by_employee_all_time(self):
-        logger.info("inside get_analytics_by_employee_all_time")
-        duration_hours = (
-            (func.strftime('%s', ShiftDB.end_time) - func.strftime('%s', ShiftDB.start_time))
-            / 3600.0
+
+    def find_intervals_for_employees(
+        self,
+        employee_ids: Iterable[int],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> List[Tuple[int, datetime, datetime]]:
+        # Set-based variant of find_overlapping_shifts_for_employee: every
+        # shift of the given employees overlapping [start_time, end_time)
+        earliest_date: date = (start_time - MAX_SHIFT_DURATION).date() - timedelta(days=1)
+        latest_date: date = end_time.date() + timedelta(days=1)
+
+        id_list: List[int] = list(set(employee_ids))
+        intervals: List[Tuple[int, datetime, datetime]] = []
+        for offset in range(0, len(id_list), IN_CLAUSE_CHUNK_SIZE):
+            chunk = id_list[offset:offset + IN_CLAUSE_CHUNK_SIZE]
+            rows = (
+                self.db.query(ShiftDB.employee_id, ShiftDB.start_time, ShiftDB.end_time)
+                .filter(
+                    ShiftDB.employee_id.in_(chunk),
+                    ShiftDB.shift_date >= earliest_date,
+                    ShiftDB.shift_date <= latest_date,
+                    ShiftDB.start_time < end_time,
+                    ShiftDB.end_time > start_time,
+                )
+                .all()
+            )
+            intervals.extend(
+                (row.employee_id, row.start_time, row.end_time) for row in rows
+            )
+        return intervals
+
+    def find_intervals_for_employee(
+        self,
+        employee_id: int,
+    ) -> List[Tuple[datetime, datetime, int]]:
+        # Only the columns the in-process interval index needs
+        rows = (
+            self.db.query(ShiftDB.start_time, ShiftDB.end_time, ShiftDB.id)
+            .filter(ShiftDB.employee_id == employee_id)
+            .all()
         )
+        return [(row.start_time, row.end_time, row.id) for row in rows]
+    
+    def select_seconds_for_employee(
+        self,
+        employee_id_column,
+        start_date: date,
+        end_date: date,
+    ) -> ScalarSelect:
+        # Correlated scalar subquery: seconds worked by employee_id_column's
+        # employee over an inclusive date range (0 if none); the rollup
+        # repository has the same method over pre-aggregated days
         return (
+            select(func.coalesce(func.sum(ShiftDB.duration_seconds), 0))
+            .where(
+                ShiftDB.employee_id == employee_id_column,
+                ShiftDB.shift_date >= start_date,
+                ShiftDB.shift_date <= end_date,
+            )
+            .scalar_subquery()
+        )
+
+    def get_analytics_by_employee_all_time(self, employee_ids: Optional[List[int]] = None):
+        logger.info("inside get_analytics_by_employee_all_time")
+        duration_hours = ShiftDB.duration_seconds / 3600.0
+        query = (
             self.db.query(
                 ShiftDB.employee_id.label("employee_id"),
                 EmployeeDB.name.label("employee_name"),
@@ -155,14 +509,13 @@ class ShiftRepository:
                 func.sum(duration_hours).label("total_hours"),
             )
             .join(EmployeeDB, EmployeeDB.id == ShiftDB.employee_id)
-            .group_by(ShiftDB.employee_id, EmployeeDB.name)
-            .all()
         )
+        if employee_ids is not None:
+            query = query.filter(ShiftDB.employee_id.in_(employee_ids))
+        return query.group_by(ShiftDB.employee_id, EmployeeDB.name).all()
 
-    def get_analytics_by_employee(self, start_date, end_date):
-        duration_hours = (
-            (func.strftime('%s', ShiftDB.end_time) - func.strftime('%s', ShiftDB.start_time)) / 3600.0
-        )
+    def get_analytics_by_employee(self, start_date, end_date, employee_ids: Optional[List[int]] = None):
+        duration_hours = ShiftDB.duration_seconds / 3600.0
         session = self.db
         query = (
         session.query(
@@ -176,6 +529,217 @@ class ShiftRepository:
             ShiftDB.shift_date >= start_date,
             ShiftDB.shift_date <= end_date,
         )
-        .group_by(ShiftDB.employee_id, EmployeeDB.name)
     )
-        return query.all()
\ No newline at end of file
+        if employee_ids is not None:
+            query = query.filter(ShiftDB.employee_id.in_(employee_ids))
+        return query.group_by(ShiftDB.employee_id, EmployeeDB.name).all()
+
+    def get_daily_totals_by_employee(self, start_date, end_date, employee_ids: Optional[List[int]] = None):
+        return self._daily_totals_query(start_date, end_date, employee_ids).all()
+
+    def stream_daily_totals_by_employee(
+        self,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[List[int]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Row]:
+        # Same rows as get_daily_totals_by_employee, fetched batch_size at a time
+        return iter(self._daily_totals_query(start_date, end_date, employee_ids).yield_per(batch_size))
+
+    def _daily_totals_query(self, start_date, end_date, employee_ids: Optional[List[int]] = None):
+        query = (
+            self.db.query(
+                ShiftDB.employee_id.label("employee_id"),
+                EmployeeDB.name.label("employee_name"),
+                ShiftDB.shift_date.label("day"),
+                func.count(ShiftDB.id).label("total_shifts"),
+                func.sum(ShiftDB.duration_seconds).label("total_seconds"),
+            )
+            .join(EmployeeDB, EmployeeDB.id == ShiftDB.employee_id)
+            .filter(
+                ShiftDB.shift_date >= start_date,
+                ShiftDB.shift_date <= end_date,
+            )
+        )
+        if employee_ids is not None:
+            query = query.filter(ShiftDB.employee_id.in_(employee_ids))
+        return (
+            query.group_by(ShiftDB.employee_id, EmployeeDB.name, ShiftDB.shift_date)
+            .order_by(ShiftDB.employee_id, ShiftDB.shift_date)
+        )
+
+
+def apply_shift_filters(
+    query_for_shifts,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    employee_id: Optional[int] = None,
+    start_datetime_from: Optional[datetime] = None,
+    start_datetime_to: Optional[datetime] = None,
+    end_datetime_from: Optional[datetime] = None,
+    end_datetime_to: Optional[datetime] = None,
+    after: Optional[Tuple[date, int]] = None,
+):
+    """
+    Apply the GET /schedule filters to a Query or select() over ShiftDB.
+    Shared by the sync and async repositories.
+    """
+    # If a start_date filter was provided, apply it
+    if start_date is not None:
+        query_for_shifts = query_for_shifts.filter(
+            ShiftDB.shift_date >= start_date
+        )
+
+    # If an end_date filter was provided, apply it
+    if end_date is not None:
+        query_for_shifts = query_for_shifts.filter(
+            ShiftDB.shift_date <= end_date
+        )
+
+    # If an employee_id filter was provided, apply it
+    if employee_id is not None:
+        query_for_shifts = query_for_shifts.filter(
+            ShiftDB.employee_id == employee_id
+        )
+
+    # Filter shifts whose start_time is >= a given datetime
+    if start_datetime_from is not None:
+        query_for_shifts = query_for_shifts.filter(
+            ShiftDB.start_time >= start_datetime_from
+        )
+
+    # Filter shifts whose start_time is <= a given datetime
+    if start_datetime_to is not None:
+        query_for_shifts = query_for_shifts.filter(
+            ShiftDB.start_time <= start_datetime_to
+        )
+
+    # Filter shifts whose end_time is >= a given datetime
+    if end_datetime_from is not None:
+        query_for_shifts = query_for_shifts.filter(
+            ShiftDB.end_time >= end_datetime_from
+        )
+
+    # Filter shifts whose end_time is <= a given datetime
+    if end_datetime_to is not None:
+        query_for_shifts = query_for_shifts.filter(
+            ShiftDB.end_time <= end_datetime_to
+        )
+
+    # Keyset pagination: continue strictly after the (shift_date, id)
+    # of the last row of the previous page
+    if after is not None:
+        after_date, after_id = after
+        query_for_shifts = query_for_shifts.filter(
+            or_(
+                ShiftDB.shift_date > after_date,
+                and_(ShiftDB.shift_date == after_date, ShiftDB.id > after_id),
+            )
+        )
+
+    return query_for_shifts
+
+
+# columns of the shifts rows copy_range inserts, in from_select order
+SHIFT_COPY_COLUMNS = (
+    "employee_id",
+    "shift_date",
+    "shift",
+    "note",
+    "start_time",
+    "end_time",
+    "duration_seconds",
+)
+
+
+def overlaps_existing_shift(rows: CTE) -> ColumnElement[bool]:
+    """
+    EXISTS a shift overlapping the row of rows: the predicate of
+    find_overlapping_shifts_for_employee, correlated so every row of a
+    set-based insert is checked in the same statement. rows needs
+    employee_id, start_time, end_time and the earliest_date/latest_date
+    shift_date bounds that keep each probe a seek into
+    ix_shifts_employee_date_time.
+    """
+    return exists().where(
+        ShiftDB.employee_id == rows.c.employee_id,
+        ShiftDB.shift_date >= rows.c.earliest_date,
+        ShiftDB.shift_date <= rows.c.latest_date,
+        ShiftDB.start_time < rows.c.end_time,
+        ShiftDB.end_time > rows.c.start_time,
+    )
+
+
+# columns an INSERT ... SELECT of shifts returns for record_inserted_shifts
+INSERTED_SHIFT_COLUMNS = (ShiftDB.id, ShiftDB.employee_id)
+
+# ids per statement when record_inserted_shifts reads the inserted rows
+# back; well below SQLite's 32766 bound parameters
+INSERTED_ID_CHUNK_SIZE = 10000
+
+
+def record_inserted_shifts(db: Session, inserted_rows: List[Row]) -> Dict[int, int]:
+    """
+    Change log, rollup and table version for the rows a set-based insert
+    returned (INSERTED_SHIFT_COLUMNS), inside the caller's transaction.
+    Only the returned ids are selected back, so a shift another transaction
+    commits meanwhile is never logged or added to the rollup as ours, while
+    both writes stay INSERT ... SELECT. Returns the number of shifts
+    created per employee.
+    """
+    created_by_employee: Dict[int, int] = {}
+    if not inserted_rows:
+        return created_by_employee
+    for inserted_row in inserted_rows:
+        created_by_employee[inserted_row.employee_id] = (
+            created_by_employee.get(inserted_row.employee_id, 0) + 1
+        )
+
+    inserted_ids: List[int] = sorted(inserted_row.id for inserted_row in inserted_rows)
+    for offset in range(0, len(inserted_ids), INSERTED_ID_CHUNK_SIZE):
+        chunk_condition = ShiftDB.id.in_(inserted_ids[offset:offset + INSERTED_ID_CHUNK_SIZE])
+        record_changes_for_query(db, SHIFT_ENTITY, select(ShiftDB.id).where(chunk_condition), UPSERT)
+        add_shifts_to_rollup(db, chunk_condition)
+    bump_table_versions(db, "shifts")
+    return created_by_employee
+
+
+def _add_days(dialect_name: str, column, days: int, result_type) -> ColumnElement:
+    # column (a Date or DateTime) moved by whole days, as result_type; on
+    # SQLite both are text, so date()/datetime() do the calendar arithmetic
+    # and the microseconds datetime() drops are appended back
+    if dialect_name == "postgresql":
+        return cast(column + timedelta(days=days), result_type)
+    modifier: str = f"{days:+d} days"
+    if result_type is Date:
+        return type_coerce(func.date(column, modifier), Date)
+    return type_coerce(
+        type_coerce(func.datetime(column, modifier), String) + func.substr(column, 20),
+        DateTime,
+    )
+
+
+# Columns of ShiftRow / ShiftResponse, in that order
+SHIFT_ROW_COLUMNS = (
+    ShiftDB.employee_id,
+    ShiftDB.shift_date,
+    ShiftDB.shift,
+    ShiftDB.note,
+    ShiftDB.start_time,
+    ShiftDB.end_time,
+    ShiftDB.id,
+)
+SHIFT_ROW_FIELDS = tuple(column.key for column in SHIFT_ROW_COLUMNS)
+
+
+def select_shift_rows(limit: Optional[int] = None, **filters: Any) -> Select:
+    """
+    select() of SHIFT_ROW_COLUMNS with the apply_shift_filters filters,
+    ordered by (shift_date, id) like find_all so cursors are shared.
+    """
+    statement = apply_shift_filters(select(*SHIFT_ROW_COLUMNS), **filters)
+    statement = statement.order_by(ShiftDB.shift_date.asc(), ShiftDB.id.asc())
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
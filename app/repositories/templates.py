@@ -0,0 +1,243 @@
+# app/repositories/templates.py
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import (
+    ColumnElement,
+    CTE,
+    Date,
+    DateTime,
+    Integer,
+    String,
+    and_,
+    case,
+    column,
+    exists,
+    insert,
+    or_,
+    select,
+    type_coerce,
+    update,
+    values,
+)
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.db.models import ShiftDB, ShiftTemplateDB, ShiftTemplateSkipDB
+from app.repositories.schedule import INSERTED_SHIFT_COLUMNS, overlaps_existing_shift, record_inserted_shifts
+from app.repositories.versions import bump_table_versions
+
+# week 0 of ShiftTemplateDB.anchor_week
+EPOCH_MONDAY = date(1970, 1, 5)
+
+# columns of the shifts rows an expansion inserts, in from_select order
+EXPANSION_COLUMNS = (
+    "employee_id",
+    "shift_date",
+    "shift",
+    "note",
+    "start_time",
+    "end_time",
+    "duration_seconds",
+    "template_id",
+    "occurrence_date",
+)
+
+
+def week_number(day: date) -> int:
+    return (day - EPOCH_MONDAY).days // 7
+
+
+class ShiftTemplateRepository:
+    def __init__(self, db: Session) -> None:
+        self.db: Session = db
+
+    # templates ordered by id, optionally of one employee
+    def find_all(self, employee_id: Optional[int] = None) -> List[ShiftTemplateDB]:
+        query = self.db.query(ShiftTemplateDB)
+        if employee_id is not None:
+            query = query.filter(ShiftTemplateDB.employee_id == employee_id)
+        return query.order_by(ShiftTemplateDB.id.asc()).all()
+
+    def find_by_id(self, template_id: int) -> Optional[ShiftTemplateDB]:
+        return self.db.get(ShiftTemplateDB, template_id)
+
+    def save(self, template: ShiftTemplateDB) -> ShiftTemplateDB:
+        self.db.add(template)
+        bump_table_versions(self.db, "shift_templates")
+        self.db.commit()
+        self.db.refresh(template)
+        return template
+
+    def delete(self, template: ShiftTemplateDB) -> None:
+        # shifts already expanded stay, no longer tied to the template
+        self.db.execute(
+            update(ShiftDB)
+            .where(ShiftDB.template_id == template.id)
+            .values(template_id=None, occurrence_date=None)
+        )
+        self.db.delete(template)
+        bump_table_versions(self.db, "shift_templates")
+        self.db.commit()
+
+    # occurrences in the range with no shift expanded from them; right
+    # after expand() these are the ones an existing shift overlapped
+    def find_unexpanded(
+        self,
+        start_date: date,
+        end_date: date,
+        template_ids: Optional[Iterable[int]] = None,
+        employee_ids: Optional[Iterable[int]] = None,
+    ) -> List[Row]:
+        occurrences = self._occurrences(start_date, end_date, template_ids, employee_ids)
+        return list(
+            self.db.execute(
+                select(
+                    occurrences.c.template_id,
+                    occurrences.c.employee_id,
+                    occurrences.c.shift_date,
+                    occurrences.c.start_time,
+                    occurrences.c.end_time,
+                )
+                .where(~_already_expanded(occurrences))
+                .order_by(occurrences.c.shift_date, occurrences.c.template_id)
+            )
+        )
+
+    def expand(
+        self,
+        start_date: date,
+        end_date: date,
+        template_ids: Optional[Iterable[int]] = None,
+        employee_ids: Optional[Iterable[int]] = None,
+    ) -> Dict[int, int]:
+        """
+        Insert a shift for every occurrence in [start_date, end_date] not
+        expanded yet and free of overlaps, with one INSERT ... SELECT;
+        then, still in the same transaction, the change log, the rollup
+        and the table version for the rows it returned. Returns the number
+        of shifts created per employee.
+        """
+        occurrences = self._occurrences(start_date, end_date, template_ids, employee_ids)
+        inserted_rows: List[Row] = list(
+            self.db.execute(
+                insert(ShiftDB)
+                .from_select(
+                    list(EXPANSION_COLUMNS),
+                    select(*(occurrences.c[name] for name in EXPANSION_COLUMNS))
+                    .where(~_already_expanded(occurrences), ~overlaps_existing_shift(occurrences))
+                    .order_by(occurrences.c.shift_date, occurrences.c.start_time, occurrences.c.template_id),
+                )
+                .returning(*INSERTED_SHIFT_COLUMNS)
+            )
+        )
+        created_by_employee: Dict[int, int] = record_inserted_shifts(self.db, inserted_rows)
+        self.db.commit()
+        return created_by_employee
+
+    def _occurrences(
+        self,
+        start_date: date,
+        end_date: date,
+        template_ids: Optional[Iterable[int]],
+        employee_ids: Optional[Iterable[int]],
+    ) -> CTE:
+        """
+        One row per (template, day) the template falls on in the range,
+        with the shifts row it expands to. The days come from a VALUES
+        list, so the weekday and week arithmetic happens in Python and the
+        database only joins and compares integers.
+        """
+        day_rows = []
+        day = start_date
+        while day <= end_date:
+            day_rows.append(
+                (
+                    day,
+                    day + timedelta(days=1),
+                    1 << day.weekday(),
+                    week_number(day),
+                    # shift_date bounds for overlaps_existing_shift
+                    day - timedelta(days=2),
+                    day + timedelta(days=2),
+                )
+            )
+            day += timedelta(days=1)
+        days = values(
+            column("day", Date),
+            column("next_day", Date),
+            column("weekday_bit", Integer),
+            column("week_number", Integer),
+            column("earliest_date", Date),
+            column("latest_date", Date),
+            name="expansion_days",
+        ).data(day_rows).cte("expansion_days")
+
+        dialect_name: str = self.db.get_bind().dialect.name
+        start_time = _combine(dialect_name, days.c.day, ShiftTemplateDB.start_time)
+        end_time = case(
+            (
+                ShiftTemplateDB.end_time > ShiftTemplateDB.start_time,
+                _combine(dialect_name, days.c.day, ShiftTemplateDB.end_time),
+            ),
+            else_=_combine(dialect_name, days.c.next_day, ShiftTemplateDB.end_time),
+        )
+
+        query = (
+            select(
+                ShiftTemplateDB.employee_id.label("employee_id"),
+                days.c.day.label("shift_date"),
+                ShiftTemplateDB.shift.label("shift"),
+                ShiftTemplateDB.note.label("note"),
+                start_time.label("start_time"),
+                end_time.label("end_time"),
+                ShiftTemplateDB.duration_seconds.label("duration_seconds"),
+                ShiftTemplateDB.id.label("template_id"),
+                days.c.day.label("occurrence_date"),
+                days.c.earliest_date,
+                days.c.latest_date,
+            )
+            .select_from(ShiftTemplateDB)
+            .join(
+                days,
+                and_(
+                    ShiftTemplateDB.weekdays.op("&")(days.c.weekday_bit) != 0,
+                    (days.c.week_number - ShiftTemplateDB.anchor_week) % ShiftTemplateDB.interval_weeks == 0,
+                    days.c.day >= ShiftTemplateDB.valid_from,
+                    or_(ShiftTemplateDB.valid_until.is_(None), days.c.day <= ShiftTemplateDB.valid_until),
+                ),
+            )
+        )
+        if template_ids is not None:
+            query = query.where(ShiftTemplateDB.id.in_(list(template_ids)))
+        if employee_ids is not None:
+            query = query.where(ShiftTemplateDB.employee_id.in_(list(employee_ids)))
+        return query.cte("occurrences")
+
+
+def _combine(dialect_name: str, day_column, time_column) -> ColumnElement:
+    # timestamp of time_column on day_column, in the same form the DateTime
+    # columns store; SQLite keeps both as text ("YYYY-MM-DD" and
+    # "HH:MM:SS.ffffff"), so they are joined rather than added
+    if dialect_name == "postgresql":
+        return type_coerce(day_column + time_column, DateTime)
+    return type_coerce(
+        type_coerce(day_column, String) + " " + type_coerce(time_column, String),
+        DateTime,
+    )
+
+
+def _already_expanded(occurrences: CTE) -> ColumnElement[bool]:
+    # a shift was expanded for the occurrence (wherever it has been moved
+    # since), or one was and has been deleted
+    return or_(
+        exists().where(
+            ShiftDB.template_id == occurrences.c.template_id,
+            ShiftDB.occurrence_date == occurrences.c.occurrence_date,
+        ),
+        exists().where(
+            ShiftTemplateSkipDB.template_id == occurrences.c.template_id,
+            ShiftTemplateSkipDB.occurrence_date == occurrences.c.occurrence_date,
+        ),
+    )
+
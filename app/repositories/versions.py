@@ -0,0 +1,61 @@
+# app/repositories/versions.py
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import Select, select, update
+from sqlalchemy.orm import Session
+
+from app.db.models import TableVersionDB
+
+# Tables whose writes are versioned, seeded by init_db
+VERSIONED_TABLES = ("employees", "shifts", "shift_templates")
+
+# name -> (version, updated_at)
+TableVersions = Dict[str, Tuple[int, Optional[datetime]]]
+
+
+def utcnow() -> datetime:
+    # naive UTC, like every other DateTime column in this schema
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def bump_table_versions(db: Session, *table_names: str) -> None:
+    """
+    Increment the version of table_names inside the caller's transaction,
+    so the new version becomes visible exactly when the write commits.
+    """
+    db.execute(
+        update(TableVersionDB)
+        .where(TableVersionDB.name.in_(table_names))
+        .values(version=TableVersionDB.version + 1, updated_at=utcnow())
+    )
+
+
+def select_table_versions(table_names: Iterable[str]) -> Select:
+    return select(
+        TableVersionDB.name,
+        TableVersionDB.version,
+        TableVersionDB.updated_at,
+    ).where(TableVersionDB.name.in_(list(table_names)))
+
+
+class TableVersionRepository:
+    def __init__(self, db: Session) -> None:
+        self.db: Session = db
+
+    # current (version, updated_at) of each table; unknown tables read as 0
+    def get_versions(self, table_names: Iterable[str]) -> TableVersions:
+        table_names = list(table_names)
+        versions: TableVersions = {name: (0, None) for name in table_names}
+        for row in self.db.execute(select_table_versions(table_names)):
+            versions[row.name] = (row.version, row.updated_at)
+        return versions
+
+    # create the row of every versioned table that does not have one yet
+    def ensure_rows(self, table_names: Iterable[str] = VERSIONED_TABLES) -> None:
+        existing = set(self.db.scalars(select(TableVersionDB.name)))
+        now = utcnow()
+        for name in table_names:
+            if name not in existing:
+                self.db.add(TableVersionDB(name=name, version=0, updated_at=now))
+        self.db.commit()
@@ -45,3 +45,61 @@ class AnalyticsResponse(AnalyticsBase):
 
     class Config:
         from_attributes = True
+
+
+class AnalyticsTimeSeriesRow(BaseModel):
+    employee_id: int = Field(
+        ...,
+        description="Unique identifier of the employee",
+        example=1,
+    )
+    employee_name: Optional[str] = Field(
+        default=None,
+        description="Name of the employee",
+        example="Alex Morgan",
+    )
+    total_shifts: List[int] = Field(
+        ...,
+        description="Shift count per bucket, aligned with buckets",
+        example=[5, 4, 0],
+    )
+    total_hours: List[float] = Field(
+        ...,
+        description="Hours worked per bucket, aligned with buckets",
+        example=[40.0, 32.0, 0.0],
+    )
+
+
+class AnalyticsTimeSeriesResponse(BaseModel):
+    bucket: str = Field(
+        ...,
+        description="Bucket size: day, week, or month",
+        example="week",
+    )
+    start_date: date = Field(
+        ...,
+        description="Start of the requested range (inclusive)",
+        example="2026-01-01",
+    )
+    end_date: date = Field(
+        ...,
+        description="End of the requested range (inclusive)",
+        example="2026-03-31",
+    )
+    buckets: List[date] = Field(
+        ...,
+        description="First day of each bucket, in order",
+        example=["2025-12-29", "2026-01-05", "2026-01-12"],
+    )
+    series: List[AnalyticsTimeSeriesRow] = Field(
+        ...,
+        description="One row per employee in scope (every employee, or those of employee_ids), including employees with no work in the range",
+    )
+
+
+class AnalyticsCacheStats(BaseModel):
+    hits: int = Field(..., description="Lookups answered from the cache", example=1200)
+    misses: int = Field(..., description="Lookups that ran the aggregation", example=35)
+    size: int = Field(..., description="Entries currently cached", example=20)
+    max_entries: int = Field(..., description="Entry limit before LRU eviction", example=1024)
+    ttl_seconds: float = Field(..., description="Lifetime of an entry in seconds", example=300)
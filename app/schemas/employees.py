@@ -1,5 +1,6 @@
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional
+from pydantic import BaseModel, Field, TypeAdapter
+from typing_extensions import TypedDict
 
 
 class EmployeeBase(BaseModel):
@@ -53,3 +54,63 @@ class EmployeeResponse(EmployeeBase):
     class Config:
         # Tell Pydantic it may receive ORM objects (EmployeeDB) and map them
         from_attributes = True
+
+
+class EmployeePage(BaseModel):
+    items: List[EmployeeResponse] = Field(
+        ...,
+        description="Employees on this page, ordered by id",
+    )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor for the next page, or null on the last page",
+        example="WzQyXQ",
+    )
+
+
+class EmployeeRow(TypedDict):
+    # Plain-dict twin of EmployeeResponse (same keys, same order) for the
+    # list fast path
+    name: str
+    role: str
+    availability: Optional[str]
+    id: int
+
+
+class EmployeePageData(TypedDict):
+    items: List[EmployeeRow]
+    next_cursor: Optional[str]
+
+
+# Validates a page of column rows in one call, without building models
+employee_rows_adapter = TypeAdapter(List[EmployeeRow])
+
+
+class EmployeeImportRejection(BaseModel):
+    line: int = Field(
+        ...,
+        description="Line number of the rejected row in the uploaded file",
+        example=14,
+    )
+    message: str = Field(
+        ...,
+        description="Why the row was rejected",
+        example="name: Field required",
+    )
+
+
+class EmployeeImportResult(BaseModel):
+    accepted: int = Field(
+        ...,
+        description="Number of employees created",
+        example=480,
+    )
+    rejected: int = Field(
+        ...,
+        description="Number of rows rejected",
+        example=3,
+    )
+    rejections: List[EmployeeImportRejection] = Field(
+        ...,
+        description="Details of rejected rows (capped; see rejected for the total)",
+    )
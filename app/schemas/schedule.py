@@ -1,8 +1,10 @@
 from datetime import date, datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional
+from pydantic import BaseModel, Field, TypeAdapter
+from typing_extensions import Annotated, TypedDict
 
 from app.db.enums import ShiftType
+from app.schemas.employees import EmployeeResponse
 
 
 class ShiftBase(BaseModel):
@@ -85,3 +87,358 @@ class ShiftResponse(ShiftBase):
 
     class Config:
         from_attributes = True
+
+
+class ShiftPage(BaseModel):
+    items: List[ShiftResponse] = Field(
+        ...,
+        description="Shifts on this page, ordered by shift_date then id",
+    )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor for the next page, or null on the last page",
+        example="WyIyMDI1LTA1LTIxIiwxMDFd",
+    )
+
+
+class ShiftRow(TypedDict):
+    # Plain-dict twin of ShiftResponse (same keys, same order) for the
+    # list fast path
+    employee_id: int
+    shift_date: date
+    shift: ShiftType
+    note: Optional[str]
+    start_time: datetime
+    end_time: datetime
+    id: int
+
+
+class ShiftPageData(TypedDict):
+    items: List[ShiftRow]
+    next_cursor: Optional[str]
+
+
+# Validates a page of column rows in one call, without building models
+shift_rows_adapter = TypeAdapter(List[ShiftRow])
+
+
+class ShiftBulkCreate(BaseModel):
+    items: List[ShiftCreate] = Field(
+        ...,
+        description="Shifts to create in one transaction",
+        max_length=10000,
+    )
+
+
+class ShiftBulkItemResult(BaseModel):
+    index: int = Field(
+        ...,
+        description="Position of the item in the request",
+        example=0,
+    )
+    status: str = Field(
+        ...,
+        description="Outcome for this item: created or rejected",
+        example="created",
+    )
+    shift: Optional[ShiftResponse] = Field(
+        default=None,
+        description="The created shift, when status is created",
+    )
+    message: Optional[str] = Field(
+        default=None,
+        description="Why the item was rejected, when status is rejected",
+        example="Employee with id=7 does not exist",
+    )
+
+
+class ShiftBulkResponse(BaseModel):
+    created: int = Field(
+        ...,
+        description="Number of shifts created",
+        example=240,
+    )
+    rejected: int = Field(
+        ...,
+        description="Number of items rejected",
+        example=2,
+    )
+    results: List[ShiftBulkItemResult] = Field(
+        ...,
+        description="Per-item results, in request order",
+    )
+
+
+class RosterDemand(BaseModel):
+    role: str = Field(
+        ...,
+        description="Role the shift must be staffed with",
+        example="Operator",
+    )
+    shift: ShiftType = Field(
+        ...,
+        description="Type of shift (Morning 06-14, Afternoon 14-22, Night 22-06)",
+        example=ShiftType.MORNING,
+    )
+    headcount: int = Field(
+        ...,
+        ge=1,
+        description="Employees of the role needed on the shift each day",
+        example=3,
+    )
+    weekdays: Optional[List[Annotated[int, Field(ge=0, le=6)]]] = Field(
+        default=None,
+        description="Days of the week it applies to, 0 = Monday; every day if omitted",
+        example=[0, 1, 2, 3, 4],
+    )
+
+
+class RosterGenerateRequest(BaseModel):
+    start_date: date = Field(
+        ...,
+        description="First day to roster",
+        example="2025-06-02",
+    )
+    end_date: date = Field(
+        ...,
+        description="Last day to roster (inclusive)",
+        example="2025-06-29",
+    )
+    demand: List[RosterDemand] = Field(
+        ...,
+        description="Required headcount per role per shift type",
+        max_length=1000,
+    )
+    employee_ids: Optional[List[int]] = Field(
+        default=None,
+        description="Only roster these employees; everyone with a demanded role if omitted",
+        max_length=10000,
+    )
+    include_unknown: bool = Field(
+        default=False,
+        description="Also roster employees whose availability is empty or unreadable",
+        example=False,
+    )
+
+
+class RosterShortfall(BaseModel):
+    shift_date: date = Field(
+        ...,
+        description="Day of the understaffed shift",
+        example="2025-06-07",
+    )
+    shift: ShiftType = Field(
+        ...,
+        description="Type of the understaffed shift",
+        example=ShiftType.NIGHT,
+    )
+    role: str = Field(
+        ...,
+        description="Role that could not be fully staffed",
+        example="Operator",
+    )
+    required: int = Field(
+        ...,
+        description="Headcount demanded",
+        example=3,
+    )
+    assigned: int = Field(
+        ...,
+        description="Employees on the shift, including ones scheduled before",
+        example=2,
+    )
+
+
+class RosterGenerateResponse(BaseModel):
+    created: int = Field(
+        ...,
+        description="Number of shifts created",
+        example=2240,
+    )
+    shifts: List[ShiftResponse] = Field(
+        ...,
+        description="The created shifts, ordered by start time",
+    )
+    unfilled: List[RosterShortfall] = Field(
+        ...,
+        description="Shifts that could not be fully staffed within the rules",
+    )
+
+
+class ShiftCopyRequest(BaseModel):
+    start_date: date = Field(
+        ...,
+        description="First day of the shifts to copy",
+        example="2025-06-02",
+    )
+    end_date: date = Field(
+        ...,
+        description="Last day of the shifts to copy (inclusive)",
+        example="2025-06-08",
+    )
+    offset_days: int = Field(
+        ...,
+        description="Days to move the copies by; negative copies backwards",
+        example=7,
+    )
+    employee_ids: Optional[List[int]] = Field(
+        default=None,
+        description="Only copy the shifts of these employees",
+        max_length=10000,
+    )
+    skip_conflicts: bool = Field(
+        default=False,
+        description=(
+            "Copy the shifts that fit and report the rest; by default any "
+            "copy overlapping an existing shift cancels the whole copy"
+        ),
+        example=False,
+    )
+
+
+class ShiftCopyConflict(BaseModel):
+    source_shift_id: int = Field(
+        ...,
+        description="Shift that was not copied",
+        example=101,
+    )
+    employee_id: int = Field(
+        ...,
+        description="Employee of the shift",
+        example=1,
+    )
+    shift_date: date = Field(
+        ...,
+        description="Day the copy would have been on",
+        example="2025-06-09",
+    )
+    start_time: datetime = Field(
+        ...,
+        description="Start the copy would have had",
+        example="2025-06-09T06:00:00",
+    )
+    end_time: datetime = Field(
+        ...,
+        description="End the copy would have had",
+        example="2025-06-09T14:00:00",
+    )
+
+
+class ShiftCopyResult(BaseModel):
+    created: int = Field(
+        ...,
+        description="Number of shifts created",
+        example=420,
+    )
+    conflicts: List[ShiftCopyConflict] = Field(
+        ...,
+        description="Shifts not copied because the employee already has an overlapping shift",
+    )
+
+
+class ScheduleChange(BaseModel):
+    seq: int = Field(
+        ...,
+        description="Position of the change in the change log",
+        example=5012,
+    )
+    entity: str = Field(
+        ...,
+        description="What changed: shift or employee",
+        example="shift",
+    )
+    id: int = Field(
+        ...,
+        description="Identifier of the shift or employee that changed",
+        example=101,
+    )
+    op: str = Field(
+        ...,
+        description="upsert (created or updated) or delete (a tombstone)",
+        example="upsert",
+    )
+    shift: Optional[ShiftResponse] = Field(
+        default=None,
+        description="Current state of the shift, for shift upserts",
+    )
+    employee: Optional[EmployeeResponse] = Field(
+        default=None,
+        description="Current state of the employee, for employee upserts",
+    )
+
+
+class ScheduleChangeFeed(BaseModel):
+    changes: List[ScheduleChange] = Field(
+        ...,
+        description=(
+            "Changes after the since token, oldest first, with at most one "
+            "entry (the latest) per shift or employee"
+        ),
+    )
+    next_token: str = Field(
+        ...,
+        description="Token to pass as since on the next call",
+        example="WzUwMTJd",
+    )
+    has_more: bool = Field(
+        ...,
+        description="True if more changes are waiting; call again with next_token",
+        example=False,
+    )
+    reset_required: bool = Field(
+        ...,
+        description=(
+            "True if since was missing or older than the compacted part of "
+            "the log: reload the full schedule, then sync from next_token"
+        ),
+        example=False,
+    )
+
+
+class ShiftCandidate(BaseModel):
+    employee: EmployeeResponse = Field(
+        ...,
+        description="An employee free to cover the shift",
+    )
+    role_match: bool = Field(
+        ...,
+        description="True if the employee has the role of the employee currently assigned",
+        example=True,
+    )
+    availability_known: bool = Field(
+        ...,
+        description=(
+            "True if the employee's availability covers the shift; false "
+            "if it is empty or unreadable (only listed with include_unknown)"
+        ),
+        example=True,
+    )
+    week_hours: float = Field(
+        ...,
+        description="Hours already scheduled in the shift's week (Monday to Sunday)",
+        example=24.0,
+    )
+    projected_week_hours: float = Field(
+        ...,
+        description="week_hours plus the length of the shift",
+        example=32.0,
+    )
+    exceeds_max_weekly_hours: bool = Field(
+        ...,
+        description="True if projected_week_hours is over the weekly maximum",
+        example=False,
+    )
+
+
+class ShiftCandidates(BaseModel):
+    shift: ShiftResponse = Field(
+        ...,
+        description="The shift that needs cover",
+    )
+    candidates: List[ShiftCandidate] = Field(
+        ...,
+        description=(
+            "Best cover first: same role, then within the weekly maximum, "
+            "then known availability, then fewest hours this week"
+        ),
+    )
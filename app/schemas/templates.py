@@ -0,0 +1,213 @@
+from datetime import date, datetime, time
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from typing_extensions import Annotated
+
+from app.db.enums import ShiftType
+
+Weekday = Annotated[int, Field(ge=0, le=6)]
+
+
+class ShiftTemplateBase(BaseModel):
+    employee_id: int = Field(
+        ...,
+        description="Identifier of the employee who works the shift",
+        example=1,
+    )
+    shift: ShiftType = Field(
+        ...,
+        description="Type of shift",
+        example=ShiftType.MORNING,
+    )
+    start_time: time = Field(
+        ...,
+        description="Local start time",
+        example="06:00:00",
+    )
+    end_time: time = Field(
+        ...,
+        description="Local end time; at or before start_time means the next day",
+        example="14:00:00",
+    )
+    valid_from: date = Field(
+        ...,
+        description="First day the template applies to",
+        example="2025-06-02",
+    )
+    valid_until: Optional[date] = Field(
+        default=None,
+        description="Last day the template applies to, or null for no end",
+        example="2025-12-31",
+    )
+    note: Optional[str] = Field(
+        default=None,
+        description="Note copied onto every shift expanded from the template",
+        example="Front desk",
+    )
+
+
+class ShiftTemplateCreate(ShiftTemplateBase):
+    weekdays: Optional[List[Weekday]] = Field(
+        default=None,
+        description="Days of the week, 0 = Monday; give this or rrule",
+        example=[0, 1, 2, 3, 4],
+    )
+    interval_weeks: int = Field(
+        default=1,
+        ge=1,
+        le=52,
+        description="Repeat every this many weeks, counted from the week of valid_from",
+        example=1,
+    )
+    rrule: Optional[str] = Field(
+        default=None,
+        description=(
+            "Recurrence as an RRULE subset instead of weekdays: FREQ=WEEKLY "
+            "with BYDAY and INTERVAL, or FREQ=DAILY"
+        ),
+        example="FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE,FR",
+    )
+
+
+class ShiftTemplateUpdate(BaseModel):
+    employee_id: Optional[int] = Field(
+        default=None,
+        description="New employee identifier",
+        example=2,
+    )
+    shift: Optional[ShiftType] = Field(
+        default=None,
+        description="New type of shift",
+        example=ShiftType.AFTERNOON,
+    )
+    start_time: Optional[time] = Field(
+        default=None,
+        description="New local start time",
+        example="14:00:00",
+    )
+    end_time: Optional[time] = Field(
+        default=None,
+        description="New local end time",
+        example="22:00:00",
+    )
+    weekdays: Optional[List[Weekday]] = Field(
+        default=None,
+        description="New days of the week, 0 = Monday",
+        example=[5, 6],
+    )
+    interval_weeks: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=52,
+        description="New repeat interval in weeks",
+        example=2,
+    )
+    rrule: Optional[str] = Field(
+        default=None,
+        description="New recurrence as an RRULE subset, replacing weekdays and interval_weeks",
+        example="FREQ=DAILY",
+    )
+    valid_from: Optional[date] = Field(
+        default=None,
+        description="New first day",
+        example="2025-07-01",
+    )
+    valid_until: Optional[date] = Field(
+        default=None,
+        description="New last day",
+        example="2025-09-30",
+    )
+    note: Optional[str] = Field(
+        default=None,
+        description="New note",
+        example="Back office",
+    )
+
+
+class ShiftTemplateResponse(ShiftTemplateBase):
+    id: int = Field(
+        ...,
+        description="Unique identifier of the template",
+        example=12,
+    )
+    weekdays: List[int] = Field(
+        ...,
+        description="Days of the week, 0 = Monday",
+        example=[0, 1, 2, 3, 4],
+    )
+    interval_weeks: int = Field(
+        ...,
+        description="Repeats every this many weeks",
+        example=1,
+    )
+    rrule: str = Field(
+        ...,
+        description="The recurrence as an RRULE",
+        example="FREQ=WEEKLY;INTERVAL=1;BYDAY=MO,TU,WE,TH,FR",
+    )
+
+
+class TemplateExpandRequest(BaseModel):
+    start_date: date = Field(
+        ...,
+        description="First day to expand",
+        example="2025-07-01",
+    )
+    end_date: date = Field(
+        ...,
+        description="Last day to expand (inclusive)",
+        example="2025-09-30",
+    )
+    template_ids: Optional[List[int]] = Field(
+        default=None,
+        description="Only expand these templates; all of them if omitted",
+        max_length=10000,
+    )
+    employee_ids: Optional[List[int]] = Field(
+        default=None,
+        description="Only expand the templates of these employees",
+        max_length=10000,
+    )
+
+
+class TemplateExpansionConflict(BaseModel):
+    template_id: int = Field(
+        ...,
+        description="Template whose occurrence was skipped",
+        example=12,
+    )
+    employee_id: int = Field(
+        ...,
+        description="Employee of the template",
+        example=1,
+    )
+    shift_date: date = Field(
+        ...,
+        description="Day of the skipped occurrence",
+        example="2025-07-04",
+    )
+    start_time: datetime = Field(
+        ...,
+        description="Start of the skipped occurrence",
+        example="2025-07-04T06:00:00",
+    )
+    end_time: datetime = Field(
+        ...,
+        description="End of the skipped occurrence",
+        example="2025-07-04T14:00:00",
+    )
+
+
+class TemplateExpansionResult(BaseModel):
+    created: int = Field(
+        ...,
+        description="Number of shifts created",
+        example=6500,
+    )
+    conflicts: List[TemplateExpansionConflict] = Field(
+        ...,
+        description=(
+            "Occurrences not created because the employee already has an "
+            "overlapping shift; occurrences expanded before are not listed"
+        ),
+    )
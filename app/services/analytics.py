@@ -1,14 +1,40 @@
 from datetime import date, timedelta
 import logging
-from typing import Optional
+from typing import Dict, List, Optional
 
+from app.core.config import (
+    ANALYTICS_CACHE_MAX_ENTRIES,
+    ANALYTICS_CACHE_TTL_SECONDS,
+    ANALYTICS_USE_ROLLUP,
+)
+from app.repositories.employees import EmployeeRepository
+from app.repositories.rollup import DailyRollupRepository
 from app.repositories.schedule import ShiftRepository
-from app.schemas.analytics import AnalyticsResponse
+from app.schemas.analytics import (
+    AnalyticsResponse,
+    AnalyticsTimeSeriesResponse,
+    AnalyticsTimeSeriesRow,
+)
+from app.services.analytics_cache import AnalyticsCache
+from app.services.weeks import week_of
 
 logger = logging.getLogger(__name__)
+
+analytics_cache = AnalyticsCache(
+    max_entries=ANALYTICS_CACHE_MAX_ENTRIES,
+    ttl_seconds=ANALYTICS_CACHE_TTL_SECONDS,
+)
+
 class AnalyticsService:
-    def __init__(self, shift_repo: ShiftRepository):
+    def __init__(
+        self,
+        shift_repo: ShiftRepository,
+        rollup_repo: DailyRollupRepository,
+        employee_repo: EmployeeRepository,
+    ):
         self.shift_repo = shift_repo
+        self.rollup_repo = rollup_repo
+        self.employee_repo = employee_repo
 
     
     def _get_period_range(self, period: str, ref_date: date):
@@ -18,7 +44,7 @@ class AnalyticsService:
         if period == "week":
             # assuming Monday as first day
             # start will give monday's date
-            start = ref_date - timedelta(days=ref_date.weekday())
+            start = week_of(ref_date)
             
             # end will give sunday's date for that week
             end = start + timedelta(days=6)
@@ -41,11 +67,57 @@ class AnalyticsService:
 
         raise ValueError("Invalid period; use day, week, or month")
 
-    def get_employee_analytics(self, period: Optional[str], ref_date: Optional[date]):
+    def get_employee_analytics(
+        self,
+        period: Optional[str],
+        ref_date: Optional[date],
+        employee_ids: Optional[List[int]] = None,
+    ):
+        """
+        Per-employee totals for a period, or all time when neither period
+        nor ref_date is given. employee_ids restricts the aggregation to
+        those employees inside the query itself. Results are served from
+        analytics_cache until a write touches their window or they expire.
+        """
         logger.info("inside get_employee_analytics")
+        if period is None and ref_date is None:
+            period_label, start_date, end_date = "all", date.min, date.max
+        else:
+            period_label = period
+            start_date, end_date = self._get_period_range(period, ref_date)
+
+        employee_scope = tuple(sorted(set(employee_ids))) if employee_ids is not None else None
+        cache_key = (period_label, start_date, end_date, employee_scope)
+
+        cached_rows = analytics_cache.get(cache_key)
+        if cached_rows is not None:
+            return cached_rows
+
+        generation = analytics_cache.generation
+        rows = self._compute_employee_analytics(
+            period=period,
+            ref_date=ref_date,
+            employee_ids=employee_ids,
+        )
+        analytics_cache.put(cache_key, start_date, end_date, rows, generation=generation)
+        return rows
+
+    def _compute_employee_analytics(
+        self,
+        period: Optional[str],
+        ref_date: Optional[date],
+        employee_ids: Optional[List[int]] = None,
+    ):
         if period is None and ref_date is None:
             logger.info("inside if")
-            rows = self.shift_repo.get_analytics_by_employee_all_time()
+            if ANALYTICS_USE_ROLLUP:
+                rows = self.rollup_repo.get_totals_by_employee(
+                    employee_ids=employee_ids
+                )
+            else:
+                rows = self.shift_repo.get_analytics_by_employee_all_time(
+                    employee_ids=employee_ids
+                )
             # treat this as “all time” window
             return [
                 AnalyticsResponse(
@@ -60,7 +132,15 @@ class AnalyticsService:
                 for row in rows
             ]
         start_date, end_date = self._get_period_range(period, ref_date)
-        rows = self.shift_repo.get_analytics_by_employee(start_date, end_date)
+        if ANALYTICS_USE_ROLLUP:
+            # cost scales with employees x days, not with the number of shifts
+            rows = self.rollup_repo.get_totals_by_employee(
+                start_date, end_date, employee_ids=employee_ids
+            )
+        else:
+            rows = self.shift_repo.get_analytics_by_employee(
+                start_date, end_date, employee_ids=employee_ids
+            )
         return [
             AnalyticsResponse(
                 employee_id=row.employee_id,
@@ -73,3 +153,63 @@ class AnalyticsService:
             )
             for row in rows
         ]
+
+    def get_employee_timeseries(
+        self,
+        start_date: date,
+        end_date: date,
+        bucket: str,
+        employee_ids: Optional[List[int]] = None,
+    ) -> AnalyticsTimeSeriesResponse:
+        """
+        Dense employee x bucket matrix of shifts and hours between
+        start_date and end_date, from a single per-day query. Every
+        employee in scope (all of them when employee_ids is None) gets a
+        row, and buckets with no work are filled with zeros.
+        """
+        # Each bucket is the day/week/month window containing its first day
+        buckets: List[date] = []
+        bucket_start, bucket_end = self._get_period_range(bucket, start_date)
+        while bucket_start <= end_date:
+            buckets.append(bucket_start)
+            bucket_start, bucket_end = self._get_period_range(
+                bucket, bucket_end + timedelta(days=1)
+            )
+        bucket_positions = {bucket_day: index for index, bucket_day in enumerate(buckets)}
+
+        if ANALYTICS_USE_ROLLUP:
+            rows = self.rollup_repo.get_daily_totals(
+                start_date, end_date, employee_ids=employee_ids
+            )
+        else:
+            rows = self.shift_repo.get_daily_totals_by_employee(
+                start_date, end_date, employee_ids=employee_ids
+            )
+
+        # one all-zero row per employee in scope, so employees without any
+        # work in the range still get their row
+        series: Dict[int, AnalyticsTimeSeriesRow] = {
+            employee.id: AnalyticsTimeSeriesRow(
+                employee_id=employee.id,
+                employee_name=employee.name,
+                total_shifts=[0] * len(buckets),
+                total_hours=[0.0] * len(buckets),
+            )
+            for employee in self.employee_repo.find_names(employee_ids)
+        }
+        for row in rows:
+            current = series.get(row.employee_id)
+            if current is None:
+                # created after the employee list was read
+                continue
+            position = bucket_positions[self._get_period_range(bucket, row.day)[0]]
+            current.total_shifts[position] += row.total_shifts
+            current.total_hours[position] += (row.total_seconds or 0) / 3600.0
+
+        return AnalyticsTimeSeriesResponse(
+            bucket=bucket,
+            start_date=start_date,
+            end_date=end_date,
+            buckets=buckets,
+            series=list(series.values()),
+        )
@@ -0,0 +1,93 @@
+from collections import OrderedDict
+from datetime import date
+import threading
+import time
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+
+class AnalyticsCache:
+    """
+    Size- and TTL-bounded LRU cache for analytics results.
+
+    Each entry remembers the date window it aggregates, so a write that
+    touches a date drops exactly the windows containing it. Invalidation
+    is per process; the TTL bounds staleness when several workers run.
+
+    Callers read `generation` before computing a value and pass it to
+    put(); if any invalidation happened in between, the possibly stale
+    value is not stored.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires_at, start_date, end_date, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, date, date, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[3]
+
+    def put(
+        self,
+        key: Hashable,
+        start_date: date,
+        end_date: date,
+        value: Any,
+        generation: int,
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (
+                time.monotonic() + self.ttl_seconds,
+                start_date,
+                end_date,
+                value,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_dates(self, dates: Iterable[date]) -> None:
+        touched = set(dates)
+        if not touched:
+            return
+        with self._lock:
+            self.generation += 1
+            stale_keys = [
+                key
+                for key, (_, start_date, end_date, _) in self._entries.items()
+                if any(start_date <= day <= end_date for day in touched)
+            ]
+            for key in stale_keys:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
@@ -0,0 +1,77 @@
+from typing import List, Optional
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import EmployeeDB
+from app.repositories.async_employees import AsyncEmployeeRepository
+from app.schemas.employees import (
+    EmployeeCreate,
+    EmployeeUpdate,
+    EmployeeResponse,
+    EmployeePageData,
+)
+from app.services.employees import (
+    EmployeeService,
+    build_employee_page,
+    decode_employee_cursor,
+)
+
+
+class AsyncEmployeeService:
+    """
+    Async counterpart of EmployeeService. Reads run natively on the async
+    session; writes run EmployeeService on the session's sync facade via
+    run_sync, so write-side rules live in one place.
+    """
+
+    def __init__(self, db_session: AsyncSession) -> None:
+        self.db_session: AsyncSession = db_session
+        self.employee_repository: AsyncEmployeeRepository = AsyncEmployeeRepository(
+            db=db_session
+        )
+
+    async def list_employees(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> EmployeePageData:
+        # Fetch one extra row to learn whether another page exists
+        employee_rows: List[Row] = await self.employee_repository.find_all_rows(
+            after_id=decode_employee_cursor(cursor),
+            limit=limit + 1,
+        )
+        return build_employee_page(employee_rows=employee_rows, limit=limit)
+
+    async def get_employee(self, employee_id: int) -> Optional[EmployeeResponse]:
+        employee_db: Optional[EmployeeDB] = await self.employee_repository.find_by_id(
+            employee_id=employee_id
+        )
+        if employee_db is None:
+            return None
+        return EmployeeResponse.model_validate(employee_db)
+
+    async def create_employee(self, employee_in: EmployeeCreate) -> EmployeeResponse:
+        return await self.db_session.run_sync(
+            lambda sync_session: EmployeeService(db_session=sync_session).create_employee(
+                employee_in=employee_in
+            )
+        )
+
+    async def update_employee(
+        self,
+        employee_id: int,
+        employee_in: EmployeeUpdate,
+    ) -> Optional[EmployeeResponse]:
+        return await self.db_session.run_sync(
+            lambda sync_session: EmployeeService(db_session=sync_session).update_employee(
+                employee_id=employee_id,
+                employee_in=employee_in,
+            )
+        )
+
+    async def delete_employee(self, employee_id: int) -> bool:
+        return await self.db_session.run_sync(
+            lambda sync_session: EmployeeService(db_session=sync_session).delete_employee(
+                employee_id=employee_id
+            )
+        )
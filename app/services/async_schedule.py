@@ -0,0 +1,89 @@
+from datetime import date, datetime
+from typing import List, Optional
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import ShiftDB
+from app.repositories.async_schedule import AsyncShiftRepository
+from app.schemas.schedule import (
+    ShiftCreate,
+    ShiftUpdate,
+    ShiftResponse,
+    ShiftPageData,
+)
+from app.services.schedule import ShiftService, build_shift_page, decode_shift_cursor
+
+
+class AsyncShiftService:
+    """
+    Async counterpart of ShiftService. Reads run natively on the async
+    session; writes run ShiftService on the session's sync facade via
+    run_sync, so overlap checks, rollups and cache invalidation live in
+    one place.
+    """
+
+    def __init__(self, db_session: AsyncSession) -> None:
+        self.db_session: AsyncSession = db_session
+        self.shift_repository: AsyncShiftRepository = AsyncShiftRepository(
+            db=db_session
+        )
+
+    async def list_shifts(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        employee_id: Optional[int] = None,
+        start_datetime_from: Optional[datetime] = None,
+        start_datetime_to: Optional[datetime] = None,
+        end_datetime_from: Optional[datetime] = None,
+        end_datetime_to: Optional[datetime] = None,
+    ) -> ShiftPageData:
+        # Fetch one extra row to learn whether another page exists
+        shift_rows: List[Row] = await self.shift_repository.find_all_rows(
+            start_date=start_date,
+            end_date=end_date,
+            employee_id=employee_id,
+            start_datetime_from=start_datetime_from,
+            start_datetime_to=start_datetime_to,
+            end_datetime_from=end_datetime_from,
+            end_datetime_to=end_datetime_to,
+            after=decode_shift_cursor(cursor),
+            limit=limit + 1,
+        )
+        return build_shift_page(shift_rows=shift_rows, limit=limit)
+
+    async def get_shift(self, shift_id: int) -> Optional[ShiftResponse]:
+        shift_db: Optional[ShiftDB] = await self.shift_repository.find_by_id(
+            shift_id=shift_id
+        )
+        if shift_db is None:
+            return None
+        return ShiftResponse.model_validate(shift_db)
+
+    async def create_shift(self, shift_in: ShiftCreate) -> ShiftResponse:
+        return await self.db_session.run_sync(
+            lambda sync_session: ShiftService(db_session=sync_session).create_shift(
+                shift_in=shift_in
+            )
+        )
+
+    async def update_shift(
+        self,
+        shift_id: int,
+        shift_in: ShiftUpdate,
+    ) -> Optional[ShiftResponse]:
+        return await self.db_session.run_sync(
+            lambda sync_session: ShiftService(db_session=sync_session).update_shift(
+                shift_id=shift_id,
+                shift_in=shift_in,
+            )
+        )
+
+    async def delete_shift(self, shift_id: int) -> bool:
+        return await self.db_session.run_sync(
+            lambda sync_session: ShiftService(db_session=sync_session).delete_shift(
+                shift_id=shift_id
+            )
+        )
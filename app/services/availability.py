@@ -0,0 +1,224 @@
+from datetime import datetime, timedelta
+import re
+import threading
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+# The week as 15-minute slots, Monday 00:00 first: 7 * 96 = 672 bits,
+# stored as an 84-byte big-endian blob. Bit day * 96 + slot set means the
+# employee is available in that slot.
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+SLOTS_PER_WEEK = 7 * SLOTS_PER_DAY
+MASK_BYTES = SLOTS_PER_WEEK // 8
+FULL_WEEK_MASK = (1 << SLOTS_PER_WEEK) - 1
+
+_DAY_NAMES = {
+    "mon": 0, "monday": 0,
+    "tue": 1, "tues": 1, "tuesday": 1,
+    "wed": 2, "weds": 2, "wednesday": 2,
+    "thu": 3, "thur": 3, "thurs": 3, "thursday": 3,
+    "fri": 4, "friday": 4,
+    "sat": 5, "saturday": 5,
+    "sun": 6, "sunday": 6,
+}
+_DAY_GROUPS = {
+    "weekday": range(0, 5), "weekdays": range(0, 5),
+    "weekend": range(5, 7), "weekends": range(5, 7),
+    "daily": range(7), "everyday": range(7),
+}
+# named parts of the day, as (start minute, end minute); same hours as
+# the Morning / Afternoon / Night shift patterns
+_PERIODS = {
+    "morning": (6 * 60, 14 * 60), "mornings": (6 * 60, 14 * 60),
+    "afternoon": (14 * 60, 22 * 60), "afternoons": (14 * 60, 22 * 60),
+    "night": (22 * 60, 30 * 60), "nights": (22 * 60, 30 * 60),
+    "anytime": (0, 24 * 60),
+}
+_FILLER_WORDS = {"only", "and", "every", "day", "days", "all", "week", "any", "time", "on", "available"}
+
+_TIME = r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?"
+_RANGE = r"(?:\s*[-–]\s*|\s+to\s+)"
+_TOKEN = re.compile(
+    rf"(?P<time>{_TIME}{_RANGE}{_TIME})"
+    rf"|(?P<days>[a-z]+{_RANGE}[a-z]+)"
+    r"|(?P<word>[a-z]+)"
+    r"|(?P<other>[^\s,&/]+)"
+)
+
+
+class AvailabilityParseError(ValueError):
+    pass
+
+
+def parse_availability(text: str) -> int:
+    """
+    Weekly slot mask for free-text availability such as
+    "Mon-Fri, 09:00-17:00", "Weekends only", "Nights, Sun-Thu" or
+    "Mon, Wed 8am-2pm; Sat 10:00-16:00". Clauses are separated by ";".
+    A clause without days means every day, one without times means the
+    whole day. A range ending at or before its start (22:00-06:00) runs
+    into the next day, except between bare hours up to 12, where the end
+    is read as pm ("9-5" is 09:00-17:00). Raise AvailabilityParseError
+    for anything else.
+    """
+    mask = 0
+    for clause in text.lower().replace("24/7", "daily").split(";"):
+        if clause.strip():
+            mask |= _parse_clause(clause)
+    if mask == 0:
+        raise AvailabilityParseError(f"No availability found in {text!r}")
+    return mask
+
+
+def _parse_clause(clause: str) -> int:
+    days: Set[int] = set()
+    windows: List[Tuple[int, int]] = []
+    for match in _TOKEN.finditer(clause):
+        if match.group("time"):
+            windows.append(_parse_time_range(match.group("time")))
+        elif match.group("days"):
+            first, last = re.split(_RANGE, match.group("days"))
+            if first not in _DAY_NAMES or last not in _DAY_NAMES:
+                raise AvailabilityParseError(f"Unknown day range {match.group('days')!r}")
+            day = _DAY_NAMES[first]
+            days.add(day)
+            while day != _DAY_NAMES[last]:
+                day = (day + 1) % 7
+                days.add(day)
+        elif match.group("word"):
+            word = match.group("word")
+            if word in _DAY_NAMES:
+                days.add(_DAY_NAMES[word])
+            elif word in _DAY_GROUPS:
+                days.update(_DAY_GROUPS[word])
+            elif word in _PERIODS:
+                windows.append(_PERIODS[word])
+            elif word not in _FILLER_WORDS:
+                raise AvailabilityParseError(f"Unknown word {word!r}")
+        else:
+            raise AvailabilityParseError(f"Unexpected {match.group('other')!r}")
+
+    if not days and not windows:
+        return 0
+    mask = 0
+    for day in days or range(7):
+        for start_minute, end_minute in windows or [(0, 24 * 60)]:
+            mask |= _slot_range_mask(
+                day * SLOTS_PER_DAY + start_minute // SLOT_MINUTES,
+                day * SLOTS_PER_DAY + -(-end_minute // SLOT_MINUTES),
+            )
+    return mask
+
+
+def _parse_time_range(text: str) -> Tuple[int, int]:
+    match = re.fullmatch(rf"{_TIME}{_RANGE}{_TIME}", text)
+    start_minute = _minute_of_day(*match.group(1, 2, 3))
+    end_minute = _minute_of_day(*match.group(4, 5, 6))
+    if _is_bare_hour(*match.group(1, 2, 3)) and _is_bare_hour(*match.group(4, 5, 6)):
+        # "9-5" is nine to five, not an overnight shift: a bare end hour at
+        # or before a bare start hour is read as pm
+        if end_minute <= start_minute:
+            end_minute += 12 * 60
+    if end_minute <= start_minute:
+        end_minute += 24 * 60
+    return start_minute, end_minute
+
+
+def _is_bare_hour(hour: str, minute: Optional[str], meridiem: Optional[str]) -> bool:
+    return minute is None and meridiem is None and int(hour) <= 12
+
+
+def _minute_of_day(hour: str, minute: Optional[str], meridiem: Optional[str]) -> int:
+    hours, minutes = int(hour), int(minute or 0)
+    if meridiem is not None:
+        if not 1 <= hours <= 12:
+            raise AvailabilityParseError(f"Invalid hour {hour}{meridiem}")
+        hours = hours % 12 + (12 if meridiem == "pm" else 0)
+    if hours > 24 or minutes > 59 or (hours == 24 and minutes):
+        raise AvailabilityParseError(f"Invalid time {hour}:{minute or '00'}")
+    return hours * 60 + minutes
+
+
+def _slot_range_mask(first_slot: int, end_slot: int) -> int:
+    """Bits [first_slot, end_slot) of the week, wrapping past Sunday night."""
+    length = end_slot - first_slot
+    if length >= SLOTS_PER_WEEK:
+        return FULL_WEEK_MASK
+    if length <= 0:
+        return 0
+    bits = ((1 << length) - 1) << (first_slot % SLOTS_PER_WEEK)
+    # fold slots past Sunday night back onto Monday morning
+    return (bits | (bits >> SLOTS_PER_WEEK)) & FULL_WEEK_MASK
+
+
+def window_mask(start_time: datetime, end_time: datetime) -> int:
+    """Slots an employee must be available in to cover [start_time, end_time)."""
+    # shifts are stored as naive wall-clock times (the DateTime columns
+    # drop any offset), so an aware window is read the same way
+    start_time = start_time.replace(tzinfo=None)
+    end_time = end_time.replace(tzinfo=None)
+    week_start = datetime.combine(
+        start_time.date() - timedelta(days=start_time.weekday()),
+        datetime.min.time(),
+    )
+    slot = timedelta(minutes=SLOT_MINUTES)
+    first_slot = (start_time - week_start) // slot
+    end_slot = -((week_start - end_time) // slot)
+    return _slot_range_mask(first_slot, end_slot)
+
+
+def encode_mask(mask: Optional[int]) -> Optional[bytes]:
+    return None if mask is None else mask.to_bytes(MASK_BYTES, "big")
+
+
+def decode_mask(blob: Optional[bytes]) -> Optional[int]:
+    return None if blob is None else int.from_bytes(blob, "big")
+
+
+def availability_mask_for(text: Optional[str]) -> Optional[bytes]:
+    """Stored availability_mask for text; None when it is empty or unreadable."""
+    if not text or not text.strip():
+        return None
+    try:
+        return encode_mask(parse_availability(text))
+    except AvailabilityParseError:
+        return None
+
+
+class AvailabilityIndex:
+    """
+    The distinct availability masks in use, for "who is free" queries.
+
+    Employees mostly share a handful of availability patterns, so the
+    bitwise test runs once per distinct mask, and the database then
+    selects employees by the masks that passed. The set is reloaded
+    whenever the employees table version has moved since it was read,
+    which keeps every worker process correct without any cross-process
+    signalling.
+    """
+
+    def __init__(self) -> None:
+        self._version: Optional[Tuple[int, Optional[datetime]]] = None
+        self._masks: List[Tuple[bytes, int]] = []
+        self._lock = threading.Lock()
+
+    def matching_masks(
+        self,
+        required_mask: int,
+        version: Tuple[int, Optional[datetime]],
+        loader: Callable[[], Iterable[bytes]],
+    ) -> List[bytes]:
+        """Stored masks that have every bit of required_mask set."""
+        with self._lock:
+            if version != self._version:
+                self._masks = [(blob, decode_mask(blob)) for blob in loader()]
+                self._version = version
+            return [blob for blob, mask in self._masks if mask & required_mask == required_mask]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version = None
+            self._masks = []
+
+
+availability_index = AvailabilityIndex()
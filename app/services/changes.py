@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core.config import CHANGE_LOG_RETENTION_DAYS
+from app.core.exceptions import InvalidCursorError
+from app.core.pagination import decode_cursor, encode_cursor
+from app.repositories.changes import (
+    DELETE,
+    EMPLOYEE_ENTITY,
+    SHIFT_ENTITY,
+    UPSERT,
+    ChangeLogRepository,
+)
+from app.repositories.employees import EMPLOYEE_ROW_FIELDS, EmployeeRepository
+from app.repositories.schedule import SHIFT_ROW_FIELDS, ShiftRepository
+from app.repositories.versions import utcnow
+from app.schemas.schedule import ScheduleChange, ScheduleChangeFeed
+
+
+class ChangeFeedService:
+    """
+    Delta sync over change_log. A client keeps the next_token of its last
+    call and asks only for what happened after it, so the cost of a sync
+    follows the number of edits, not the size of the schedule.
+    """
+
+    def __init__(self, db_session: Session) -> None:
+        self.db_session: Session = db_session
+        self.change_log_repository: ChangeLogRepository = ChangeLogRepository(
+            db=db_session
+        )
+        self.shift_repository: ShiftRepository = ShiftRepository(db=db_session)
+        self.employee_repository: EmployeeRepository = EmployeeRepository(
+            db=db_session
+        )
+
+    def list_changes(self, since: Optional[str], limit: int) -> ScheduleChangeFeed:
+        after_seq: Optional[int] = decode_change_token(since)
+
+        # Without a token, or with one from before the compacted part of
+        # the log, entries are missing: the client has to start over
+        if after_seq is None or after_seq < self.change_log_repository.get_horizon():
+            return ScheduleChangeFeed(
+                changes=[],
+                next_token=encode_cursor([self.change_log_repository.get_head()]),
+                has_more=False,
+                reset_required=True,
+            )
+
+        # Fetch one extra entry to learn whether more are waiting
+        entries: List[Row] = self.change_log_repository.find_since(
+            after_seq=after_seq,
+            limit=limit + 1,
+        )
+        has_more: bool = len(entries) > limit
+        entries = entries[:limit]
+        if not entries:
+            return ScheduleChangeFeed(
+                changes=[],
+                next_token=encode_cursor([after_seq]),
+                has_more=False,
+                reset_required=False,
+            )
+
+        # Only the latest entry per entity matters; re-inserting moves it
+        # to the position of that entry
+        latest: Dict[Tuple[str, int], Row] = {}
+        for entry in entries:
+            latest.pop((entry.entity, entry.entity_id), None)
+            latest[(entry.entity, entry.entity_id)] = entry
+
+        upserted_ids: Dict[str, List[int]] = {SHIFT_ENTITY: [], EMPLOYEE_ENTITY: []}
+        for entry in latest.values():
+            if entry.op == UPSERT:
+                upserted_ids[entry.entity].append(entry.entity_id)
+
+        # Upserts carry the row as it is now, read in one query per entity
+        shifts_by_id = {
+            row.id: dict(zip(SHIFT_ROW_FIELDS, row))
+            for row in self.shift_repository.find_rows_by_ids(upserted_ids[SHIFT_ENTITY])
+        }
+        employees_by_id = {
+            row.id: dict(zip(EMPLOYEE_ROW_FIELDS, row))
+            for row in self.employee_repository.find_rows_by_ids(upserted_ids[EMPLOYEE_ENTITY])
+        }
+
+        changes: List[ScheduleChange] = []
+        for entry in latest.values():
+            op: str = entry.op
+            current: Optional[Dict[str, Any]] = None
+            if op == UPSERT:
+                rows_by_id = shifts_by_id if entry.entity == SHIFT_ENTITY else employees_by_id
+                current = rows_by_id.get(entry.entity_id)
+                if current is None:
+                    # deleted by a later entry beyond this page; sending the
+                    # tombstone now is what that entry will say anyway
+                    op = DELETE
+            changes.append(
+                ScheduleChange(
+                    seq=entry.seq,
+                    entity=entry.entity,
+                    id=entry.entity_id,
+                    op=op,
+                    shift=current if entry.entity == SHIFT_ENTITY else None,
+                    employee=current if entry.entity == EMPLOYEE_ENTITY else None,
+                )
+            )
+
+        return ScheduleChangeFeed(
+            changes=changes,
+            next_token=encode_cursor([entries[-1].seq]),
+            has_more=has_more,
+            reset_required=False,
+        )
+
+    def compact(self, retention_days: int = CHANGE_LOG_RETENTION_DAYS) -> int:
+        """
+        Drop change_log entries older than retention_days. Clients whose
+        token predates the dropped entries get reset_required on their next
+        call. Returns the number of entries removed.
+        """
+        cutoff: datetime = utcnow() - timedelta(days=retention_days)
+        return self.change_log_repository.compact(cutoff=cutoff)
+
+
+def decode_change_token(token: Optional[str]) -> Optional[int]:
+    if token is None:
+        return None
+    (after_seq,) = decode_cursor(token, size=1)
+    if not isinstance(after_seq, int) or after_seq < 0:
+        raise InvalidCursorError(cursor=token)
+    return after_seq
@@ -0,0 +1,84 @@
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# (employee_id, start_time, end_time)
+TimeSlot = Tuple[int, datetime, datetime]
+
+CONFLICT_WITH_EXISTING = (
+    "Employee already has a shift that overlaps with the requested time window"
+)
+CONFLICT_WITH_BATCH = (
+    "Shift overlaps another shift for the same employee in this batch"
+)
+
+
+def _merge_slots(slots: List[Tuple[datetime, datetime]]) -> Tuple[List[datetime], List[datetime]]:
+    # Collapse one employee's intervals into sorted, disjoint runs
+    merged_starts: List[datetime] = []
+    merged_ends: List[datetime] = []
+    for start_time, end_time in sorted(slots):
+        if merged_ends and start_time < merged_ends[-1]:
+            merged_ends[-1] = max(merged_ends[-1], end_time)
+        else:
+            merged_starts.append(start_time)
+            merged_ends.append(end_time)
+    return merged_starts, merged_ends
+
+
+def find_batch_conflicts(
+    existing: Iterable[TimeSlot],
+    candidates: Sequence[TimeSlot],
+) -> Dict[int, str]:
+    """
+    Sort-and-sweep overlap detection for a batch of new shifts.
+
+    Returns {candidate position: reason} for every candidate that overlaps
+    an existing shift of the same employee, or overlaps a candidate that
+    was accepted before it. Among candidates, the one that starts first
+    wins (input order breaks ties). Runs in O((n + m) log(n + m)).
+    """
+    existing_by_employee: Dict[int, List[Tuple[datetime, datetime]]] = defaultdict(list)
+    for employee_id, start_time, end_time in existing:
+        existing_by_employee[employee_id].append((start_time, end_time))
+
+    merged_by_employee = {
+        employee_id: _merge_slots(slots)
+        for employee_id, slots in existing_by_employee.items()
+    }
+
+    conflicts: Dict[int, str] = {}
+
+    # Pass 1: candidates against existing rows, one bisection each
+    for position, (employee_id, start_time, end_time) in enumerate(candidates):
+        merged = merged_by_employee.get(employee_id)
+        if merged is None:
+            continue
+        merged_starts, merged_ends = merged
+        run = bisect_right(merged_starts, start_time) - 1
+        if run >= 0 and merged_ends[run] > start_time:
+            conflicts[position] = CONFLICT_WITH_EXISTING
+        elif run + 1 < len(merged_starts) and merged_starts[run + 1] < end_time:
+            conflicts[position] = CONFLICT_WITH_EXISTING
+
+    # Pass 2: sweep the surviving candidates of each employee in start order
+    ordered = sorted(
+        (
+            (employee_id, start_time, position, end_time)
+            for position, (employee_id, start_time, end_time) in enumerate(candidates)
+            if position not in conflicts
+        ),
+    )
+    current_employee_id = None
+    running_end = None
+    for employee_id, start_time, position, end_time in ordered:
+        if employee_id != current_employee_id:
+            current_employee_id = employee_id
+            running_end = None
+        if running_end is not None and start_time < running_end:
+            conflicts[position] = CONFLICT_WITH_BATCH
+            continue
+        running_end = end_time
+
+    return conflicts
@@ -1,13 +1,33 @@
-from typing import List, Optional
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
+from app.core.config import SHIFT_INTERVAL_INDEX_ENABLED
+from app.core.exceptions import InvalidCursorError
+from app.core.pagination import decode_cursor, encode_cursor
 from app.db.models import EmployeeDB
-from app.repositories.employees import EmployeeRepository
+from app.repositories.employees import EMPLOYEE_ROW_FIELDS, EmployeeRepository
+from app.repositories.rollup import DailyRollupRepository
+from app.repositories.versions import TableVersionRepository
 from app.schemas.employees import (
     EmployeeCreate,
     EmployeeUpdate,
     EmployeeResponse,
+    EmployeePageData,
+    EmployeeRow,
+    EmployeeImportRejection,
+    EmployeeImportResult,
+    employee_rows_adapter,
 )
+from app.services.analytics import analytics_cache
+from app.services.availability import availability_index, availability_mask_for, window_mask
+from app.services.interval_index import shift_interval_index
+from app.services.shift_events import employee_deleted_event, shift_event_broker
 
 
 class EmployeeService:
@@ -16,14 +36,24 @@ class EmployeeService:
         self.employee_repository: EmployeeRepository = EmployeeRepository(
             db=db_session
         )
+        self.rollup_repository: DailyRollupRepository = DailyRollupRepository(
+            db=db_session
+        )
+        self.version_repository: TableVersionRepository = TableVersionRepository(
+            db=db_session
+        )
 
-    def list_employees(self) -> List[EmployeeResponse]:
-        employee_db_list: List[EmployeeDB] = self.employee_repository.find_all()
-        employee_response_list: List[EmployeeResponse] = [
-            EmployeeResponse.model_validate(employee_db)
-            for employee_db in employee_db_list
-        ]
-        return employee_response_list
+    def list_employees(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> EmployeePageData:
+        # Fetch one extra row to learn whether another page exists
+        employee_rows: List[Row] = self.employee_repository.find_all_rows(
+            after_id=decode_employee_cursor(cursor),
+            limit=limit + 1,
+        )
+        return build_employee_page(employee_rows=employee_rows, limit=limit)
 
     def get_employee(self, employee_id: int) -> Optional[EmployeeResponse]:
         employee_db: Optional[EmployeeDB] = self.employee_repository.find_by_id(
@@ -39,9 +69,7 @@ class EmployeeService:
 
     def create_employee(self, employee_in: EmployeeCreate) -> EmployeeResponse:
         employee_db: EmployeeDB = EmployeeDB(
-            name=employee_in.name,
-            role=employee_in.role,
-            availability=employee_in.availability,
+            **self.build_employee_row(employee_in=employee_in)
         )
 
         saved_employee_db: EmployeeDB = self.employee_repository.save(
@@ -53,6 +81,58 @@ class EmployeeService:
         )
         return employee_response
 
+    def import_employees(
+        self,
+        upload: BinaryIO,
+        file_format: str,
+        batch_size: int,
+    ) -> EmployeeImportResult:
+        """
+        Stream-parse a CSV or NDJSON upload, validate each row against
+        EmployeeCreate and insert valid rows batch_size at a time, one
+        transaction per batch. Only the current batch is held in memory.
+        """
+        if file_format == "csv":
+            records = _iter_csv_records(upload)
+        elif file_format == "ndjson":
+            records = _iter_ndjson_records(upload)
+        else:
+            raise ValueError("Invalid format; use csv or ndjson")
+
+        accepted: int = 0
+        rejected: int = 0
+        rejections: List[EmployeeImportRejection] = []
+        batch: List[Dict[str, Any]] = []
+
+        for line, record, error in records:
+            if error is None:
+                try:
+                    employee_in = EmployeeCreate.model_validate(record)
+                except ValidationError as exc:
+                    error = _format_validation_error(exc)
+
+            if error is not None:
+                rejected += 1
+                if len(rejections) < MAX_REPORTED_IMPORT_REJECTIONS:
+                    rejections.append(EmployeeImportRejection(line=line, message=error))
+                continue
+
+            batch.append(self.build_employee_row(employee_in=employee_in))
+            if len(batch) >= batch_size:
+                self.employee_repository.save_all(employee_rows=batch)
+                accepted += len(batch)
+                batch = []
+
+        if batch:
+            self.employee_repository.save_all(employee_rows=batch)
+            accepted += len(batch)
+
+        return EmployeeImportResult(
+            accepted=accepted,
+            rejected=rejected,
+            rejections=rejections,
+        )
+
     def update_employee(
         self,
         employee_id: int,
@@ -72,16 +152,62 @@ class EmployeeService:
 
         if employee_in.availability is not None:
             existing_employee_db.availability = employee_in.availability
+            existing_employee_db.availability_mask = availability_mask_for(
+                employee_in.availability
+            )
 
         updated_employee_db: EmployeeDB = self.employee_repository.save(
             employee=existing_employee_db
         )
 
+        # cached analytics rows carry the employee's name
+        analytics_cache.clear()
+
         employee_response: EmployeeResponse = EmployeeResponse.model_validate(
             updated_employee_db
         )
         return employee_response
 
+    def find_available_employees(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        include_unknown: bool = False,
+    ) -> List[EmployeeRow]:
+        """
+        Employees whose availability covers all of [start_time, end_time)
+        and who have no shift overlapping it, ordered by id. Employees
+        whose availability is empty or unreadable are left out unless
+        include_unknown is set.
+        """
+        employees_version = self.version_repository.get_versions(["employees"])["employees"]
+        masks: List[bytes] = availability_index.matching_masks(
+            required_mask=window_mask(start_time=start_time, end_time=end_time),
+            version=employees_version,
+            loader=self.employee_repository.find_distinct_availability_masks,
+        )
+        employee_rows: List[Row] = self.employee_repository.find_available_rows(
+            masks=masks,
+            start_time=start_time,
+            end_time=end_time,
+            include_unknown=include_unknown,
+        )
+        return employee_rows_adapter.validate_python(
+            [dict(zip(EMPLOYEE_ROW_FIELDS, row)) for row in employee_rows]
+        )
+
+    def build_employee_row(self, employee_in: EmployeeCreate) -> Dict[str, Any]:
+        """
+        Column values for a new employees row, shared by the single create
+        and import paths.
+        """
+        return {
+            "name": employee_in.name,
+            "role": employee_in.role,
+            "availability": employee_in.availability,
+            "availability_mask": availability_mask_for(employee_in.availability),
+        }
+
     def delete_employee(self, employee_id: int) -> bool:
         existing_employee_db: Optional[EmployeeDB] = (
             self.employee_repository.find_by_id(employee_id=employee_id)
@@ -89,5 +215,88 @@ class EmployeeService:
         if existing_employee_db is None:
             return False
 
+        self.rollup_repository.delete_for_employee(employee_id=employee_id)
         self.employee_repository.delete(employee=existing_employee_db)
+
+        analytics_cache.clear()
+
+        # the employee's shifts were removed by the cascade
+        if SHIFT_INTERVAL_INDEX_ENABLED:
+            shift_interval_index.invalidate(employee_id=employee_id)
+
+        shift_event_broker.publish([employee_deleted_event(employee_id)])
         return True
+
+
+def decode_employee_cursor(cursor: Optional[str]) -> Optional[int]:
+    if cursor is None:
+        return None
+    (after_id,) = decode_cursor(cursor, size=1)
+    if not isinstance(after_id, int):
+        raise InvalidCursorError(cursor=cursor)
+    return after_id
+
+
+def build_employee_page(employee_rows: List[Row], limit: int) -> EmployeePageData:
+    # employee_rows holds up to limit + 1 rows; the extra one only
+    # signals that another page exists
+    has_more: bool = len(employee_rows) > limit
+    employee_rows = employee_rows[:limit]
+
+    # One validation call for the whole page, returning plain dicts
+    items = employee_rows_adapter.validate_python(
+        [dict(zip(EMPLOYEE_ROW_FIELDS, row)) for row in employee_rows]
+    )
+
+    next_cursor: Optional[str] = None
+    if has_more:
+        next_cursor = encode_cursor([employee_rows[-1].id])
+    return {"items": items, "next_cursor": next_cursor}
+
+
+# Cap on rejection details returned by an import; the count is always exact
+MAX_REPORTED_IMPORT_REJECTIONS = 1000
+
+# (line number, parsed record, parse error)
+ImportRecord = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def _iter_csv_records(upload: BinaryIO) -> Iterator[ImportRecord]:
+    text_stream = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+    reader = csv.DictReader(text_stream)
+    try:
+        for row in reader:
+            # blank cells mean "not provided" for optional fields
+            record = {
+                key: (value if value != "" else None)
+                for key, value in row.items()
+                if key is not None
+            }
+            yield reader.line_num, record, None
+    except (csv.Error, UnicodeDecodeError) as exc:
+        yield reader.line_num, None, f"Unreadable CSV: {exc}"
+    finally:
+        # leave the underlying upload open for FastAPI to close
+        text_stream.detach()
+
+
+def _iter_ndjson_records(upload: BinaryIO) -> Iterator[ImportRecord]:
+    for line_number, raw_line in enumerate(upload, start=1):
+        if not raw_line.strip():
+            continue
+        try:
+            record = json.loads(raw_line)
+        except ValueError as exc:
+            yield line_number, None, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Each line must be a JSON object"
+            continue
+        yield line_number, record, None
+
+
+def _format_validation_error(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    )
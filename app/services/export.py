@@ -0,0 +1,122 @@
+import csv
+from datetime import date, datetime
+from enum import Enum
+import io
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+
+import orjson
+from sqlalchemy.orm import Session
+
+from app.core.config import ANALYTICS_USE_ROLLUP, EXPORT_BATCH_SIZE
+from app.db.base import SessionLocal
+from app.repositories.rollup import DailyRollupRepository
+from app.repositories.schedule import SHIFT_ROW_FIELDS, ShiftRepository
+
+# format -> media type of the response body
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+DAILY_TOTAL_FIELDS = ("employee_id", "employee_name", "day", "total_shifts", "total_hours")
+
+
+class ExportService:
+    """
+    Streams shifts and per-day analytics as NDJSON or CSV chunks.
+
+    Each export opens its own session when iteration starts and closes it
+    when iteration ends, because the response body is produced after the
+    route (and its request-scoped session) has returned. Rows are fetched
+    and encoded batch_size at a time, so memory does not grow with the
+    size of the export.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> None:
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+
+    def export_shifts(self, file_format: str, **filters: Any) -> Iterator[bytes]:
+        database_session: Session = self.session_factory()
+        try:
+            shift_repository = ShiftRepository(db=database_session)
+            rows = shift_repository.stream_rows(batch_size=self.batch_size, **filters)
+            yield from self._encode(rows, SHIFT_ROW_FIELDS, file_format)
+        finally:
+            database_session.close()
+
+    def export_daily_totals(
+        self,
+        file_format: str,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[List[int]] = None,
+    ) -> Iterator[bytes]:
+        database_session: Session = self.session_factory()
+        try:
+            if ANALYTICS_USE_ROLLUP:
+                rows = DailyRollupRepository(db=database_session).stream_daily_totals(
+                    start_date, end_date, employee_ids=employee_ids, batch_size=self.batch_size
+                )
+            else:
+                rows = ShiftRepository(db=database_session).stream_daily_totals_by_employee(
+                    start_date, end_date, employee_ids=employee_ids, batch_size=self.batch_size
+                )
+            values = (
+                (
+                    row.employee_id,
+                    row.employee_name,
+                    row.day,
+                    row.total_shifts,
+                    (row.total_seconds or 0) / 3600.0,
+                )
+                for row in rows
+            )
+            yield from self._encode(values, DAILY_TOTAL_FIELDS, file_format)
+        finally:
+            database_session.close()
+
+    def _encode(
+        self,
+        rows: Iterable[Sequence[Any]],
+        fields: Sequence[str],
+        file_format: str,
+    ) -> Iterator[bytes]:
+        rows = iter(rows)
+        if file_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(fields)
+            # the header goes out on its own so the first byte is immediate
+            yield buffer.getvalue().encode("utf-8")
+            while True:
+                batch = list(islice(rows, self.batch_size))
+                if not batch:
+                    return
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows([_csv_value(value) for value in row] for row in batch)
+                yield buffer.getvalue().encode("utf-8")
+
+        while True:
+            batch = list(islice(rows, self.batch_size))
+            if not batch:
+                return
+            yield b"".join(
+                orjson.dumps(dict(zip(fields, row)), option=orjson.OPT_APPEND_NEWLINE)
+                for row in batch
+            )
+
+
+def _csv_value(value: Any) -> Any:
+    # same text as the JSON encoding of the value
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
@@ -0,0 +1,116 @@
+from bisect import bisect_left
+from datetime import datetime, timedelta
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# (start_time, end_time, shift_id)
+Interval = Tuple[datetime, datetime, int]
+
+
+class EmployeeIntervalIndex:
+    """
+    Shift intervals of one employee, kept sorted by start time.
+
+    Any interval overlapping [start, end) must begin after
+    start - longest_duration and before end, so a query is two bisections
+    plus a scan over that narrow slice: O(log n + k) however long the
+    employee's history is.
+    """
+
+    def __init__(self, intervals: Iterable[Interval] = ()) -> None:
+        self.entries: List[Interval] = sorted(intervals)
+        self.starts: List[datetime] = [entry[0] for entry in self.entries]
+        self.longest_duration: timedelta = max(
+            (end - start for start, end, _ in self.entries),
+            default=timedelta(0),
+        )
+
+    def add(self, shift_id: int, start_time: datetime, end_time: datetime) -> None:
+        entry: Interval = (start_time, end_time, shift_id)
+        position = bisect_left(self.entries, entry)
+        self.entries.insert(position, entry)
+        self.starts.insert(position, start_time)
+        self.longest_duration = max(self.longest_duration, end_time - start_time)
+
+    def remove(self, shift_id: int) -> None:
+        for position, entry in enumerate(self.entries):
+            if entry[2] == shift_id:
+                del self.entries[position]
+                del self.starts[position]
+                return
+
+    def overlapping(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        exclude_shift_id: Optional[int] = None,
+    ) -> List[int]:
+        low = bisect_left(self.starts, start_time - self.longest_duration)
+        high = bisect_left(self.starts, end_time)
+        return [
+            shift_id
+            for entry_start, entry_end, shift_id in self.entries[low:high]
+            if entry_end > start_time and shift_id != exclude_shift_id
+        ]
+
+
+class ShiftIntervalIndex:
+    """
+    Lazily populated map of employee_id -> EmployeeIntervalIndex.
+
+    An employee's intervals are loaded from the database the first time
+    they are checked, then kept current by ShiftService after each commit.
+    """
+
+    def __init__(self) -> None:
+        self._employees: Dict[int, EmployeeIntervalIndex] = {}
+        self._lock = threading.Lock()
+
+    def overlapping(
+        self,
+        employee_id: int,
+        start_time: datetime,
+        end_time: datetime,
+        loader: Callable[[int], Iterable[Interval]],
+        exclude_shift_id: Optional[int] = None,
+    ) -> List[int]:
+        with self._lock:
+            employee_index = self._employees.get(employee_id)
+            if employee_index is None:
+                employee_index = EmployeeIntervalIndex(loader(employee_id))
+                self._employees[employee_id] = employee_index
+            return employee_index.overlapping(
+                start_time=start_time,
+                end_time=end_time,
+                exclude_shift_id=exclude_shift_id,
+            )
+
+    def add(
+        self,
+        employee_id: int,
+        shift_id: int,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> None:
+        with self._lock:
+            employee_index = self._employees.get(employee_id)
+            # not loaded yet: the next check reads it fresh from the database
+            if employee_index is not None:
+                employee_index.add(shift_id, start_time, end_time)
+
+    def remove(self, employee_id: int, shift_id: int) -> None:
+        with self._lock:
+            employee_index = self._employees.get(employee_id)
+            if employee_index is not None:
+                employee_index.remove(shift_id)
+
+    def invalidate(self, employee_id: int) -> None:
+        with self._lock:
+            self._employees.pop(employee_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._employees.clear()
+
+
+shift_interval_index = ShiftIntervalIndex()
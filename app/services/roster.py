@@ -0,0 +1,350 @@
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+import heapq
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core.config import SCHEDULE_MAX_WEEKLY_HOURS, SCHEDULE_MIN_REST_HOURS
+from app.db.enums import ShiftType
+from app.db.models import MAX_SHIFT_DURATION
+from app.repositories.employees import EmployeeRepository
+from app.repositories.schedule import ShiftRepository
+from app.schemas.schedule import (
+    RosterDemand,
+    RosterGenerateResponse,
+    RosterShortfall,
+    ShiftCreate,
+)
+from app.services.availability import decode_mask, window_mask
+from app.services.schedule import ShiftService
+from app.services.weeks import week_of
+
+# start hour and length in hours of each shift type; the same hours as the
+# morning / afternoon / night periods of availability text
+SHIFT_TYPE_HOURS: Dict[ShiftType, Tuple[int, int]] = {
+    ShiftType.MORNING: (6, 8),
+    ShiftType.AFTERNOON: (14, 8),
+    ShiftType.NIGHT: (22, 8),
+}
+
+
+def shift_window(shift_date: date, shift_type: ShiftType) -> Tuple[datetime, datetime]:
+    start_hour, length_hours = SHIFT_TYPE_HOURS[shift_type]
+    start_time = datetime.combine(shift_date, datetime.min.time()) + timedelta(hours=start_hour)
+    return start_time, start_time + timedelta(hours=length_hours)
+
+
+class RosterSlot:
+    """One (day, shift type, role) to staff, and who is on it so far."""
+
+    __slots__ = ("shift_date", "shift", "role", "start_time", "end_time", "seconds", "week", "required", "existing", "assigned")
+
+    def __init__(self, shift_date: date, shift: ShiftType, role: str, required: int) -> None:
+        self.shift_date = shift_date
+        self.shift = shift
+        self.role = role
+        self.start_time, self.end_time = shift_window(shift_date, shift)
+        self.seconds = int((self.end_time - self.start_time).total_seconds())
+        self.week = week_of(shift_date)
+        self.required = required
+        # employees already scheduled on it before this run
+        self.existing: Set[int] = set()
+        self.assigned: List[int] = []
+
+    @property
+    def missing(self) -> int:
+        return self.required - len(self.existing) - len(self.assigned)
+
+
+class RosterEmployee:
+    """
+    An employee's commitments while solving: busy intervals (existing
+    shifts and assignments, merged, sorted and disjoint, so ends are
+    sorted too) and seconds per week.
+    """
+
+    __slots__ = ("id", "role", "mask", "starts", "ends", "week_seconds", "assigned_seconds")
+
+    def __init__(self, employee_id: int, role: str, mask: Optional[int]) -> None:
+        self.id = employee_id
+        self.role = role
+        self.mask = mask
+        self.starts: List[datetime] = []
+        self.ends: List[datetime] = []
+        self.week_seconds: Dict[date, int] = defaultdict(int)
+        self.assigned_seconds = 0
+
+    def add_existing(self, start_time: datetime, end_time: datetime) -> None:
+        # imported data may overlap; fold it into the neighbouring runs
+        position = bisect_left(self.starts, start_time)
+        if position > 0 and self.ends[position - 1] >= start_time:
+            position -= 1
+            start_time = self.starts[position]
+        last = position
+        while last < len(self.starts) and self.starts[last] <= end_time:
+            end_time = max(end_time, self.ends[last])
+            last += 1
+        self.starts[position:last] = [start_time]
+        self.ends[position:last] = [end_time]
+
+
+class RosterSolver:
+    """
+    Greedy-plus-repair assignment of employees to roster slots.
+
+    Greedy: slots are filled in start-time order, each by the feasible
+    employees with the fewest hours that week (then the fewest hours this
+    run, then the lowest id), so work spreads evenly. Feasible means the
+    role matches, availability covers the shift, the shift keeps
+    min_rest clear of every other shift and the week stays within
+    max_week_seconds.
+
+    Repair: for a slot left short, an employee blocked only by one of
+    their own assignments gives that assignment to someone else who can
+    take it, and takes the short slot instead.
+
+    Availability is tested once per distinct (mask, shift window) pair,
+    and rest and overlap with one bisection into the employee's busy
+    list, so a slot costs O(pool) cheap checks.
+    """
+
+    def __init__(
+        self,
+        employees: Iterable[RosterEmployee],
+        slots: List[RosterSlot],
+        min_rest: timedelta,
+        max_week_seconds: int,
+        include_unknown: bool = False,
+    ) -> None:
+        self.employees_by_role: Dict[str, List[RosterEmployee]] = defaultdict(list)
+        for employee in employees:
+            self.employees_by_role[employee.role].append(employee)
+        self.slots = sorted(slots, key=lambda slot: (slot.start_time, slot.role, slot.shift_date))
+        self.min_rest = min_rest
+        self.max_week_seconds = max_week_seconds
+        self.include_unknown = include_unknown
+        # employee id -> slots they were assigned to in this run
+        self.assignments: Dict[int, List[RosterSlot]] = defaultdict(list)
+        self._pools: Dict[Tuple[str, int], List[RosterEmployee]] = {}
+        # slot -> best employee who could take one more place on it, or
+        # None; only valid until the next assignment is moved
+        self._replacements: Dict[RosterSlot, Optional[RosterEmployee]] = {}
+
+    def solve(self) -> None:
+        for slot in self.slots:
+            missing = slot.missing
+            if missing > 0:
+                for employee in self._best(slot, missing):
+                    self._assign(employee, slot)
+        for slot in self.slots:
+            while slot.missing > 0 and self._repair(slot):
+                pass
+
+    def shortfalls(self) -> List[RosterSlot]:
+        return [slot for slot in self.slots if slot.missing > 0]
+
+    def _pool(self, slot: RosterSlot) -> List[RosterEmployee]:
+        # employees of the slot's role whose availability covers its window
+        required_mask = window_mask(start_time=slot.start_time, end_time=slot.end_time)
+        key = (slot.role, required_mask)
+        pool = self._pools.get(key)
+        if pool is None:
+            covered: Dict[Optional[int], bool] = {None: self.include_unknown}
+            pool = []
+            for employee in self.employees_by_role.get(slot.role, ()):
+                if employee.mask not in covered:
+                    covered[employee.mask] = employee.mask & required_mask == required_mask
+                if covered[employee.mask]:
+                    pool.append(employee)
+            self._pools[key] = pool
+        return pool
+
+    def _feasible(self, employee: RosterEmployee, slot: RosterSlot) -> bool:
+        if employee.week_seconds[slot.week] + slot.seconds > self.max_week_seconds:
+            return False
+        # the last busy interval starting before end + rest is the only one
+        # that can reach into start - rest
+        position = bisect_left(employee.starts, slot.end_time + self.min_rest)
+        return position == 0 or employee.ends[position - 1] + self.min_rest <= slot.start_time
+
+    def _score(self, employee: RosterEmployee, slot: RosterSlot) -> Tuple[int, int, int]:
+        return (employee.week_seconds[slot.week], employee.assigned_seconds, employee.id)
+
+    def _best(self, slot: RosterSlot, count: int) -> List[RosterEmployee]:
+        taken: Set[int] = slot.existing.union(slot.assigned)
+        return heapq.nsmallest(
+            count,
+            (
+                employee
+                for employee in self._pool(slot)
+                if employee.id not in taken and self._feasible(employee, slot)
+            ),
+            key=lambda employee: self._score(employee, slot),
+        )
+
+    def _assign(self, employee: RosterEmployee, slot: RosterSlot) -> None:
+        position = bisect_left(employee.starts, slot.start_time)
+        employee.starts.insert(position, slot.start_time)
+        employee.ends.insert(position, slot.end_time)
+        employee.week_seconds[slot.week] += slot.seconds
+        employee.assigned_seconds += slot.seconds
+        slot.assigned.append(employee.id)
+        self.assignments[employee.id].append(slot)
+
+    def _unassign(self, employee: RosterEmployee, slot: RosterSlot) -> None:
+        position = bisect_left(employee.starts, slot.start_time)
+        del employee.starts[position]
+        del employee.ends[position]
+        employee.week_seconds[slot.week] -= slot.seconds
+        employee.assigned_seconds -= slot.seconds
+        slot.assigned.remove(employee.id)
+        self.assignments[employee.id].remove(slot)
+
+    def _repair(self, slot: RosterSlot) -> bool:
+        """Fill one place of slot by moving another assignment; False if none works."""
+        taken: Set[int] = slot.existing.union(slot.assigned)
+        reach = timedelta(days=1) + self.min_rest
+        for employee in self._pool(slot):
+            if employee.id in taken:
+                continue
+            # only assignments in the same week or within rest of the slot
+            # can be what blocks it
+            blockers = [
+                other
+                for other in self.assignments.get(employee.id, ())
+                if other.week == slot.week or abs(other.start_time - slot.start_time) < reach
+            ]
+            for other in blockers:
+                # who could take other does not depend on employee, who is
+                # on it, so the answer holds until something is moved
+                if other not in self._replacements:
+                    self._replacements[other] = next(iter(self._best(other, 1)), None)
+                replacement = self._replacements[other]
+                if replacement is None:
+                    continue
+                self._unassign(employee, other)
+                if self._feasible(employee, slot):
+                    self._assign(replacement, other)
+                    self._assign(employee, slot)
+                    self._replacements.clear()
+                    return True
+                self._assign(employee, other)
+        return False
+
+
+class RosterService:
+    """
+    POST /schedule/generate: turns per-day demand into shifts. Reads the
+    employees and the shifts around the range in a fixed number of
+    queries, solves in memory, and writes every new shift through the
+    bulk insert path in one transaction. Shifts already scheduled count
+    towards the headcount, so generating a range twice adds nothing.
+    """
+
+    def __init__(self, db_session: Session) -> None:
+        self.db_session: Session = db_session
+        self.employee_repository: EmployeeRepository = EmployeeRepository(
+            db=db_session
+        )
+        self.shift_repository: ShiftRepository = ShiftRepository(
+            db=db_session
+        )
+        self.shift_service: ShiftService = ShiftService(db_session=db_session)
+
+    def generate(
+        self,
+        start_date: date,
+        end_date: date,
+        demand: List[RosterDemand],
+        employee_ids: Optional[List[int]] = None,
+        include_unknown: bool = False,
+    ) -> RosterGenerateResponse:
+        slots: Dict[Tuple[date, ShiftType, str], RosterSlot] = {}
+        day = start_date
+        while day <= end_date:
+            for item in demand:
+                if item.weekdays is None or day.weekday() in item.weekdays:
+                    key = (day, item.shift, item.role)
+                    if key in slots:
+                        slots[key].required += item.headcount
+                    else:
+                        slots[key] = RosterSlot(day, item.shift, item.role, item.headcount)
+            day += timedelta(days=1)
+
+        employee_rows: List[Row] = self.employee_repository.find_roster_rows(
+            roles={item.role for item in demand},
+            employee_ids=employee_ids,
+        )
+        employees: Dict[int, RosterEmployee] = {
+            row.id: RosterEmployee(row.id, row.role, decode_mask(row.availability_mask))
+            for row in employee_rows
+        }
+
+        # Whole weeks for the hour caps, and far enough either side for
+        # rest and overlap with shifts just outside the range
+        min_rest = timedelta(hours=SCHEDULE_MIN_REST_HOURS)
+        first_start, _ = shift_window(start_date, ShiftType.MORNING)
+        _, last_end = shift_window(end_date, ShiftType.NIGHT)
+        span_start: date = min(
+            week_of(start_date),
+            (first_start - min_rest - MAX_SHIFT_DURATION).date() - timedelta(days=1),
+        )
+        span_end: date = max(
+            week_of(end_date) + timedelta(days=6),
+            (last_end + min_rest).date() + timedelta(days=1),
+        )
+        for span in self.shift_repository.find_spans(
+            start_date=span_start,
+            end_date=span_end,
+            employee_ids=employee_ids,
+        ):
+            employee = employees.get(span.employee_id)
+            if employee is None:
+                continue
+            employee.add_existing(span.start_time, span.end_time)
+            employee.week_seconds[week_of(span.shift_date)] += span.duration_seconds or 0
+            slot = slots.get((span.shift_date, span.shift, employee.role))
+            if slot is not None:
+                slot.existing.add(employee.id)
+
+        solver = RosterSolver(
+            employees=employees.values(),
+            slots=list(slots.values()),
+            min_rest=min_rest,
+            max_week_seconds=int(SCHEDULE_MAX_WEEKLY_HOURS * 3600),
+            include_unknown=include_unknown,
+        )
+        solver.solve()
+
+        shift_rows = [
+            self.shift_service.build_shift_row(
+                shift_in=ShiftCreate(
+                    employee_id=employee_id,
+                    shift_date=slot.shift_date,
+                    shift=slot.shift,
+                    start_time=slot.start_time,
+                    end_time=slot.end_time,
+                )
+            )
+            for slot in solver.slots
+            for employee_id in sorted(slot.assigned)
+        ]
+        created_shifts = self.shift_service.insert_shift_rows(shift_rows=shift_rows)
+
+        return RosterGenerateResponse(
+            created=len(created_shifts),
+            shifts=created_shifts,
+            unfilled=[
+                RosterShortfall(
+                    shift_date=slot.shift_date,
+                    shift=slot.shift,
+                    role=slot.role,
+                    required=slot.required,
+                    assigned=slot.required - slot.missing,
+                )
+                for slot in solver.shortfalls()
+            ],
+        )
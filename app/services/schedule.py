@@ -1,17 +1,40 @@
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 from app.core import exceptions
+from app.core.pagination import decode_cursor, encode_cursor
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
-from app.db.models import ShiftDB, EmployeeDB
-from app.repositories.schedule import ShiftRepository
-from app.repositories.employees import EmployeeRepository
+from app.core.config import (
+    ANALYTICS_USE_ROLLUP,
+    SCHEDULE_MAX_WEEKLY_HOURS,
+    SHIFT_INTERVAL_INDEX_ENABLED,
+)
+from app.db.models import MAX_SHIFT_DURATION, ShiftDB, EmployeeDB
+from app.repositories.schedule import SHIFT_ROW_FIELDS, ShiftRepository
+from app.repositories.employees import EMPLOYEE_ROW_FIELDS, EmployeeRepository
+from app.repositories.rollup import DailyRollupRepository
+from app.repositories.versions import TableVersionRepository
+from app.schemas.employees import EmployeeResponse
 from app.schemas.schedule import (
     ShiftCreate,
     ShiftUpdate,
     ShiftResponse,
+    ShiftPageData,
+    ShiftBulkItemResult,
+    ShiftBulkResponse,
+    ShiftCandidate,
+    ShiftCandidates,
+    ShiftCopyConflict,
+    ShiftCopyResult,
+    shift_rows_adapter,
 )
+from app.services.analytics import analytics_cache
+from app.services.availability import availability_index, window_mask
+from app.services.conflicts import find_batch_conflicts
+from app.services.interval_index import shift_interval_index
+from app.services.shift_events import shift_event, shift_event_broker, shift_range_event
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +47,17 @@ class ShiftService:
         self.employee_repository = EmployeeRepository(
             db=db_session
         )
+        self.rollup_repository: DailyRollupRepository = DailyRollupRepository(
+            db=db_session
+        )
+        self.version_repository: TableVersionRepository = TableVersionRepository(
+            db=db_session
+        )
 
     def list_shifts(
         self,
+        limit: int,
+        cursor: Optional[str] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         employee_id: Optional[int] = None,
@@ -34,8 +65,9 @@ class ShiftService:
         start_datetime_to: Optional[datetime] = None,
         end_datetime_from: Optional[datetime] = None,
         end_datetime_to: Optional[datetime] = None,
-    ) -> List[ShiftResponse]:
-        shift_db_list: List[ShiftDB] = self.shift_repository.find_all(
+    ) -> ShiftPageData:
+        # Fetch one extra row to learn whether another page exists
+        shift_rows: List[Row] = self.shift_repository.find_all_rows(
             start_date=start_date,
             end_date=end_date,
             employee_id=employee_id,
@@ -43,13 +75,10 @@ class ShiftService:
             start_datetime_to=start_datetime_to,
             end_datetime_from=end_datetime_from,
             end_datetime_to=end_datetime_to,
+            after=decode_shift_cursor(cursor),
+            limit=limit + 1,
         )
-
-        shift_response_list: List[ShiftResponse] = [
-            ShiftResponse.model_validate(shift_db)
-            for shift_db in shift_db_list
-        ]
-        return shift_response_list
+        return build_shift_page(shift_rows=shift_rows, limit=limit)
 
     def get_shift(self, shift_id: int) -> Optional[ShiftResponse]:
         shift_db: Optional[ShiftDB] = self.shift_repository.find_by_id(
@@ -61,6 +90,76 @@ class ShiftService:
         shift_response: ShiftResponse = ShiftResponse.model_validate(shift_db)
         return shift_response
 
+    def find_replacement_candidates(
+        self,
+        shift_id: int,
+        limit: int,
+        same_role: bool = True,
+        include_unknown: bool = False,
+    ) -> Optional[ShiftCandidates]:
+        """
+        Ranked cover for a shift: employees other than the one assigned
+        whose availability covers the shift and who have no overlapping
+        shift. Runs a fixed number of queries whatever the headcount: the
+        shift, the employees table version (the distinct masks are only
+        re-read when it moved) and one ranking query, which computes each
+        employee's hours this week from the rollup (or the shifts table
+        when ANALYTICS_USE_ROLLUP is off). None if the shift does not exist.
+        """
+        shift_db: Optional[ShiftDB] = self.shift_repository.find_by_id(
+            shift_id=shift_id
+        )
+        if shift_db is None:
+            return None
+
+        employees_version = self.version_repository.get_versions(["employees"])["employees"]
+        masks: List[bytes] = availability_index.matching_masks(
+            required_mask=window_mask(start_time=shift_db.start_time, end_time=shift_db.end_time),
+            version=employees_version,
+            loader=self.employee_repository.find_distinct_availability_masks,
+        )
+
+        week_start: date = shift_db.shift_date - timedelta(days=shift_db.shift_date.weekday())
+        week_end: date = week_start + timedelta(days=6)
+        week_repository = self.rollup_repository if ANALYTICS_USE_ROLLUP else self.shift_repository
+        shift_seconds: int = _duration_seconds(shift_db.start_time, shift_db.end_time)
+        # ranked over-limit if the shift would take them past the maximum
+        max_week_seconds: int = int(SCHEDULE_MAX_WEEKLY_HOURS * 3600) - shift_seconds
+
+        candidate_rows: List[Row] = self.employee_repository.find_replacement_candidates(
+            masks=masks,
+            start_time=shift_db.start_time,
+            end_time=shift_db.end_time,
+            week_seconds=week_repository.select_seconds_for_employee(
+                EmployeeDB.id, week_start, week_end
+            ),
+            max_week_seconds=max_week_seconds,
+            limit=limit,
+            role=shift_db.employee.role if shift_db.employee is not None else None,
+            same_role=same_role,
+            exclude_employee_id=shift_db.employee_id,
+            include_unknown=include_unknown,
+        )
+        candidates: List[ShiftCandidate] = []
+        for row in candidate_rows:
+            week_seconds: int = row.week_seconds or 0
+            candidates.append(
+                ShiftCandidate(
+                    employee=EmployeeResponse.model_validate(
+                        dict(zip(EMPLOYEE_ROW_FIELDS, row))
+                    ),
+                    role_match=bool(row.role_match),
+                    availability_known=bool(row.availability_known),
+                    week_hours=week_seconds / 3600.0,
+                    projected_week_hours=(week_seconds + shift_seconds) / 3600.0,
+                    exceeds_max_weekly_hours=week_seconds > max_week_seconds,
+                )
+            )
+        return ShiftCandidates(
+            shift=ShiftResponse.model_validate(shift_db),
+            candidates=candidates,
+        )
+
     def create_shift(self, shift_in: ShiftCreate) -> ShiftResponse:
         
         self.validate_shift_times(start_time=shift_in.start_time, end_time=shift_in.end_time)
@@ -72,70 +171,314 @@ class ShiftService:
         if employee is None:
             raise exceptions.EmployeeNotFoundError(employee_id=shift_in.employee_id)
         
-        overlapping_shifts = self.shift_repository.find_overlapping_shifts_for_employee(
+        overlapping_shift_ids = self.find_overlapping_shift_ids(
             employee_id=shift_in.employee_id,
-            date_value=shift_in.shift_date,
             start_time=shift_in.start_time,
             end_time=shift_in.end_time,
         )
 
-        if len(overlapping_shifts) > 0:
+        if len(overlapping_shift_ids) > 0:
             raise exceptions.ShiftConflictError(
                 message=(
                     "Employee already has a shift that overlaps with the requested "
-                    "time window on this date"
+                    "time window"
                 )
             )
 
-        shift_db: ShiftDB = ShiftDB(
-            employee_id=shift_in.employee_id,
-            shift_date=shift_in.shift_date,
-            shift=shift_in.shift,
-            note=shift_in.note,
-            start_time=shift_in.start_time,
-            end_time=shift_in.end_time,
+        shift_db: ShiftDB = ShiftDB(**self.build_shift_row(shift_in=shift_in))
+
+        # Rollup deltas are written in the same transaction as the shift
+        self.rollup_repository.apply_deltas(
+            delta_rows=[_rollup_delta_for_shift(shift_db, sign=1)]
         )
 
         saved_shift_db: ShiftDB = self.shift_repository.save(shift=shift_db)
 
+        analytics_cache.invalidate_dates([saved_shift_db.shift_date])
+
+        if SHIFT_INTERVAL_INDEX_ENABLED:
+            shift_interval_index.add(
+                employee_id=saved_shift_db.employee_id,
+                shift_id=saved_shift_db.id,
+                start_time=saved_shift_db.start_time,
+                end_time=saved_shift_db.end_time,
+            )
+
         shift_response: ShiftResponse = ShiftResponse.model_validate(
             saved_shift_db
         )
+
+        # Published only now that the write has committed
+        shift_event_broker.publish([shift_event("upsert", shift_response)])
         return shift_response
 
+    def create_shifts_bulk(self, shifts_in: List[ShiftCreate]) -> ShiftBulkResponse:
+        """
+        Create many shifts in one transaction. Items that fail validation,
+        reference a missing employee or overlap another shift are rejected
+        individually; the rest are inserted together.
+        """
+        rejections: Dict[int, str] = {}
+
+        for position, shift_in in enumerate(shifts_in):
+            try:
+                self.validate_shift_times(
+                    start_time=shift_in.start_time,
+                    end_time=shift_in.end_time,
+                )
+            except exceptions.ShiftConflictError as exc:
+                rejections[position] = exc.message
+
+        # One query resolves every employee referenced by the batch
+        existing_employee_ids: Set[int] = self.employee_repository.find_existing_ids(
+            employee_ids=[shift_in.employee_id for shift_in in shifts_in]
+        )
+        for position, shift_in in enumerate(shifts_in):
+            if position not in rejections and shift_in.employee_id not in existing_employee_ids:
+                rejections[position] = exceptions.EmployeeNotFoundError(
+                    employee_id=shift_in.employee_id
+                ).message
+
+        candidate_positions: List[int] = [
+            position for position in range(len(shifts_in)) if position not in rejections
+        ]
+        if candidate_positions:
+            candidates = [
+                (
+                    shifts_in[position].employee_id,
+                    shifts_in[position].start_time,
+                    shifts_in[position].end_time,
+                )
+                for position in candidate_positions
+            ]
+            # One query fetches every existing shift the batch could touch
+            existing_intervals = self.shift_repository.find_intervals_for_employees(
+                employee_ids={employee_id for employee_id, _, _ in candidates},
+                start_time=min(start_time for _, start_time, _ in candidates),
+                end_time=max(end_time for _, _, end_time in candidates),
+            )
+            conflicts: Dict[int, str] = find_batch_conflicts(
+                existing=existing_intervals,
+                candidates=candidates,
+            )
+            for candidate_index, message in conflicts.items():
+                rejections[candidate_positions[candidate_index]] = message
+
+        accepted_positions: List[int] = [
+            position for position in range(len(shifts_in)) if position not in rejections
+        ]
+        shift_rows: List[Dict[str, Any]] = [
+            self.build_shift_row(shift_in=shifts_in[position])
+            for position in accepted_positions
+        ]
+
+        created_by_position: Dict[int, ShiftResponse] = dict(
+            zip(accepted_positions, self.insert_shift_rows(shift_rows=shift_rows))
+        )
+
+        results: List[ShiftBulkItemResult] = []
+        for position in range(len(shifts_in)):
+            if position in created_by_position:
+                results.append(
+                    ShiftBulkItemResult(
+                        index=position,
+                        status="created",
+                        shift=created_by_position[position],
+                    )
+                )
+            else:
+                results.append(
+                    ShiftBulkItemResult(
+                        index=position,
+                        status="rejected",
+                        message=rejections[position],
+                    )
+                )
+
+        return ShiftBulkResponse(
+            created=len(created_by_position),
+            rejected=len(rejections),
+            results=results,
+        )
+
+    def insert_shift_rows(self, shift_rows: List[Dict[str, Any]]) -> List[ShiftResponse]:
+        """
+        Insert already-validated rows (from build_shift_row) in one
+        transaction: rollup deltas, one executemany, then cache
+        invalidation and stream events. Returns the created shifts in
+        input order.
+        """
+        rollup_deltas: Dict[Tuple[int, date], Dict[str, Any]] = {}
+        for shift_row in shift_rows:
+            delta_row = _rollup_delta_row(
+                employee_id=shift_row["employee_id"],
+                shift_date=shift_row["shift_date"],
+                start_time=shift_row["start_time"],
+                end_time=shift_row["end_time"],
+                sign=1,
+            )
+            key = (delta_row["employee_id"], delta_row["day"])
+            if key in rollup_deltas:
+                rollup_deltas[key]["shift_count"] += delta_row["shift_count"]
+                rollup_deltas[key]["total_seconds"] += delta_row["total_seconds"]
+            else:
+                rollup_deltas[key] = delta_row
+        self.rollup_repository.apply_deltas(delta_rows=list(rollup_deltas.values()))
+
+        inserted_ids: List[int] = self.shift_repository.save_all(shift_rows=shift_rows)
+
+        analytics_cache.invalidate_dates(
+            {shift_row["shift_date"] for shift_row in shift_rows}
+        )
+
+        if SHIFT_INTERVAL_INDEX_ENABLED:
+            for employee_id in {shift_row["employee_id"] for shift_row in shift_rows}:
+                shift_interval_index.invalidate(employee_id=employee_id)
+
+        created_shifts: List[ShiftResponse] = [
+            ShiftResponse(id=shift_id, **shift_row)
+            for shift_id, shift_row in zip(inserted_ids, shift_rows)
+        ]
+        shift_event_broker.publish(
+            [shift_event("upsert", created) for created in created_shifts]
+        )
+        return created_shifts
+
+    def copy_shifts(
+        self,
+        start_date: date,
+        end_date: date,
+        offset_days: int,
+        employee_ids: Optional[List[int]] = None,
+        skip_conflicts: bool = False,
+    ) -> ShiftCopyResult:
+        """
+        Copy the shifts dated in [start_date, end_date] offset_days later.
+        Copies that would overlap an existing shift are found first with one
+        query; unless skip_conflicts, any of them cancels the copy. The
+        pre-check and the insert share one transaction and neither brings
+        shift rows into Python.
+        """
+        conflict_rows: List[Row] = self.shift_repository.find_copy_conflicts(
+            start_date=start_date,
+            end_date=end_date,
+            offset_days=offset_days,
+            employee_ids=employee_ids,
+        )
+        if conflict_rows and not skip_conflicts:
+            first = conflict_rows[0]
+            raise exceptions.ShiftConflictError(
+                f"{len(conflict_rows)} copied shift(s) would overlap existing shifts, "
+                f"the first being shift id={first.source_id} on {first.shift_date}; "
+                "nothing was copied"
+            )
+
+        created_by_employee: Dict[int, int] = self.shift_repository.copy_range(
+            start_date=start_date,
+            end_date=end_date,
+            offset_days=offset_days,
+            employee_ids=employee_ids,
+        )
+
+        created: int = sum(created_by_employee.values())
+        if created:
+            target_start: date = start_date + timedelta(days=offset_days)
+            target_end: date = end_date + timedelta(days=offset_days)
+            analytics_cache.invalidate_dates(
+                target_start + timedelta(days=offset)
+                for offset in range((target_end - target_start).days + 1)
+            )
+            touched_employee_ids: List[int] = list(created_by_employee)
+            if SHIFT_INTERVAL_INDEX_ENABLED:
+                for employee_id in touched_employee_ids:
+                    shift_interval_index.invalidate(employee_id=employee_id)
+            shift_event_broker.publish(
+                [shift_range_event(target_start, target_end, created, touched_employee_ids)]
+            )
+
+        return ShiftCopyResult(
+            created=created,
+            conflicts=[
+                ShiftCopyConflict(
+                    source_shift_id=row.source_id,
+                    employee_id=row.employee_id,
+                    shift_date=row.shift_date,
+                    start_time=row.start_time,
+                    end_time=row.end_time,
+                )
+                for row in conflict_rows
+            ],
+        )
+
     def update_shift(
         self,
         shift_id: int,
         shift_in: ShiftUpdate,
     ) -> Optional[ShiftResponse]:
+        existing_shift_db: Optional[ShiftDB] = self.shift_repository.find_by_id(
+            shift_id=shift_id
+        )
+        if existing_shift_db is None:
+            return None
 
-        overlapping_shifts = self.shift_repository.find_overlapping_shifts_for_employee(
-            employee_id=shift_in.employee_id,
-            date_value=shift_in.shift_date,
-            start_time=shift_in.start_time,
-            end_time=shift_in.end_time,
-            exclude_shift_id=shift_id
+        previous_employee_id: int = existing_shift_db.employee_id
+        previous_shift_date: date = existing_shift_db.shift_date
+        previous_rollup_delta: Dict[str, Any] = _rollup_delta_for_shift(
+            existing_shift_db, sign=-1
         )
 
-        if len(overlapping_shifts) > 0:
+        # Work out the shift as it will look after the update, so the
+        # overlap check runs against the final employee and time window
+        employee_id: int = (
+            shift_in.employee_id
+            if shift_in.employee_id is not None
+            else existing_shift_db.employee_id
+        )
+        start_time: datetime = (
+            shift_in.start_time
+            if shift_in.start_time is not None
+            else existing_shift_db.start_time
+        )
+        end_time: datetime = (
+            shift_in.end_time
+            if shift_in.end_time is not None
+            else existing_shift_db.end_time
+        )
+
+        self.validate_shift_times(start_time=start_time, end_time=end_time)
+
+        if employee_id != previous_employee_id:
+            employee: Optional[EmployeeDB] = self.employee_repository.find_by_id(
+                employee_id=employee_id
+            )
+            if employee is None:
+                raise exceptions.EmployeeNotFoundError(employee_id=employee_id)
+
+        overlapping_shift_ids = self.find_overlapping_shift_ids(
+            employee_id=employee_id,
+            start_time=start_time,
+            end_time=end_time,
+            exclude_shift_id=shift_id,
+        )
+
+        if len(overlapping_shift_ids) > 0:
             raise exceptions.ShiftConflictError(
                 message=(
                     "Employee already has a shift that overlaps with the requested "
-                    "time window on this date"
+                    "time window"
                 )
             )
-        
-        existing_shift_db: Optional[ShiftDB] = self.shift_repository.find_by_id(
-            shift_id=shift_id
-        )
-        if existing_shift_db is None:
-            return None
 
-        if shift_in.employee_id is not None:
-            existing_shift_db.employee_id = shift_in.employee_id
+        existing_shift_db.employee_id = employee_id
+        existing_shift_db.start_time = start_time
+        existing_shift_db.end_time = end_time
+        existing_shift_db.duration_seconds = _duration_seconds(
+            start_time=start_time,
+            end_time=end_time,
+        )
 
-        if ShiftDB.shift_date is not None:
-            existing_shift_db.date = ShiftDB.shift_date
+        if shift_in.shift_date is not None:
+            existing_shift_db.shift_date = shift_in.shift_date
 
         if shift_in.shift is not None:
             existing_shift_db.shift = shift_in.shift
@@ -143,19 +486,45 @@ class ShiftService:
         if shift_in.note is not None:
             existing_shift_db.note = shift_in.note
 
-        if shift_in.start_time is not None:
-            existing_shift_db.start_time = shift_in.start_time
-
-        if shift_in.end_time is not None:
-            existing_shift_db.end_time = shift_in.end_time
+        self.rollup_repository.apply_deltas(
+            delta_rows=[
+                previous_rollup_delta,
+                _rollup_delta_for_shift(existing_shift_db, sign=1),
+            ]
+        )
 
         updated_shift_db: ShiftDB = self.shift_repository.save(
             shift=existing_shift_db
         )
 
+        analytics_cache.invalidate_dates(
+            [previous_shift_date, updated_shift_db.shift_date]
+        )
+
+        if SHIFT_INTERVAL_INDEX_ENABLED:
+            shift_interval_index.remove(
+                employee_id=previous_employee_id,
+                shift_id=shift_id,
+            )
+            shift_interval_index.add(
+                employee_id=updated_shift_db.employee_id,
+                shift_id=shift_id,
+                start_time=updated_shift_db.start_time,
+                end_time=updated_shift_db.end_time,
+            )
+
         shift_response: ShiftResponse = ShiftResponse.model_validate(
             updated_shift_db
         )
+        shift_event_broker.publish(
+            [
+                shift_event(
+                    "upsert",
+                    shift_response,
+                    previous=(previous_employee_id, previous_shift_date),
+                )
+            ]
+        )
         return shift_response
 
     def delete_shift(self, shift_id: int) -> bool:
@@ -165,16 +534,143 @@ class ShiftService:
         if existing_shift_db is None:
             return False
 
+        employee_id: int = existing_shift_db.employee_id
+        shift_date: date = existing_shift_db.shift_date
+        deleted_shift: ShiftResponse = ShiftResponse.model_validate(existing_shift_db)
+        self.rollup_repository.apply_deltas(
+            delta_rows=[_rollup_delta_for_shift(existing_shift_db, sign=-1)]
+        )
         self.shift_repository.delete(shift=existing_shift_db)
+
+        analytics_cache.invalidate_dates([shift_date])
+
+        if SHIFT_INTERVAL_INDEX_ENABLED:
+            shift_interval_index.remove(employee_id=employee_id, shift_id=shift_id)
+
+        shift_event_broker.publish([shift_event("delete", deleted_shift)])
         return True
 
+    def build_shift_row(self, shift_in: ShiftCreate) -> Dict[str, Any]:
+        """
+        Column values for a new shifts row, shared by the single and bulk
+        create paths.
+        """
+        return {
+            "employee_id": shift_in.employee_id,
+            "shift_date": shift_in.shift_date,
+            "shift": shift_in.shift,
+            "note": shift_in.note,
+            "start_time": shift_in.start_time,
+            "end_time": shift_in.end_time,
+            "duration_seconds": _duration_seconds(
+                start_time=shift_in.start_time,
+                end_time=shift_in.end_time,
+            ),
+        }
+
+    def find_overlapping_shift_ids(
+        self,
+        employee_id: int,
+        start_time: datetime,
+        end_time: datetime,
+        exclude_shift_id: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Return ids of the employee's shifts that overlap [start_time, end_time).
+        Uses the in-process interval index when it is enabled, otherwise
+        queries the database.
+        """
+        if SHIFT_INTERVAL_INDEX_ENABLED:
+            return shift_interval_index.overlapping(
+                employee_id=employee_id,
+                start_time=start_time,
+                end_time=end_time,
+                loader=self.shift_repository.find_intervals_for_employee,
+                exclude_shift_id=exclude_shift_id,
+            )
+
+        overlapping_shifts: List[ShiftDB] = (
+            self.shift_repository.find_overlapping_shifts_for_employee(
+                employee_id=employee_id,
+                start_time=start_time,
+                end_time=end_time,
+                exclude_shift_id=exclude_shift_id,
+            )
+        )
+        return [shift_db.id for shift_db in overlapping_shifts]
+
     def validate_shift_times(self, start_time, end_time) -> None:
         """
-        Validate that a shift's end_time is after start_time.
-        Raise ValueError if invalid.
+        Validate that a shift's end_time is after start_time and that the
+        shift is no longer than MAX_SHIFT_DURATION.
+        Raise ShiftConflictError if invalid.
         """
         if end_time is None or start_time is None:
             raise exceptions.ShiftConflictError("start_time and end_time are required")
 
         if end_time <= start_time:
-            raise exceptions.ShiftConflictError("end_time must be strictly after start_time")
\ No newline at end of file
+            raise exceptions.ShiftConflictError("end_time must be strictly after start_time")
+
+        if end_time - start_time > MAX_SHIFT_DURATION:
+            raise exceptions.ShiftConflictError("a shift cannot be longer than 24 hours")
+
+
+def decode_shift_cursor(cursor: Optional[str]) -> Optional[Tuple[date, int]]:
+    if cursor is None:
+        return None
+    after_date, after_id = decode_cursor(cursor, size=2)
+    try:
+        return date.fromisoformat(after_date), int(after_id)
+    except (TypeError, ValueError) as exc:
+        raise exceptions.InvalidCursorError(cursor=cursor) from exc
+
+
+def build_shift_page(shift_rows: List[Row], limit: int) -> ShiftPageData:
+    # shift_rows holds up to limit + 1 rows; the extra one only
+    # signals that another page exists
+    has_more: bool = len(shift_rows) > limit
+    shift_rows = shift_rows[:limit]
+
+    # One validation call for the whole page; the result is plain dicts
+    # ready for ORJSONResponse, so nothing is validated twice
+    items = shift_rows_adapter.validate_python(
+        [dict(zip(SHIFT_ROW_FIELDS, row)) for row in shift_rows]
+    )
+
+    next_cursor: Optional[str] = None
+    if has_more:
+        last_shift: Row = shift_rows[-1]
+        next_cursor = encode_cursor(
+            [last_shift.shift_date.isoformat(), last_shift.id]
+        )
+    return {"items": items, "next_cursor": next_cursor}
+
+
+def _duration_seconds(start_time: datetime, end_time: datetime) -> int:
+    return int((end_time - start_time).total_seconds())
+
+
+def _rollup_delta_row(
+    employee_id: int,
+    shift_date: date,
+    start_time: datetime,
+    end_time: datetime,
+    sign: int,
+) -> Dict[str, Any]:
+    # +1 adds a shift to its (employee, day) rollup row, -1 removes it
+    return {
+        "employee_id": employee_id,
+        "day": shift_date,
+        "shift_count": sign,
+        "total_seconds": sign * _duration_seconds(start_time=start_time, end_time=end_time),
+    }
+
+
+def _rollup_delta_for_shift(shift_db: ShiftDB, sign: int) -> Dict[str, Any]:
+    return _rollup_delta_row(
+        employee_id=shift_db.employee_id,
+        shift_date=shift_db.shift_date,
+        start_time=shift_db.start_time,
+        end_time=shift_db.end_time,
+        sign=sign,
+    )
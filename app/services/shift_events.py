@@ -0,0 +1,249 @@
+import asyncio
+from collections import deque
+from datetime import date
+import threading
+from typing import Any, AsyncIterator, Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import orjson
+
+from app.core.config import SSE_HEARTBEAT_SECONDS, SSE_QUEUE_SIZE
+from app.schemas.schedule import ShiftResponse
+
+# (employee_id, shift_date) a change touches; an update touches two
+ShiftKey = Tuple[int, date]
+
+
+class ShiftEvent:
+    """
+    One committed change, as sent to subscribers. keys are the
+    (employee_id, shift_date) pairs it affects, used for filtering only;
+    an employee-wide change (an employee was deleted) has employee_id set
+    and no keys. A set-based write has date_range set instead, and
+    employee_ids unless it could touch anyone.
+    """
+
+    __slots__ = ("name", "data", "keys", "employee_id", "date_range", "employee_ids")
+
+    def __init__(
+        self,
+        name: str,
+        data: Dict[str, Any],
+        keys: List[ShiftKey],
+        employee_id: Optional[int] = None,
+        date_range: Optional[Tuple[date, date]] = None,
+        employee_ids: Optional[FrozenSet[int]] = None,
+    ) -> None:
+        self.name = name
+        self.data = data
+        self.keys = keys
+        self.employee_id = employee_id
+        self.date_range = date_range
+        self.employee_ids = employee_ids
+
+
+class ShiftSubscription:
+    """
+    A subscriber's filter and bounded queue. Only touched on the event
+    loop it was created on. When the queue is full the oldest event is
+    dropped and counted, so a slow client can never hold memory for more
+    than queue_size events.
+    """
+
+    def __init__(
+        self,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        employee_id: Optional[int],
+        queue_size: int = SSE_QUEUE_SIZE,
+    ) -> None:
+        self.start_date = start_date
+        self.end_date = end_date
+        self.employee_id = employee_id
+        self.queue: Deque[ShiftEvent] = deque(maxlen=queue_size)
+        self.dropped: int = 0
+        self.ready = asyncio.Event()
+
+    def matches(self, event: ShiftEvent) -> bool:
+        if event.date_range is not None:
+            first_date, last_date = event.date_range
+            return (
+                (self.start_date is None or last_date >= self.start_date)
+                and (self.end_date is None or first_date <= self.end_date)
+                and (
+                    self.employee_id is None
+                    or event.employee_ids is None
+                    or self.employee_id in event.employee_ids
+                )
+            )
+        if event.employee_id is not None and not event.keys:
+            return self.employee_id is None or self.employee_id == event.employee_id
+        return any(
+            (self.employee_id is None or self.employee_id == employee_id)
+            and (self.start_date is None or shift_date >= self.start_date)
+            and (self.end_date is None or shift_date <= self.end_date)
+            for employee_id, shift_date in event.keys
+        )
+
+    def put(self, event: ShiftEvent) -> None:
+        if len(self.queue) == self.queue.maxlen:
+            self.dropped += 1
+        self.queue.append(event)
+        self.ready.set()
+
+    def drain(self) -> Tuple[List[ShiftEvent], int]:
+        """Queued events and the number dropped since the last drain."""
+        events = list(self.queue)
+        dropped = self.dropped
+        self.queue.clear()
+        self.dropped = 0
+        self.ready.clear()
+        return events, dropped
+
+
+class ShiftEventBroker:
+    """
+    In-process pub/sub between shift writes and GET /schedule/stream.
+
+    publish() may be called from any thread (sync routes run in the
+    threadpool). It costs one call_soon_threadsafe per event loop with
+    subscribers, not one per subscriber; the fan-out and filtering then
+    run on that loop, so idle subscribers cost nothing but their queue.
+    Events are only seen by subscribers of this process.
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: Dict[asyncio.AbstractEventLoop, Set[ShiftSubscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, subscription: ShiftSubscription) -> None:
+        # must run on the loop that will consume the subscription
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._subscriptions.setdefault(loop, set()).add(subscription)
+
+    def unsubscribe(self, subscription: ShiftSubscription) -> None:
+        with self._lock:
+            for loop, subscriptions in list(self._subscriptions.items()):
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[loop]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def publish(self, events: List[ShiftEvent]) -> None:
+        """Hand committed events to every subscriber; never blocks."""
+        if not events:
+            return
+        with self._lock:
+            loops = list(self._subscriptions)
+        for loop in loops:
+            try:
+                loop.call_soon_threadsafe(self._fan_out, loop, events)
+            except RuntimeError:
+                # the loop has been closed; its subscribers are gone
+                with self._lock:
+                    self._subscriptions.pop(loop, None)
+
+    def _fan_out(self, loop: asyncio.AbstractEventLoop, events: List[ShiftEvent]) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(loop, ()))
+        for subscription in subscriptions:
+            for event in events:
+                if subscription.matches(event):
+                    subscription.put(event)
+
+
+def shift_event(op: str, shift: ShiftResponse, previous: Optional[ShiftKey] = None) -> ShiftEvent:
+    """
+    Event for a created/updated (op "upsert") or deleted (op "delete")
+    shift. previous is where an updated shift used to be, so views of
+    the old range or employee see it leave.
+    """
+    keys: List[ShiftKey] = [(shift.employee_id, shift.shift_date)]
+    if previous is not None and previous not in keys:
+        keys.append(previous)
+    return ShiftEvent(
+        name="shift",
+        data={
+            "op": op,
+            "id": shift.id,
+            "shift": shift.model_dump(mode="json") if op == "upsert" else None,
+        },
+        keys=keys,
+    )
+
+
+def employee_deleted_event(employee_id: int) -> ShiftEvent:
+    # the employee's shifts went with them, whatever their dates
+    return ShiftEvent(
+        name="employee",
+        data={"op": "delete", "id": employee_id},
+        keys=[],
+        employee_id=employee_id,
+    )
+
+
+def shift_range_event(
+    start_date: date,
+    end_date: date,
+    created: int,
+    employee_ids: Optional[Iterable[int]] = None,
+) -> ShiftEvent:
+    """
+    Event for shifts written set-based (template expansion, copies),
+    whose rows never pass through Python: it names the range, and
+    clients fetch the rows through GET /schedule/changes.
+    """
+    return ShiftEvent(
+        name="shifts",
+        data={
+            "op": "upsert",
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "created": created,
+        },
+        keys=[],
+        date_range=(start_date, end_date),
+        employee_ids=frozenset(employee_ids) if employee_ids is not None else None,
+    )
+
+
+shift_event_broker = ShiftEventBroker()
+
+
+async def stream_shift_events(
+    subscription: ShiftSubscription,
+    heartbeat_seconds: float = SSE_HEARTBEAT_SECONDS,
+) -> AsyncIterator[bytes]:
+    """
+    Server-sent event frames for subscription until the client goes away.
+    An idle stream gets a comment line every heartbeat_seconds, which
+    keeps proxies from closing it and surfaces a dead client on the next
+    write. If events were dropped, an "overflow" event comes first so the
+    client can catch up through GET /schedule/changes.
+    """
+    shift_event_broker.subscribe(subscription)
+    try:
+        # reconnect delay for EventSource; also sends the headers at once
+        yield b"retry: 3000\n\n"
+        while True:
+            try:
+                await asyncio.wait_for(subscription.ready.wait(), timeout=heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield b": heartbeat\n\n"
+                continue
+
+            events, dropped = subscription.drain()
+            frames: List[bytes] = []
+            if dropped:
+                frames.append(_sse_frame("overflow", {"dropped": dropped}))
+            frames.extend(_sse_frame(event.name, event.data) for event in events)
+            yield b"".join(frames)
+    finally:
+        shift_event_broker.unsubscribe(subscription)
+
+
+def _sse_frame(name: str, data: Dict[str, Any]) -> bytes:
+    return b"event: " + name.encode("ascii") + b"\ndata: " + orjson.dumps(data) + b"\n\n"
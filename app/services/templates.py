@@ -0,0 +1,340 @@
+from datetime import date, time, timedelta
+from math import gcd
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core import exceptions
+from app.core.config import SHIFT_INTERVAL_INDEX_ENABLED
+from app.db.models import EmployeeDB, ShiftTemplateDB
+from app.repositories.employees import EmployeeRepository
+from app.repositories.templates import ShiftTemplateRepository, week_number
+from app.schemas.templates import (
+    ShiftTemplateCreate,
+    ShiftTemplateResponse,
+    ShiftTemplateUpdate,
+    TemplateExpansionConflict,
+    TemplateExpansionResult,
+)
+from app.services.analytics import analytics_cache
+from app.services.interval_index import shift_interval_index
+from app.services.shift_events import shift_event_broker, shift_range_event
+
+# RRULE BYDAY codes, Monday first like date.weekday()
+WEEKDAY_CODES = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+EVERY_DAY = (1 << 7) - 1
+SECONDS_PER_WEEK = 7 * 24 * 3600
+
+
+def parse_rrule(rule: str) -> Tuple[int, int]:
+    """
+    (weekdays bitmask, interval_weeks) for the RRULE subset templates can
+    express: FREQ=WEEKLY with BYDAY and INTERVAL, or FREQ=DAILY.
+    """
+    parts: Dict[str, str] = {}
+    for part in rule.strip().removeprefix("RRULE:").split(";"):
+        name, separator, value = part.partition("=")
+        if not separator or not value:
+            raise exceptions.InvalidRecurrenceError(f"Malformed RRULE part {part!r}")
+        parts[name.strip().upper()] = value.strip().upper()
+
+    unsupported = set(parts) - {"FREQ", "INTERVAL", "BYDAY", "WKST"}
+    if unsupported:
+        raise exceptions.InvalidRecurrenceError(
+            f"Unsupported RRULE parts: {', '.join(sorted(unsupported))}"
+        )
+    try:
+        interval = int(parts.get("INTERVAL", "1"))
+    except ValueError:
+        raise exceptions.InvalidRecurrenceError(f"Invalid INTERVAL {parts['INTERVAL']!r}")
+    if not 1 <= interval <= 52:
+        raise exceptions.InvalidRecurrenceError("INTERVAL must be between 1 and 52")
+
+    frequency = parts.get("FREQ")
+    if frequency == "DAILY":
+        if interval != 1 or "BYDAY" in parts:
+            raise exceptions.InvalidRecurrenceError("FREQ=DAILY takes neither INTERVAL nor BYDAY")
+        return EVERY_DAY, 1
+    if frequency != "WEEKLY":
+        raise exceptions.InvalidRecurrenceError("FREQ must be WEEKLY or DAILY")
+    if "BYDAY" not in parts:
+        raise exceptions.InvalidRecurrenceError("FREQ=WEEKLY needs BYDAY")
+
+    mask = 0
+    for code in parts["BYDAY"].split(","):
+        if code not in WEEKDAY_CODES:
+            raise exceptions.InvalidRecurrenceError(f"Invalid BYDAY day {code!r}")
+        mask |= 1 << WEEKDAY_CODES.index(code)
+    return mask, interval
+
+
+def format_rrule(weekdays: int, interval_weeks: int) -> str:
+    days = ",".join(code for bit, code in enumerate(WEEKDAY_CODES) if weekdays & (1 << bit))
+    return f"FREQ=WEEKLY;INTERVAL={interval_weeks};BYDAY={days}"
+
+
+def weekdays_mask(weekdays: Iterable[int]) -> int:
+    mask = 0
+    for weekday in weekdays:
+        mask |= 1 << weekday
+    return mask
+
+
+def template_duration_seconds(start_time: time, end_time: time) -> int:
+    start = timedelta(hours=start_time.hour, minutes=start_time.minute, seconds=start_time.second)
+    end = timedelta(hours=end_time.hour, minutes=end_time.minute, seconds=end_time.second)
+    if end <= start:
+        end += timedelta(days=1)
+    return int((end - start).total_seconds())
+
+
+def last_covered_day(template: ShiftTemplateDB) -> Optional[date]:
+    # an overnight occurrence on valid_until runs into the day after it
+    if template.valid_until is None:
+        return None
+    if template.end_time <= template.start_time:
+        return template.valid_until + timedelta(days=1)
+    return template.valid_until
+
+
+def templates_overlap(first: ShiftTemplateDB, second: ShiftTemplateDB) -> bool:
+    """
+    True if two templates can ever produce overlapping shifts: the days
+    their occurrences cover meet and, over one cycle of both repeat
+    intervals (and across its wrap, for a Sunday night into Monday), some
+    occurrences overlap.
+    """
+    first_last_day = last_covered_day(first)
+    if first_last_day is not None and first_last_day < second.valid_from:
+        return False
+    second_last_day = last_covered_day(second)
+    if second_last_day is not None and second_last_day < first.valid_from:
+        return False
+
+    cycle_weeks = first.interval_weeks * second.interval_weeks // gcd(first.interval_weeks, second.interval_weeks)
+    cycle_seconds = cycle_weeks * SECONDS_PER_WEEK
+    intervals: List[Tuple[int, int, int]] = []
+    for owner, template in enumerate((first, second)):
+        start_second = (
+            template.start_time.hour * 3600 + template.start_time.minute * 60 + template.start_time.second
+        )
+        for week in range(cycle_weeks):
+            if (week - template.anchor_week) % template.interval_weeks:
+                continue
+            for weekday in range(7):
+                if template.weekdays & (1 << weekday):
+                    start = (week * 7 + weekday) * 86400 + start_second
+                    end = start + template.duration_seconds
+                    intervals.append((start, end, owner))
+                    if end > cycle_seconds:
+                        intervals.append((start - cycle_seconds, end - cycle_seconds, owner))
+
+    # sweep: a start before the other template's furthest end is an overlap
+    furthest_end = [None, None]
+    for start, end, owner in sorted(intervals):
+        other_end = furthest_end[1 - owner]
+        if other_end is not None and start < other_end:
+            return True
+        if furthest_end[owner] is None or end > furthest_end[owner]:
+            furthest_end[owner] = end
+    return False
+
+
+class ShiftTemplateService:
+    def __init__(self, db_session: Session) -> None:
+        self.db_session: Session = db_session
+        self.template_repository: ShiftTemplateRepository = ShiftTemplateRepository(
+            db=db_session
+        )
+        self.employee_repository: EmployeeRepository = EmployeeRepository(
+            db=db_session
+        )
+
+    def list_templates(self, employee_id: Optional[int] = None) -> List[ShiftTemplateResponse]:
+        return [
+            template_response(template_db)
+            for template_db in self.template_repository.find_all(employee_id=employee_id)
+        ]
+
+    def get_template(self, template_id: int) -> Optional[ShiftTemplateResponse]:
+        template_db: Optional[ShiftTemplateDB] = self.template_repository.find_by_id(
+            template_id=template_id
+        )
+        if template_db is None:
+            return None
+        return template_response(template_db)
+
+    def create_template(self, template_in: ShiftTemplateCreate) -> ShiftTemplateResponse:
+        if (template_in.weekdays is None) == (template_in.rrule is None):
+            raise exceptions.InvalidRecurrenceError("Give either weekdays or rrule")
+        if template_in.rrule is not None:
+            weekdays, interval_weeks = parse_rrule(template_in.rrule)
+        else:
+            weekdays, interval_weeks = weekdays_mask(template_in.weekdays), template_in.interval_weeks
+
+        template_db = ShiftTemplateDB(
+            employee_id=template_in.employee_id,
+            shift=template_in.shift,
+            note=template_in.note,
+            start_time=template_in.start_time,
+            end_time=template_in.end_time,
+            weekdays=weekdays,
+            interval_weeks=interval_weeks,
+            valid_from=template_in.valid_from,
+            valid_until=template_in.valid_until,
+        )
+        self.validate_template(template_db)
+        saved_template_db: ShiftTemplateDB = self.template_repository.save(template=template_db)
+        return template_response(saved_template_db)
+
+    def update_template(
+        self,
+        template_id: int,
+        template_in: ShiftTemplateUpdate,
+    ) -> Optional[ShiftTemplateResponse]:
+        """
+        Change a template. Shifts expanded from it earlier are left as
+        they are; the next expansion uses the new values.
+        """
+        template_db: Optional[ShiftTemplateDB] = self.template_repository.find_by_id(
+            template_id=template_id
+        )
+        if template_db is None:
+            return None
+
+        update_data = template_in.model_dump(exclude_unset=True)
+        rrule: Optional[str] = update_data.pop("rrule", None)
+        weekdays: Optional[List[int]] = update_data.pop("weekdays", None)
+        if rrule is not None and (weekdays is not None or "interval_weeks" in update_data):
+            raise exceptions.InvalidRecurrenceError("Give either weekdays and interval_weeks or rrule")
+        if rrule is not None:
+            template_db.weekdays, template_db.interval_weeks = parse_rrule(rrule)
+        if weekdays is not None:
+            template_db.weekdays = weekdays_mask(weekdays)
+        for field_name, field_value in update_data.items():
+            setattr(template_db, field_name, field_value)
+
+        try:
+            self.validate_template(template_db)
+        except Exception:
+            # drop the half-applied changes from the session
+            self.db_session.rollback()
+            raise
+        saved_template_db: ShiftTemplateDB = self.template_repository.save(template=template_db)
+        return template_response(saved_template_db)
+
+    def delete_template(self, template_id: int) -> bool:
+        template_db: Optional[ShiftTemplateDB] = self.template_repository.find_by_id(
+            template_id=template_id
+        )
+        if template_db is None:
+            return False
+        self.template_repository.delete(template=template_db)
+        return True
+
+    def expand_templates(
+        self,
+        start_date: date,
+        end_date: date,
+        template_ids: Optional[List[int]] = None,
+        employee_ids: Optional[List[int]] = None,
+    ) -> TemplateExpansionResult:
+        """
+        Materialise the templates' shifts for [start_date, end_date].
+        Occurrences expanded before are skipped, so re-running a range
+        never duplicates; occurrences overlapping another shift are
+        skipped and reported. Whatever the number of templates and days,
+        the writes are a fixed handful of statements in one transaction.
+        """
+        created_by_employee: Dict[int, int] = self.template_repository.expand(
+            start_date=start_date,
+            end_date=end_date,
+            template_ids=template_ids,
+            employee_ids=employee_ids,
+        )
+        # expand() skipped exactly the overlapping occurrences, so what is
+        # still unexpanded is the conflict list, found by a unique index probe
+        # instead of a second overlap check
+        conflict_rows: List[Row] = self.template_repository.find_unexpanded(
+            start_date=start_date,
+            end_date=end_date,
+            template_ids=template_ids,
+            employee_ids=employee_ids,
+        )
+
+        created: int = sum(created_by_employee.values())
+        if created:
+            analytics_cache.invalidate_dates(
+                start_date + timedelta(days=offset)
+                for offset in range((end_date - start_date).days + 1)
+            )
+            touched_employee_ids: List[int] = list(created_by_employee)
+            if SHIFT_INTERVAL_INDEX_ENABLED:
+                for employee_id in touched_employee_ids:
+                    shift_interval_index.invalidate(employee_id=employee_id)
+            shift_event_broker.publish(
+                [shift_range_event(start_date, end_date, created, touched_employee_ids)]
+            )
+
+        return TemplateExpansionResult(
+            created=created,
+            conflicts=[
+                TemplateExpansionConflict(
+                    template_id=row.template_id,
+                    employee_id=row.employee_id,
+                    shift_date=row.shift_date,
+                    start_time=row.start_time,
+                    end_time=row.end_time,
+                )
+                for row in conflict_rows
+            ],
+        )
+
+    def validate_template(self, template_db: ShiftTemplateDB) -> None:
+        """
+        Check a new or changed template and fill its derived columns.
+        Templates of one employee must never overlap each other, which is
+        what lets expansion insert all occurrences at once and only check
+        them against shifts already in the table.
+        """
+        if template_db.start_time == template_db.end_time:
+            raise exceptions.ShiftConflictError(message="end_time must differ from start_time")
+        if template_db.weekdays == 0:
+            raise exceptions.InvalidRecurrenceError("The template must fall on at least one weekday")
+        if template_db.valid_until is not None and template_db.valid_until < template_db.valid_from:
+            raise exceptions.ShiftConflictError(message="valid_until must not be before valid_from")
+
+        employee: Optional[EmployeeDB] = self.employee_repository.find_by_id(
+            employee_id=template_db.employee_id
+        )
+        if employee is None:
+            raise exceptions.EmployeeNotFoundError(employee_id=template_db.employee_id)
+
+        template_db.duration_seconds = template_duration_seconds(
+            template_db.start_time, template_db.end_time
+        )
+        template_db.anchor_week = week_number(template_db.valid_from)
+
+        siblings = self.template_repository.find_all(employee_id=template_db.employee_id)
+        for sibling in siblings:
+            if sibling.id != template_db.id and templates_overlap(template_db, sibling):
+                raise exceptions.ShiftConflictError(
+                    message=f"Template overlaps template id={sibling.id} of the same employee"
+                )
+
+
+def template_response(template_db: ShiftTemplateDB) -> ShiftTemplateResponse:
+    return ShiftTemplateResponse(
+        id=template_db.id,
+        employee_id=template_db.employee_id,
+        shift=template_db.shift,
+        start_time=template_db.start_time,
+        end_time=template_db.end_time,
+        valid_from=template_db.valid_from,
+        valid_until=template_db.valid_until,
+        note=template_db.note,
+        weekdays=[weekday for weekday in range(7) if template_db.weekdays & (1 << weekday)],
+        interval_weeks=template_db.interval_weeks,
+        rrule=format_rrule(template_db.weekdays, template_db.interval_weeks),
+    )
@@ -0,0 +1,203 @@
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+import orjson
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core.config import EXPORT_BATCH_SIZE, SCHEDULE_MAX_WEEKLY_HOURS, SCHEDULE_MIN_REST_HOURS
+from app.db.base import SessionLocal
+from app.repositories.schedule import ShiftRepository
+from app.services.weeks import week_of
+
+VALIDATION_MEDIA_TYPE = "application/x-ndjson"
+
+# issue kinds, as written in the "kind" field of each line
+OVERLAP = "overlap"
+SHORT_REST = "short_rest"
+WEEKLY_HOURS = "weekly_hours"
+
+
+class ScheduleSweep:
+    """
+    One pass over shifts ordered by (employee_id, start_time), reporting
+    overlaps, rests shorter than min_rest_hours and weeks (Monday to
+    Sunday, by shift_date) over max_weekly_hours.
+
+    Per employee it keeps only the shift that ends last so far and the
+    hours of each week seen, so memory depends on the length of the range,
+    never on the number of shifts. Keeping the latest end, rather than the
+    previous shift's, is what catches a shift overlapping one that started
+    two or more shifts earlier.
+    """
+
+    def __init__(self, min_rest_hours: float, max_weekly_hours: float) -> None:
+        self.min_rest = timedelta(hours=min_rest_hours)
+        self.max_weekly_seconds: float = max_weekly_hours * 3600
+        self.counts: Dict[str, int] = {
+            "shifts": 0,
+            "employees": 0,
+            OVERLAP: 0,
+            SHORT_REST: 0,
+            WEEKLY_HOURS: 0,
+        }
+
+    def issues(self, rows: Iterable[Row]) -> Iterator[Dict[str, Any]]:
+        counts = self.counts
+        min_rest: timedelta = self.min_rest
+        # Monday of each shift_date seen; at most one entry per day of range
+        weeks: Dict[date, date] = {}
+
+        employee_id: Optional[int] = None
+        last_shift_id: Optional[int] = None
+        last_end: Optional[datetime] = None
+        week_seconds: Dict[date, float] = {}
+
+        # rows are unpacked positionally: this loop runs once per shift
+        for shift_id, row_employee_id, shift_date, start_time, end_time, seconds in rows:
+            counts["shifts"] += 1
+            if row_employee_id != employee_id:
+                yield from self._weekly_issues(employee_id, week_seconds)
+                counts["employees"] += 1
+                employee_id = row_employee_id
+                last_shift_id = None
+                last_end = None
+                week_seconds = {}
+
+            if last_end is not None:
+                if start_time < last_end:
+                    counts[OVERLAP] += 1
+                    overlap_end: datetime = end_time if end_time < last_end else last_end
+                    yield _issue(
+                        OVERLAP,
+                        employee_id,
+                        shift_id,
+                        last_shift_id,
+                        start_time,
+                        overlap_end,
+                        (overlap_end - start_time).total_seconds(),
+                    )
+                elif start_time - last_end < min_rest:
+                    counts[SHORT_REST] += 1
+                    yield _issue(
+                        SHORT_REST,
+                        employee_id,
+                        shift_id,
+                        last_shift_id,
+                        last_end,
+                        start_time,
+                        (start_time - last_end).total_seconds(),
+                    )
+            if last_end is None or end_time > last_end:
+                last_shift_id = shift_id
+                last_end = end_time
+
+            # same duration fallback as the rollup for rows written before
+            # duration_seconds existed
+            if seconds is None:
+                seconds = (end_time - start_time).total_seconds()
+            week = weeks.get(shift_date)
+            if week is None:
+                week = weeks[shift_date] = week_of(shift_date)
+            week_seconds[week] = week_seconds.get(week, 0) + seconds
+
+        yield from self._weekly_issues(employee_id, week_seconds)
+
+    def _weekly_issues(
+        self,
+        employee_id: Optional[int],
+        week_seconds: Dict[date, float],
+    ) -> Iterator[Dict[str, Any]]:
+        for week in sorted(week_seconds):
+            if week_seconds[week] > self.max_weekly_seconds:
+                self.counts[WEEKLY_HOURS] += 1
+                yield _issue(
+                    WEEKLY_HOURS,
+                    employee_id,
+                    None,
+                    None,
+                    week,
+                    week + timedelta(days=6),
+                    week_seconds[week],
+                )
+
+
+def _issue(
+    kind: str,
+    employee_id: int,
+    shift_id: Optional[int],
+    other_shift_id: Optional[int],
+    start: Any,
+    end: Any,
+    seconds: float,
+) -> Dict[str, Any]:
+    # overlap: the later shift, the shift it overlaps and the overlap;
+    # short_rest: the later shift, the shift before it and the rest between;
+    # weekly_hours: the week and the hours scheduled in it
+    return {
+        "kind": kind,
+        "employee_id": employee_id,
+        "shift_id": shift_id,
+        "other_shift_id": other_shift_id,
+        "start": start,
+        "end": end,
+        "hours": round(seconds / 3600.0, 2),
+    }
+
+
+class ScheduleValidationService:
+    """
+    Streams the issues ScheduleSweep finds as NDJSON, one issue per line,
+    then a summary line with the counts. Like ExportService it opens its
+    own session when iteration starts, and rows are read and issues
+    written batch_size at a time.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> None:
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+
+    def validate(
+        self,
+        start_date: date,
+        end_date: date,
+        employee_id: Optional[int] = None,
+        min_rest_hours: float = SCHEDULE_MIN_REST_HOURS,
+        max_weekly_hours: float = SCHEDULE_MAX_WEEKLY_HOURS,
+    ) -> Iterator[bytes]:
+        database_session: Session = self.session_factory()
+        try:
+            rows = ShiftRepository(db=database_session).stream_spans_by_employee(
+                start_date,
+                end_date,
+                employee_id=employee_id,
+                batch_size=self.batch_size,
+            )
+            sweep = ScheduleSweep(min_rest_hours=min_rest_hours, max_weekly_hours=max_weekly_hours)
+            issues = sweep.issues(rows)
+            while True:
+                batch = list(islice(issues, self.batch_size))
+                if not batch:
+                    break
+                yield b"".join(
+                    orjson.dumps(issue, option=orjson.OPT_APPEND_NEWLINE) for issue in batch
+                )
+        finally:
+            database_session.close()
+
+        yield orjson.dumps(
+            {
+                "kind": "summary",
+                "start_date": start_date,
+                "end_date": end_date,
+                "min_rest_hours": min_rest_hours,
+                "max_weekly_hours": max_weekly_hours,
+                **sweep.counts,
+            },
+            option=orjson.OPT_APPEND_NEWLINE,
+        )
@@ -0,0 +1,7 @@
+from datetime import date, timedelta
+
+
+def week_of(day: date) -> date:
+    # Monday of day's week; weeks run Monday to Sunday everywhere
+    # (analytics periods, roster and validation weekly hours)
+    return day - timedelta(days=day.weekday())
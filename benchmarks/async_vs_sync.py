@@ -0,0 +1,129 @@
+"""
+Compare DB_MODE=sync and DB_MODE=async under many concurrent clients.
+
+Starts the API under uvicorn once per mode against the same seeded SQLite
+file and drives it with concurrent httpx clients:
+
+    python -m benchmarks.async_vs_sync --clients 500 --requests 5
+
+In sync mode every request holds a threadpool worker (40 by default) for
+its whole lifetime, including while it waits for a pooled connection, so
+at this concurrency expect queueing and timeouts to be reported as errors.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+import httpx
+
+from benchmarks.seed import seed_database
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EMPLOYEES = 500
+SHIFTS_PER_EMPLOYEE = 100
+
+
+async def _wait_until_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get("/employees", params={"limit": 1})
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+async def _client_loop(client: httpx.AsyncClient, requests: int, latencies: List[float]) -> int:
+    errors = 0
+    rng = random.Random()
+    for _ in range(requests):
+        if rng.random() < 0.5:
+            path, params = "/schedule", {"limit": 50, "employee_id": rng.randint(1, EMPLOYEES)}
+        else:
+            path, params = f"/employees/{rng.randint(1, EMPLOYEES)}", None
+        started = time.perf_counter()
+        try:
+            response = await client.get(path, params=params)
+            if response.status_code != 200:
+                errors += 1
+        except httpx.HTTPError:
+            # a stalled server shows up as timeouts rather than a hang
+            errors += 1
+        latencies.append(time.perf_counter() - started)
+    return errors
+
+
+async def _drive(base_url: str, clients: int, requests: int, timeout: float) -> None:
+    latencies: List[float] = []
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+        started = time.perf_counter()
+        errors = await asyncio.gather(
+            *(_client_loop(client, requests, latencies) for _ in range(clients))
+        )
+        elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"  {len(latencies)} requests in {elapsed:.2f}s -> {len(latencies) / elapsed:.0f} req/s, "
+        f"p50={quantiles[49] * 1000:.1f}ms p95={quantiles[94] * 1000:.1f}ms "
+        f"p99={quantiles[98] * 1000:.1f}ms errors={sum(errors)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=5, help="requests per client")
+    parser.add_argument("--timeout", type=float, default=10.0, help="per-request timeout in seconds")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, "bench.db")
+        seed_database(db_path, employees=EMPLOYEES, shifts_per_employee=SHIFTS_PER_EMPLOYEE)
+
+        for mode in ("sync", "async"):
+            env = dict(
+                os.environ,
+                DATABASE_URL=f"sqlite:///{db_path}",
+                DB_MODE=mode,
+                PYTHONPATH=REPO_ROOT,
+            )
+            server = subprocess.Popen(
+                [
+                    sys.executable, "-m", "uvicorn", "app.main:app",
+                    "--port", str(args.port), "--log-level", "warning",
+                ],
+                env=env,
+                # keep the server's log files out of the working tree
+                cwd=workdir,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            base_url = f"http://127.0.0.1:{args.port}"
+            try:
+                asyncio.run(_wait_until_ready(base_url))
+                print(f"DB_MODE={mode}, {args.clients} concurrent clients")
+                asyncio.run(_drive(base_url, args.clients, args.requests, args.timeout))
+            finally:
+                server.terminate()
+                try:
+                    server.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    # a wedged sync server never finishes its graceful shutdown
+                    server.kill()
+                    server.wait()
+
+
+if __name__ == "__main__":
+    main()
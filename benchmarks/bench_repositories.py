@@ -0,0 +1,68 @@
+"""
+Micro-benchmarks for the repository methods on the hot request paths.
+See conftest.py for how the database is chosen.
+"""
+import random
+from datetime import date, datetime, timedelta
+
+from app.repositories.rollup import DailyRollupRepository
+from app.repositories.schedule import ShiftRepository
+
+# the seeded data starts here; a month in is well inside every employee's history
+MONTH_START = date(2024, 2, 1)
+MONTH_END = date(2024, 2, 29)
+
+
+def _employee_picker(employee_count: int):
+    rng = random.Random(0)
+    return lambda: rng.randint(1, employee_count)
+
+
+def test_find_all_first_page(benchmark, db_session):
+    repository = ShiftRepository(db_session)
+    shifts = benchmark(repository.find_all, limit=100)
+    assert len(shifts) == 100
+
+
+def test_find_all_employee_month(benchmark, db_session, bench_employee_count):
+    repository = ShiftRepository(db_session)
+    next_employee = _employee_picker(bench_employee_count)
+    benchmark(
+        lambda: repository.find_all(
+            employee_id=next_employee(),
+            start_date=MONTH_START,
+            end_date=MONTH_END,
+            limit=100,
+        )
+    )
+
+
+def test_find_overlapping_shifts_for_employee(benchmark, db_session, bench_employee_count):
+    repository = ShiftRepository(db_session)
+    next_employee = _employee_picker(bench_employee_count)
+    start_time = datetime(2024, 2, 14, 10, 0)
+    benchmark(
+        lambda: repository.find_overlapping_shifts_for_employee(
+            employee_id=next_employee(),
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=8),
+        )
+    )
+
+
+def test_get_analytics_by_employee_month(benchmark, db_session):
+    repository = ShiftRepository(db_session)
+    rows = benchmark(repository.get_analytics_by_employee, MONTH_START, MONTH_END)
+    assert rows
+
+
+def test_get_analytics_by_employee_all_time(benchmark, db_session):
+    repository = ShiftRepository(db_session)
+    rows = benchmark(repository.get_analytics_by_employee_all_time)
+    assert rows
+
+
+def test_rollup_totals_by_employee_month(benchmark, db_session):
+    repository = DailyRollupRepository(db_session)
+    rows = benchmark(repository.get_totals_by_employee, MONTH_START, MONTH_END)
+    assert rows
@@ -0,0 +1,51 @@
+"""
+Fixtures for the pytest-benchmark micro-benchmarks:
+
+    python -m pytest benchmarks/bench_repositories.py
+
+runs against a freshly seeded file sized by BENCH_EMPLOYEES and
+BENCH_SHIFTS_PER_EMPLOYEE, or against an existing one (for instance the
+10k x 500 file from `python -m benchmarks.seed`) named by BENCH_DB.
+Compare runs with --benchmark-autosave and --benchmark-compare.
+"""
+import os
+from typing import Iterator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from benchmarks.seed import seed_database
+
+BENCH_EMPLOYEES = int(os.getenv("BENCH_EMPLOYEES", "1000"))
+BENCH_SHIFTS_PER_EMPLOYEE = int(os.getenv("BENCH_SHIFTS_PER_EMPLOYEE", "200"))
+
+
+@pytest.fixture(scope="session")
+def bench_db_path(tmp_path_factory) -> str:
+    existing = os.getenv("BENCH_DB")
+    if existing:
+        return existing
+    path = str(tmp_path_factory.mktemp("bench") / "bench.db")
+    seed_database(path, employees=BENCH_EMPLOYEES, shifts_per_employee=BENCH_SHIFTS_PER_EMPLOYEE)
+    return path
+
+
+@pytest.fixture(scope="session")
+def bench_employee_count(bench_db_path) -> int:
+    engine = create_engine(f"sqlite:///{bench_db_path}")
+    with engine.connect() as connection:
+        count = connection.exec_driver_sql("SELECT max(id) FROM employees").scalar()
+    engine.dispose()
+    return count
+
+
+@pytest.fixture
+def db_session(bench_db_path) -> Iterator[Session]:
+    engine = create_engine(f"sqlite:///{bench_db_path}")
+    database_session = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        yield database_session
+    finally:
+        database_session.close()
+        engine.dispose()
@@ -0,0 +1,119 @@
+"""
+CPU cost of reading 50k shifts through GET /schedule, page by page.
+
+Compares the previous pipeline (ORM entities -> ShiftResponse per row ->
+response_model re-validation -> stdlib json) with the column-row fast path
+(one TypeAdapter call per page -> orjson), both at the service level and
+through the full app:
+
+    python -m benchmarks.list_serialization --employees 500 --shifts-per-employee 100
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+import httpx
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGE_SIZE = 1000
+
+
+def _legacy_page(shift_repository, after, ShiftResponse, ShiftPage):
+    # what list_shifts and FastAPI's response_model handling used to do
+    shift_db_list = shift_repository.find_all(after=after, limit=PAGE_SIZE + 1)
+    items = [ShiftResponse.model_validate(shift_db) for shift_db in shift_db_list[:PAGE_SIZE]]
+    page = ShiftPage(items=items, next_cursor=None)
+    body = json.dumps(ShiftPage.model_validate(page).model_dump(mode="json")).encode()
+    last = shift_db_list[PAGE_SIZE - 1] if len(shift_db_list) > PAGE_SIZE else None
+    return body, (last.shift_date, last.id) if last else None
+
+
+def _timed(label: str, run) -> None:
+    wall_started, cpu_started = time.perf_counter(), time.process_time()
+    rows = run()
+    wall, cpu = time.perf_counter() - wall_started, time.process_time() - cpu_started
+    print(f"  {label:<34} {rows} rows  wall {wall * 1000:8.1f} ms  cpu {cpu * 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--employees", type=int, default=500)
+    parser.add_argument("--shifts-per-employee", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="wasty-list-")
+    db_path = os.path.join(workdir, "bench.db")
+    # configure the app before anything imports app.db.base
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("LOG_SQL_MODE", "off")
+    os.chdir(workdir)
+    sys.path.insert(0, REPO_ROOT)
+
+    from benchmarks.seed import seed_database
+
+    seed_database(db_path, employees=args.employees, shifts_per_employee=args.shifts_per_employee)
+
+    import orjson
+
+    from app.db.base import SessionLocal
+    from app.main import app
+    from app.repositories.schedule import ShiftRepository
+    from app.schemas.schedule import ShiftPage, ShiftResponse
+    from app.services.schedule import ShiftService, decode_shift_cursor
+
+    def legacy_service() -> int:
+        database_session = SessionLocal()
+        shift_repository = ShiftRepository(database_session)
+        rows, after = 0, None
+        while True:
+            body, after = _legacy_page(shift_repository, after, ShiftResponse, ShiftPage)
+            rows += body.count(b'"id":')
+            if after is None:
+                break
+        database_session.close()
+        return rows
+
+    def fast_service() -> int:
+        database_session = SessionLocal()
+        shift_service = ShiftService(database_session)
+        rows, cursor = 0, None
+        while True:
+            page = shift_service.list_shifts(limit=PAGE_SIZE, cursor=cursor)
+            orjson.dumps(page)
+            rows += len(page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        database_session.close()
+        return rows
+
+    async def fetch_all_pages() -> int:
+        rows, cursor = 0, None
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            while True:
+                params = {"limit": PAGE_SIZE}
+                if cursor:
+                    params["cursor"] = cursor
+                page = (await client.get("/schedule", params=params)).json()
+                rows += len(page["items"])
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    return rows
+
+    # keep the decoder warm so the first round is not an outlier
+    decode_shift_cursor(None)
+    for round_number in range(1, args.rounds + 1):
+        print(f"round {round_number}")
+        _timed("service: ORM + model_validate + json", legacy_service)
+        _timed("service: rows + TypeAdapter + orjson", fast_service)
+        _timed("GET /schedule (all pages)", lambda: asyncio.run(fetch_all_pages()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+In-process load driver: runs the FastAPI app on an httpx ASGI transport
+(no network, no server process) and reports latency per endpoint.
+
+    python -m benchmarks.load --db bench.db --concurrency 32 --requests 5000
+    python -m benchmarks.load --json before.json     # save for comparison
+    python -m benchmarks.load --compare before.json  # print p99 deltas
+
+Without --db a small database is seeded into a temporary directory. With
+--writes the mix also creates shifts, which modifies the --db file.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_EMPLOYEES = 1000
+DEFAULT_SHIFTS_PER_EMPLOYEE = 200
+# same month the repository micro-benchmarks use
+MONTH_START = date(2024, 2, 1)
+MONTH_END = date(2024, 2, 29)
+
+# (name, weight, build(rng, employee_count, counter) -> (method, path, params, json))
+Scenario = Tuple[str, int, Callable[[random.Random, int, int], Tuple[str, str, Optional[dict], Optional[dict]]]]
+
+READ_SCENARIOS: List[Scenario] = [
+    ("GET /employees", 2, lambda rng, n, i: ("GET", "/employees", {"limit": 100}, None)),
+    ("GET /employees/{employee_id}", 4, lambda rng, n, i: ("GET", f"/employees/{rng.randint(1, n)}", None, None)),
+    ("GET /schedule", 2, lambda rng, n, i: ("GET", "/schedule", {"limit": 100}, None)),
+    (
+        "GET /schedule?employee_id",
+        4,
+        lambda rng, n, i: (
+            "GET",
+            "/schedule",
+            {
+                "employee_id": rng.randint(1, n),
+                "start_date": MONTH_START.isoformat(),
+                "end_date": MONTH_END.isoformat(),
+            },
+            None,
+        ),
+    ),
+    (
+        "GET /analytics",
+        1,
+        lambda rng, n, i: ("GET", "/analytics", {"period": "month", "ref_date": MONTH_START.isoformat()}, None),
+    ),
+    (
+        "GET /analytics/{employee_id}",
+        2,
+        lambda rng, n, i: (
+            "GET",
+            f"/analytics/{rng.randint(1, n)}",
+            {"period": "month", "ref_date": MONTH_START.isoformat()},
+            None,
+        ),
+    ),
+    (
+        "GET /analytics/timeseries",
+        1,
+        lambda rng, n, i: (
+            "GET",
+            "/analytics/timeseries",
+            {
+                "from": MONTH_START.isoformat(),
+                "to": MONTH_END.isoformat(),
+                "bucket": "week",
+                "employee_ids": [rng.randint(1, n) for _ in range(10)],
+            },
+            None,
+        ),
+    ),
+]
+
+
+def _create_shift(rng: random.Random, employee_count: int, counter: int):
+    # one far-future day per request, so generated shifts never conflict
+    shift_date = date(2040, 1, 1) + timedelta(days=counter)
+    start_time = datetime.combine(shift_date, datetime.min.time()) + timedelta(hours=6)
+    return (
+        "POST",
+        "/schedule",
+        None,
+        {
+            "employee_id": rng.randint(1, employee_count),
+            "shift_date": shift_date.isoformat(),
+            "shift": "Morning",
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(hours=8)).isoformat(),
+        },
+    )
+
+
+WRITE_SCENARIOS: List[Scenario] = [("POST /schedule", 2, _create_shift)]
+
+
+def _percentile(quantiles: List[float], percent: int) -> float:
+    return quantiles[percent - 1] * 1000
+
+
+def summarise(latencies: Dict[str, List[float]], errors: Dict[str, int]) -> Dict[str, dict]:
+    results = {}
+    for name, samples in sorted(latencies.items()):
+        if len(samples) < 2:
+            continue
+        quantiles = statistics.quantiles(samples, n=100)
+        results[name] = {
+            "requests": len(samples),
+            "errors": errors.get(name, 0),
+            "p50_ms": round(_percentile(quantiles, 50), 3),
+            "p95_ms": round(_percentile(quantiles, 95), 3),
+            "p99_ms": round(_percentile(quantiles, 99), 3),
+        }
+    return results
+
+
+async def run_load(
+    app,
+    scenarios: List[Scenario],
+    employee_count: int,
+    concurrency: int,
+    total_requests: int,
+    seed: int = 0,
+) -> Tuple[Dict[str, dict], float]:
+    """Drive app with concurrency workers until total_requests have run."""
+    rng = random.Random(seed)
+    names = [scenario[0] for scenario in scenarios]
+    weights = [scenario[1] for scenario in scenarios]
+    builders = {scenario[0]: scenario[2] for scenario in scenarios}
+    plan = rng.choices(names, weights=weights, k=total_requests)
+    next_index = itertools.count()
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    transport = httpx.ASGITransport(app=app)
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        while True:
+            index = next(next_index)
+            if index >= total_requests:
+                return
+            name = plan[index]
+            method, path, params, body = builders[name](rng, employee_count, index)
+            started = time.perf_counter()
+            response = await client.request(method, path, params=params, json=body)
+            latencies[name].append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors[name] += 1
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return summarise(latencies, errors), elapsed
+
+
+def print_results(results: Dict[str, dict], elapsed: float, baseline: Optional[Dict[str, dict]] = None) -> None:
+    total = sum(row["requests"] for row in results.values())
+    print(f"{total} requests in {elapsed:.2f}s -> {total / elapsed:.0f} req/s")
+    print(f"{'endpoint':<32}{'requests':>9}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, row in results.items():
+        line = (
+            f"{name:<32}{row['requests']:>9}{row['errors']:>8}"
+            f"{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}"
+        )
+        if baseline and name in baseline and baseline[name]["p99_ms"]:
+            change = row["p99_ms"] / baseline[name]["p99_ms"] - 1
+            line += f"   p99 {change:+.0%}"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db", help="seeded SQLite file (default: seed a small one)")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--writes", action="store_true", help="include POST /schedule in the mix")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_path", help="write the results to this file")
+    parser.add_argument("--compare", help="results file from an earlier --json run")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="wasty-load-")
+    json_path = args.json_path and os.path.abspath(args.json_path)
+    compare_path = args.compare and os.path.abspath(args.compare)
+    db_path = os.path.abspath(args.db) if args.db else os.path.join(workdir, "bench.db")
+
+    # The app reads its configuration when app.db.base is first imported
+    # (the seed module imports it too) and logs relative to the working
+    # directory, so both are set before any app import.
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("LOG_SQL_MODE", "off")
+    os.chdir(workdir)
+    sys.path.insert(0, REPO_ROOT)
+    from benchmarks.seed import seed_database
+
+    if not args.db:
+        seed_database(db_path, employees=DEFAULT_EMPLOYEES, shifts_per_employee=DEFAULT_SHIFTS_PER_EMPLOYEE)
+
+    from app.main import app
+
+    connection = sqlite3.connect(db_path)
+    employee_count = connection.execute("SELECT max(id) FROM employees").fetchone()[0]
+    connection.close()
+
+    scenarios = READ_SCENARIOS + (WRITE_SCENARIOS if args.writes else [])
+    results, elapsed = asyncio.run(
+        run_load(app, scenarios, employee_count, args.concurrency, args.requests, args.seed)
+    )
+
+    baseline = None
+    if compare_path:
+        with open(compare_path) as compare_file:
+            baseline = json.load(compare_file)["endpoints"]
+    print_results(results, elapsed, baseline)
+
+    if json_path:
+        with open(json_path, "w") as json_file:
+            json.dump({"elapsed_s": round(elapsed, 3), "endpoints": results}, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Time POST /schedule/generate on a fresh roster: 500 employees, 4 weeks.
+
+Each role is asked for a morning and an afternoon crew of a fifth of its
+staff and a night crew of a tenth, every day, which is close to what the
+weekly hour cap and the seeded availability patterns allow. The solver
+is timed on its own (no writes), then the whole request through the app:
+
+    python -m benchmarks.roster_generate --employees 500 --weeks 4
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import httpx
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+START_DATE = date(2025, 6, 2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--employees", type=int, default=500)
+    parser.add_argument("--weeks", type=int, default=4)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="wasty-roster-")
+    db_path = os.path.join(workdir, "bench.db")
+    # configure the app before anything imports app.db.base
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("LOG_SQL_MODE", "off")
+    os.chdir(workdir)
+    sys.path.insert(0, REPO_ROOT)
+
+    from benchmarks.seed import ROLES, seed_database
+
+    seed_database(db_path, employees=args.employees, shifts_per_employee=0)
+
+    from app.db.base import SessionLocal
+    from app.db.enums import ShiftType
+    from app.main import app
+    from app.schemas.schedule import RosterDemand
+    from app.services.roster import RosterService
+
+    per_role = args.employees // len(ROLES)
+    crews = {
+        ShiftType.MORNING: max(1, per_role // 5),
+        ShiftType.AFTERNOON: max(1, per_role // 5),
+        ShiftType.NIGHT: max(1, per_role // 10),
+    }
+    demand = [
+        {"role": role, "shift": shift_type.value, "headcount": headcount}
+        for role in ROLES
+        for shift_type, headcount in crews.items()
+    ]
+    end_date = START_DATE + timedelta(days=7 * args.weeks - 1)
+    required = sum(crews.values()) * len(ROLES) * 7 * args.weeks
+
+    # solver only: run generate with the insert step replaced by a no-op
+    database_session = SessionLocal()
+    roster_service = RosterService(database_session)
+    roster_service.shift_service.insert_shift_rows = lambda shift_rows: []
+    started = time.perf_counter()
+    roster_service.generate(
+        start_date=START_DATE,
+        end_date=end_date,
+        demand=[RosterDemand(**item) for item in demand],
+    )
+    print(f"  {'load + solve (no writes)':<28} {(time.perf_counter() - started) * 1000:8.1f} ms")
+    database_session.close()
+
+    async def generate() -> dict:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            response = await client.post(
+                "/schedule/generate",
+                json={
+                    "start_date": START_DATE.isoformat(),
+                    "end_date": end_date.isoformat(),
+                    "demand": demand,
+                },
+            )
+            response.raise_for_status()
+            return response.json()
+
+    started = time.perf_counter()
+    roster = asyncio.run(generate())
+    elapsed = time.perf_counter() - started
+    short = sum(item["required"] - item["assigned"] for item in roster["unfilled"])
+    print(f"  {'POST /schedule/generate':<28} {elapsed * 1000:8.1f} ms")
+    print(
+        f"  {args.employees} employees, {args.weeks} weeks: {required} places demanded, "
+        f"{roster['created']} shifts created, {short} unfilled"
+    )
+
+
+if __name__ == "__main__":
+    main()
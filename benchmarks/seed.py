@@ -0,0 +1,170 @@
+"""
+Synthetic data for benchmarks, written straight into a SQLite file.
+
+    python -m benchmarks.seed bench.db --employees 10000 --shifts-per-employee 500
+
+creates the app schema and fills it with employees and shifts (5M rows
+for the example above) in a few minutes, then builds the rollup table.
+The same seed always produces the same file contents.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Iterator, Tuple
+
+from sqlalchemy import create_engine
+
+from app.db.enums import ShiftType
+from app.db.schema import init_db, rebuild_rollup
+from app.services.availability import availability_mask_for
+
+# start hour and length in hours of each shift type
+SHIFT_PATTERNS = {
+    ShiftType.MORNING: (6, 8),
+    ShiftType.AFTERNOON: (14, 8),
+    ShiftType.NIGHT: (22, 8),
+}
+ROLES = ["Operator", "Driver", "Picker", "Supervisor", "Technician"]
+AVAILABILITIES = [
+    "Mon-Fri, 06:00-22:00",
+    "Mon-Sun, 06:00-14:00",
+    "Weekends only",
+    "Nights, Sun-Thu",
+    None,
+]
+# chance that an employee is off on a given day, and that a shift is cut
+# short to a half shift
+DAY_OFF_PROBABILITY = 2 / 7
+SHORT_SHIFT_PROBABILITY = 0.1
+INSERT_CHUNK_SIZE = 50_000
+
+
+def _format_datetime(value: datetime) -> str:
+    # same text layout SQLAlchemy's SQLite DateTime type writes
+    return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def _employee_rows(rng: random.Random, employees: int) -> Iterator[Tuple]:
+    masks = {availability: availability_mask_for(availability) for availability in AVAILABILITIES}
+    for employee_id in range(1, employees + 1):
+        availability = rng.choice(AVAILABILITIES)
+        yield (
+            employee_id,
+            f"Employee {employee_id}",
+            rng.choice(ROLES),
+            availability,
+            masks[availability],
+        )
+
+
+def _shift_rows(
+    rng: random.Random,
+    employees: int,
+    shifts_per_employee: int,
+    start: date,
+) -> Iterator[Tuple]:
+    # At most one shift per calendar day, so an employee's shifts never
+    # overlap: a night shift ends at 06:00, when the earliest next one starts.
+    shift_types = list(SHIFT_PATTERNS)
+    for employee_id in range(1, employees + 1):
+        shift_date = start
+        for _ in range(shifts_per_employee):
+            while rng.random() < DAY_OFF_PROBABILITY:
+                shift_date += timedelta(days=1)
+            shift_type = rng.choice(shift_types)
+            start_hour, length_hours = SHIFT_PATTERNS[shift_type]
+            if rng.random() < SHORT_SHIFT_PROBABILITY:
+                length_hours //= 2
+            start_time = datetime.combine(shift_date, datetime.min.time()) + timedelta(hours=start_hour)
+            end_time = start_time + timedelta(hours=length_hours)
+            yield (
+                employee_id,
+                shift_date.isoformat(),
+                shift_type.name,
+                _format_datetime(start_time),
+                _format_datetime(end_time),
+                length_hours * 3600,
+            )
+            shift_date += timedelta(days=1)
+
+
+def seed_database(
+    path: str,
+    employees: int,
+    shifts_per_employee: int,
+    start: date = date(2024, 1, 1),
+    seed: int = 42,
+) -> None:
+    """
+    Create the app schema in a fresh SQLite file at path and fill it with
+    employees, each working shifts_per_employee shifts from start onwards
+    with random days off, shift types and the odd half shift.
+    """
+    engine = create_engine(f"sqlite:///{path}")
+    init_db(engine)
+    engine.dispose()
+
+    rng = random.Random(seed)
+    connection = sqlite3.connect(path)
+    # nothing else reads the file while it is being generated
+    connection.execute("PRAGMA journal_mode=OFF")
+    connection.execute("PRAGMA synchronous=OFF")
+    connection.executemany(
+        "INSERT INTO employees (id, name, role, availability, availability_mask) VALUES (?, ?, ?, ?, ?)",
+        _employee_rows(rng, employees),
+    )
+
+    rows = _shift_rows(rng, employees, shifts_per_employee, start)
+    while True:
+        chunk = [row for _, row in zip(range(INSERT_CHUNK_SIZE), rows)]
+        if not chunk:
+            break
+        connection.executemany(
+            "INSERT INTO shifts (employee_id, shift_date, shift, start_time, end_time, duration_seconds) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            chunk,
+        )
+    connection.commit()
+    connection.execute("ANALYZE")
+    connection.close()
+
+    engine = create_engine(f"sqlite:///{path}")
+    rebuild_rollup(engine)
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic SQLite database")
+    parser.add_argument("path", help="SQLite file to create")
+    parser.add_argument("--employees", type=int, default=10_000)
+    parser.add_argument("--shifts-per-employee", type=int, default=500)
+    parser.add_argument("--start", type=date.fromisoformat, default=date(2024, 1, 1))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--force", action="store_true", help="replace the file if it exists")
+    args = parser.parse_args()
+
+    if os.path.exists(args.path):
+        if not args.force:
+            sys.exit(f"{args.path} already exists; pass --force to replace it")
+        os.remove(args.path)
+
+    started = time.perf_counter()
+    seed_database(
+        args.path,
+        employees=args.employees,
+        shifts_per_employee=args.shifts_per_employee,
+        start=args.start,
+        seed=args.seed,
+    )
+    print(
+        f"{args.employees} employees, {args.employees * args.shifts_per_employee} shifts "
+        f"written to {args.path} in {time.perf_counter() - started:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
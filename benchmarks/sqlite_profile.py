@@ -0,0 +1,146 @@
+"""
+Mixed read/write throughput of the SQLite engine under each DB_PROFILE.
+
+Each profile runs in its own process (the profile is read from the
+environment at import time) against a fresh copy of the same seeded file.
+Reader threads page through one employee's shifts the way GET /schedule
+does; writer threads insert shifts through ShiftRepository.save, one commit
+each, as POST /schedule does:
+
+    python -m benchmarks.sqlite_profile --readers 8 --writers 2 --duration 10
+"""
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+from benchmarks.seed import seed_database
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EMPLOYEES = 500
+SHIFTS_PER_EMPLOYEE = 100
+PROFILES = ("baseline", "production")
+
+
+def _run_worker(readers: int, writers: int, duration: float) -> None:
+    from sqlalchemy.exc import OperationalError
+
+    from app.db.base import SessionLocal
+    from app.db.enums import ShiftType
+    from app.db.models import ShiftDB
+    from app.repositories.schedule import ShiftRepository
+
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    counts_lock = threading.Lock()
+
+    def count(key: str) -> None:
+        with counts_lock:
+            counts[key] += 1
+
+    def reader() -> None:
+        rng = random.Random()
+        database_session = SessionLocal()
+        repository = ShiftRepository(database_session)
+        try:
+            while not stop.is_set():
+                try:
+                    repository.find_all(employee_id=rng.randint(1, EMPLOYEES), limit=50)
+                    database_session.rollback()
+                    count("reads")
+                except OperationalError:
+                    database_session.rollback()
+                    count("errors")
+        finally:
+            database_session.close()
+
+    def writer(writer_index: int) -> None:
+        # writers use their own future days so they never touch each other's rows
+        shift_date = date(2030, 1, 1) + timedelta(days=writer_index * 100_000)
+        database_session = SessionLocal()
+        repository = ShiftRepository(database_session)
+        try:
+            while not stop.is_set():
+                start_time = datetime.combine(shift_date, datetime.min.time()) + timedelta(hours=6)
+                shift = ShiftDB(
+                    employee_id=writer_index % EMPLOYEES + 1,
+                    shift_date=shift_date,
+                    shift=ShiftType.MORNING,
+                    start_time=start_time,
+                    end_time=start_time + timedelta(hours=8),
+                    duration_seconds=8 * 3600,
+                )
+                try:
+                    repository.save(shift)
+                    count("writes")
+                except OperationalError:
+                    database_session.rollback()
+                    count("errors")
+                shift_date += timedelta(days=1)
+        finally:
+            database_session.close()
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(index,)) for index in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    print(
+        f"  reads {counts['reads'] / duration:.0f}/s, writes {counts['writes'] / duration:.0f}/s, "
+        f"errors {counts['errors']}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per profile")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        _run_worker(args.readers, args.writers, args.duration)
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        seeded_path = os.path.join(workdir, "seed.db")
+        seed_database(seeded_path, employees=EMPLOYEES, shifts_per_employee=SHIFTS_PER_EMPLOYEE)
+
+        for profile in PROFILES:
+            # journal_mode=WAL sticks to the file, so every profile starts from a clean copy
+            db_path = os.path.join(workdir, f"{profile}.db")
+            shutil.copyfile(seeded_path, db_path)
+            env = dict(
+                os.environ,
+                DATABASE_URL=f"sqlite:///{db_path}",
+                DB_PROFILE=profile,
+                PYTHONPATH=REPO_ROOT,
+            )
+            print(f"DB_PROFILE={profile}, {args.readers} readers, {args.writers} writers")
+            sys.stdout.flush()
+            subprocess.run(
+                [
+                    sys.executable, "-m", "benchmarks.sqlite_profile", "--worker",
+                    "--readers", str(args.readers),
+                    "--writers", str(args.writers),
+                    "--duration", str(args.duration),
+                ],
+                env=env,
+                cwd=workdir,
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services.availability import AvailabilityParseError, parse_availability, window_mask
+
+# a Monday
+WEEK_START = datetime(2024, 1, 1)
+
+
+def hours(day: int, start_hour: float, end_hour: float) -> int:
+    """Mask for day (0 = Monday) from start_hour to end_hour, which may pass 24."""
+    day_start = WEEK_START + timedelta(days=day)
+    return window_mask(day_start + timedelta(hours=start_hour), day_start + timedelta(hours=end_hour))
+
+
+def every(days, start_hour: float, end_hour: float) -> int:
+    mask = 0
+    for day in days:
+        mask |= hours(day, start_hour, end_hour)
+    return mask
+
+
+def test_bare_hours_read_end_as_pm():
+    assert parse_availability("Mon-Fri 9-5") == every(range(5), 9, 17)
+
+
+def test_bare_hours_ending_at_noon_or_later():
+    assert parse_availability("Sat 12-5") == hours(5, 12, 17)
+    assert parse_availability("Sat 10-12") == hours(5, 10, 12)
+
+
+def test_twenty_four_hour_range_still_runs_overnight():
+    assert parse_availability("Mon 22:00-06:00") == hours(0, 22, 30)
+    assert parse_availability("Mon 22-6") == hours(0, 22, 30)
+
+
+def test_meridiem_on_either_side_is_taken_as_written():
+    assert parse_availability("Mon 9pm-5") == hours(0, 21, 29)
+    assert parse_availability("Mon 9-5pm") == hours(0, 9, 17)
+
+
+def test_day_range_wraps_past_sunday():
+    assert parse_availability("Fri-Mon") == every([4, 5, 6, 0], 0, 24)
+
+
+def test_nights_wrap_into_the_next_day_and_week():
+    # Sunday night runs into Monday morning
+    assert parse_availability("Nights, Sun-Thu") == every([6, 0, 1, 2, 3], 22, 30)
+
+
+def test_midnight_and_noon():
+    assert parse_availability("Tue 12am-12pm") == hours(1, 0, 12)
+    assert parse_availability("Tue 12pm-12am") == hours(1, 12, 24)
+
+
+def test_clauses_are_combined():
+    assert parse_availability("Mon, Wed 8am-2pm; Sat 10:00-16:00") == (
+        every([0, 2], 8, 14) | hours(5, 10, 16)
+    )
+
+
+@pytest.mark.parametrize("text", ["", "sometimes", "Mon 13am-2pm", "Mon 25:00-26:00"])
+def test_unreadable_text_raises(text):
+    with pytest.raises(AvailabilityParseError):
+        parse_availability(text)
+
+
+def test_window_mask_accepts_aware_times():
+    start = datetime(2024, 1, 2, 9, tzinfo=timezone.utc)
+    end = datetime(2024, 1, 2, 17, tzinfo=timezone.utc)
+    assert window_mask(start, end) == hours(1, 9, 17)
+    assert window_mask(start, end) & parse_availability("Mon-Fri 9-5") == window_mask(start, end)
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from starlette.requests import Request
+
+from app.api.conditional import CacheValidator
+
+VERSIONS = {"employees": (3, datetime(2024, 1, 2, 9, 0, 0, 250000))}
+
+
+def request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+        }
+    )
+
+
+def test_matching_etag_is_fresh():
+    validator = CacheValidator(VERSIONS)
+    assert validator.is_fresh(request(if_none_match=validator.etag))
+    assert validator.is_fresh(request(if_none_match=validator.etag.removeprefix("W/")))
+
+
+def test_write_in_the_same_second_changes_the_etag():
+    before = CacheValidator(VERSIONS)
+    after = CacheValidator({"employees": (4, datetime(2024, 1, 2, 9, 0, 0, 750000))})
+    assert before.headers["Last-Modified"] == after.headers["Last-Modified"]
+    assert not after.is_fresh(request(if_none_match=before.etag))
+
+
+def test_if_modified_since_alone_never_answers_304():
+    validator = CacheValidator(VERSIONS)
+    assert not validator.is_fresh(request(if_modified_since=validator.headers["Last-Modified"]))
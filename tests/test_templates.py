@@ -0,0 +1,62 @@
+from datetime import date, time
+from typing import Optional
+
+from app.db.models import ShiftTemplateDB
+from app.repositories.templates import week_number
+from app.services.templates import EVERY_DAY, template_duration_seconds, templates_overlap, weekdays_mask
+
+
+def template(
+    start_time: time,
+    end_time: time,
+    valid_from: date,
+    valid_until: Optional[date] = None,
+    weekdays: int = EVERY_DAY,
+    interval_weeks: int = 1,
+) -> ShiftTemplateDB:
+    return ShiftTemplateDB(
+        start_time=start_time,
+        end_time=end_time,
+        duration_seconds=template_duration_seconds(start_time, end_time),
+        weekdays=weekdays,
+        interval_weeks=interval_weeks,
+        anchor_week=week_number(valid_from),
+        valid_from=valid_from,
+        valid_until=valid_until,
+    )
+
+
+def test_overnight_last_occurrence_runs_into_next_template():
+    # Sunday 22:00-06:00 until Sunday 2024-01-07, then Monday 05:00-13:00
+    sunday_nights = template(
+        time(22), time(6), date(2024, 1, 1), date(2024, 1, 7), weekdays=weekdays_mask([6])
+    )
+    monday_mornings = template(time(5), time(13), date(2024, 1, 8), weekdays=weekdays_mask([0]))
+    assert templates_overlap(sunday_nights, monday_mornings)
+    assert templates_overlap(monday_mornings, sunday_nights)
+
+
+def test_overnight_template_ending_two_days_before_does_not_overlap():
+    sunday_nights = template(
+        time(22), time(6), date(2024, 1, 1), date(2024, 1, 6), weekdays=weekdays_mask([6])
+    )
+    monday_mornings = template(time(5), time(13), date(2024, 1, 8), weekdays=weekdays_mask([0]))
+    assert not templates_overlap(sunday_nights, monday_mornings)
+
+
+def test_day_template_ending_before_the_next_does_not_overlap():
+    first = template(time(9), time(17), date(2024, 1, 1), date(2024, 1, 7))
+    second = template(time(9), time(17), date(2024, 1, 8))
+    assert not templates_overlap(first, second)
+
+
+def test_same_hours_in_overlapping_ranges_overlap():
+    first = template(time(9), time(17), date(2024, 1, 1))
+    second = template(time(12), time(20), date(2024, 1, 3), weekdays=weekdays_mask([2]))
+    assert templates_overlap(first, second)
+
+
+def test_alternate_weeks_do_not_overlap():
+    even_weeks = template(time(9), time(17), date(2024, 1, 1), interval_weeks=2)
+    odd_weeks = template(time(9), time(17), date(2024, 1, 8), interval_weeks=2)
+    assert not templates_overlap(even_weeks, odd_weeks)